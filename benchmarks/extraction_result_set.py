@@ -0,0 +1,81 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the memory used by the extraction results of many documents, and of a confidence and page filter,
+as dataclasses (ExtractionAPI.get_result) and as an ExtractionResultSet.
+
+Usage:
+    python benchmarks/extraction_result_set.py [--documents 20] [--fields 50] [--extractions 20] [--spans 5]
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from extraction_results import make_payload
+from zdai.api.resultdecoder import decode_results
+from zdai.models import extraction_result_set
+from zdai.models.extraction_result_set import ExtractionResultSet
+
+
+def allocated(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    value = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument('--documents', type = int, default = 20)
+    parser.add_argument('--fields', type = int, default = 50)
+    parser.add_argument('--extractions', type = int, default = 20)
+    parser.add_argument('--spans', type = int, default = 5)
+    args = parser.parse_args()
+
+    contents = [json.loads(make_payload(args.fields, args.extractions, args.spans, seed = seed))
+                for seed in range(args.documents)]
+    for i, content in enumerate(contents):
+        content['file_id'] = f'file-{i}'
+
+    print(f'{args.documents} documents, {args.documents * args.fields * args.extractions * args.spans} spans, '
+          f'NumPy: {"yes" if extraction_result_set.numpy is not None else "no"}')
+
+    results, size, elapsed = allocated(lambda: [decode_results(content) for content in contents])
+    print(f'{"dataclasses":<16} {size / 1e6:8.1f} MB   built in {elapsed * 1000:8.1f} ms')
+
+    start = time.perf_counter()
+    matches = sum(1 for document in results for result in document for span in result.spans
+                  if span.confidence >= 0.8 and span.page_start <= 10 and span.page_end >= 1)
+    print(f'{"":<16} filter: {matches} spans in {(time.perf_counter() - start) * 1000:.1f} ms')
+    del results
+
+    result_set, size, elapsed = allocated(lambda: ExtractionResultSet.from_json(contents))
+    print(f'{"result set":<16} {size / 1e6:8.1f} MB   built in {elapsed * 1000:8.1f} ms   '
+          f'(arrays: {result_set.nbytes / 1e6:.1f} MB)')
+
+    start = time.perf_counter()
+    matches = len(result_set.where(min_confidence = 0.8, pages = (1, 10)))
+    print(f'{"":<16} filter: {matches} spans in {(time.perf_counter() - start) * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmark of the parsing of the extraction results (ExtractionAPI.get_result), on synthetic payloads.
+
+Compares the previous approach (json.loads, json.dumps, then json.loads into SimpleNamespaces) with the
+single-pass decoder, using the standard json module and orjson (when installed).
+
+Usage:
+    python benchmarks/extraction_results.py [--fields 50] [--extractions 20] [--spans 5] [--repeat 5]
+"""
+
+import argparse
+import json
+import random
+import time
+from types import SimpleNamespace
+
+from zdai.api import resultdecoder
+from zdai.api.resultdecoder import decode_answers, decode_results
+from zdai.models.field_extraction_result import BoundingBoxesByPage, FieldExtractionResult, \
+    FieldExtractionResultSpan
+
+
+def make_payload(fields: int, extractions: int, spans: int, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+
+    def bounds():
+        top, left = rng.randint(0, 9000), rng.randint(0, 6000)
+        return {'top': top, 'left': left, 'bottom': top + rng.randint(10, 200), 'right': left + rng.randint(10, 2000)}
+
+    def span():
+        page = rng.randint(1, 100)
+        start = rng.randint(0, 500000)
+        return {'start': start, 'end': start + rng.randint(10, 500), 'score': rng.random(),
+                'pages': {'start': page, 'end': page}, 'bounds': bounds(),
+                'bboxes': [{'page': page, 'bounds': [bounds() for _ in range(3)]}]}
+
+    results = [{'field_id': f'field-{f}',
+                'extractions': [{'text': ' '.join(rng.choice(('lorem', 'ipsum', 'dolor', 'sit')) for _ in range(12)),
+                                 'spans': [span() for _ in range(spans)],
+                                 'dates': [{'day': 1, 'month': 2, 'year': 2020}]}
+                                for _ in range(extractions)],
+                'answers': [{'option': 'Yes', 'value': 'yes'}]}
+               for f in range(fields)]
+
+    return json.dumps({'file_id': 'file', 'request_id': 'request', 'results': results}).encode('utf-8')
+
+
+def parse_with_namespaces(data: bytes):
+    """
+    The previous approach: the json is parsed, serialized again and parsed into SimpleNamespaces
+    """
+    namespaces = json.loads(json.dumps(json.loads(data)), object_hook = lambda d: SimpleNamespace(**d))
+
+    results = []
+    for result in namespaces.results:
+        for extraction in result.extractions:
+            extraction_result = FieldExtractionResult(field_id = result.field_id, text = extraction.text)
+            for span in extraction.spans:
+                extraction_span = FieldExtractionResultSpan(
+                    confidence = span.score, text_start = span.start, text_end = span.end,
+                    page_start = span.pages.start, page_end = span.pages.end, top = span.bounds.top,
+                    left = span.bounds.left, bottom = span.bounds.bottom, right = span.bounds.right)
+                for page in span.bboxes:
+                    extraction_span.bboxes.append(BoundingBoxesByPage(page))
+                extraction_result.spans.append(extraction_span)
+            results.append(extraction_result)
+
+    return results
+
+
+def parse_with_decoder(data: bytes):
+    content = resultdecoder.loads(data)
+    return decode_results(content), decode_answers(content)
+
+
+def measure(name: str, parse, data: bytes, repeat: int) -> None:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(data)
+        timings.append(time.perf_counter() - start)
+
+    print(f'{name:<32} best {min(timings) * 1000:9.1f} ms   mean {sum(timings) / len(timings) * 1000:9.1f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument('--fields', type = int, default = 50)
+    parser.add_argument('--extractions', type = int, default = 20)
+    parser.add_argument('--spans', type = int, default = 5)
+    parser.add_argument('--repeat', type = int, default = 5)
+    args = parser.parse_args()
+
+    data = make_payload(args.fields, args.extractions, args.spans)
+    print(f'{len(data) / 1e6:.1f} MB, {args.fields * args.extractions * args.spans} spans')
+
+    measure('namespaces (json)', parse_with_namespaces, data, args.repeat)
+
+    orjson = resultdecoder.orjson
+    resultdecoder.orjson = None
+    try:
+        measure('decoder (json)', parse_with_decoder, data, args.repeat)
+    finally:
+        resultdecoder.orjson = orjson
+
+    if orjson is not None:
+        measure('decoder (orjson)', parse_with_decoder, data, args.repeat)
+    else:
+        print('decoder (orjson)                 skipped: pip3 install orjson')
+
+
+if __name__ == '__main__':
+    main()
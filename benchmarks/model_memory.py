@@ -0,0 +1,119 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the memory used by the models of a result set of many documents (a File, a FieldExtractionRequest and
+its FieldExtractionResults per document), with the slotted models of zdai.models and with equivalent models that
+have a per-instance __dict__.
+
+Usage:
+    python benchmarks/model_memory.py [--documents 100000] [--fields 3] [--spans 2] [--boxes 2]
+"""
+
+import argparse
+import dataclasses
+import gc
+import time
+import tracemalloc
+from datetime import datetime
+from types import SimpleNamespace
+
+from zdai.models import File, FieldExtractionRequest
+from zdai.models.field_extraction_result import BoundingBox, BoundingBoxesByPage, FieldExtractionResult, \
+    FieldExtractionResultSpan
+
+
+def unslotted(cls):
+    """
+    Returns a dataclass with the fields of cls, and a per-instance __dict__
+    """
+    return dataclasses.make_dataclass(cls.__name__, [(f.name, f.type, dataclasses.field(default = f.default,
+                                                                                        default_factory = f.default_factory))
+                                                     for f in dataclasses.fields(cls)])
+
+
+class UnslottedRequest(object):
+    def __init__(self, api, json):
+        self._type = type(self)
+        self._api = api
+        self._json = json
+        self._result_content = None
+
+
+def new(cls, **values):
+    instance = cls.__new__(cls)
+    for name, value in values.items():
+        setattr(instance, name, value)
+    return instance
+
+
+def build(models: SimpleNamespace, documents: int, fields: int, spans: int, boxes: int) -> list:
+    expiration = datetime(2030, 1, 1)
+    corpus = []
+
+    for d in range(documents):
+        file = new(models.File, id = f'file-{d}', content_type = 'application/pdf', expiration = expiration,
+                   name = None, sha256 = None)
+        request = models.Request(None, {'request_id': f'request-{d}', 'file_id': file.id, 'status': 'complete'})
+
+        results = [new(models.Result, field_id = f'field-{f}', text = None, defined_term = None,
+                       durations_normalized = [], dates_normalized = [], currencies_normalized = [],
+                       spans = [new(models.Span, confidence = 0.5, text_start = s, text_end = s + 10, page_start = 1,
+                                    page_end = 1, top = 1, left = 2, bottom = 3, right = 4,
+                                    bboxes = [new(models.Page, page = 1,
+                                                  bounds = [new(models.Box, top = 1, left = 2, bottom = 3, right = 4)
+                                                            for _ in range(boxes)])])
+                                for s in range(spans)])
+                   for f in range(fields)]
+
+        corpus.append((file, request, results))
+
+    return corpus
+
+
+def measure(name: str, models: SimpleNamespace, args) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    corpus = build(models, args.documents, args.fields, args.spans, args.boxes)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del corpus
+
+    print(f'{name:<12} {size / 1e6:9.1f} MB   {size / args.documents:8.0f} B/document   built in {elapsed:6.2f} s')
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument('--documents', type = int, default = 100000)
+    parser.add_argument('--fields', type = int, default = 3)
+    parser.add_argument('--spans', type = int, default = 2)
+    parser.add_argument('--boxes', type = int, default = 2)
+    args = parser.parse_args()
+
+    print(f'{args.documents} documents, {args.fields} results, {args.spans} spans per result, '
+          f'{args.boxes} boxes per span')
+
+    measure('__dict__', SimpleNamespace(File = unslotted(File), Request = UnslottedRequest,
+                                        Result = unslotted(FieldExtractionResult),
+                                        Span = unslotted(FieldExtractionResultSpan),
+                                        Page = unslotted(BoundingBoxesByPage), Box = unslotted(BoundingBox)), args)
+    measure('slots', SimpleNamespace(File = File, Request = FieldExtractionRequest, Result = FieldExtractionResult,
+                                     Span = FieldExtractionResultSpan, Page = BoundingBoxesByPage, Box = BoundingBox),
+            args)
+
+
+if __name__ == '__main__':
+    main()
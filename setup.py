@@ -14,8 +14,13 @@ setup(
         'Operating System :: OS Independent',
         'Topic :: Software Development :: Libraries',
     ],
-    packages=['zdai', 'zdai.api', 'zdai.config', 'zdai.models'],
+    packages=['zdai', 'zdai.aio', 'zdai.api', 'zdai.cache', 'zdai.config', 'zdai.models'],
     install_requires=[
         'requests >= 2.31.0'
-    ]
+    ],
+    extras_require={
+        'async': ['aiohttp >= 3.9.0'],
+        'speedups': ['orjson >= 3.8.0', 'numpy >= 1.22'],
+        'streaming': ['ijson >= 3.1']
+    }
 )
@@ -0,0 +1,194 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import zdai as zdai
+from .aio import AsyncClassificationAPI, AsyncExtractionAPI, AsyncFieldAPI, AsyncFileAPI, AsyncLanguageAPI, \
+    AsyncMLCAPI, AsyncNormalizationAPI, AsyncOCRAPI, AsyncSession
+from .api.concurrency import ConcurrencyController
+from .api.exceptions import ApiNoAccessProvidedError
+from .api.ratelimiter import RateLimiter
+from .api.retry import RetryPolicy
+from .cache.normalizationcache import NormalizationCache
+from .cache.uploadcache import UploadCache
+
+
+class AsyncZDAISDK(object):
+    """
+    The asyncio counterpart of the ZDAISDK. Every API class method is awaitable and
+    returns the same models as the ZDAISDK.
+
+    Example:
+        async with AsyncZDAISDK(from_config = True) as sdk:
+            file, _ = await sdk.file.create(content = content)
+            requests, _ = await sdk.ocr.create(file_ids = [file.id])
+            await requests[0].update()
+
+    Requires aiohttp (pip3 install zdai[async]).
+    """
+
+    def __init__(self, url: str = None, token: str = None, from_config=False,
+                 session: AsyncSession = None,
+                 limit: int = 100,
+                 limit_per_host: int = 10,
+                 keep_alive: bool = True,
+                 keepalive_timeout: float = 15.0,
+                 retry_policy: RetryPolicy = None,
+                 rate_limiter: RateLimiter = None,
+                 concurrency_controller: ConcurrencyController = None,
+                 upload_cache: UploadCache = None,
+                 normalization_cache: NormalizationCache = None):
+        """
+        :param url: The url of the ZDAI region
+        :param token: The API token
+        :param from_config: Whether to load the url and token from config/access.json
+        :param session: An AsyncSession to share across the API classes. If not provided,
+                        one is created using the connection options below.
+        :param limit: The maximum number of simultaneous connections.
+        :param limit_per_host: The maximum number of simultaneous connections per host.
+        :param keep_alive: Whether connections are kept alive between calls.
+        :param keepalive_timeout: The number of seconds an idle connection is kept alive.
+        :param retry_policy: The RetryPolicy used to retry failed calls. Calls are not retried if not provided.
+        :param rate_limiter: The RateLimiter that paces the calls of every API class. Calls are not paced if not provided.
+        :param concurrency_controller: The ConcurrencyController that adapts the number of calls in flight.
+        :param upload_cache: The UploadCache used to reuse files whose content was already uploaded.
+        :param normalization_cache: The NormalizationCache used to reuse the normalizations of texts.
+        """
+        self.url = url
+        self.token = token
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.concurrency_controller = concurrency_controller
+        self.upload_cache = upload_cache
+        self.normalization_cache = normalization_cache
+
+        if from_config:
+            self.url, self.token = zdai.config.get_access()
+
+        if not self.has_access():
+            raise ApiNoAccessProvidedError(url = self.url, token = self.token)
+
+        self._owns_session = session is None
+        self._session = session if session is not None else AsyncSession(limit = limit,
+                                                                         limit_per_host = limit_per_host,
+                                                                         keep_alive = keep_alive,
+                                                                         keepalive_timeout = keepalive_timeout)
+        self._load_apis()
+
+    def _load_apis(self):
+        options = self._call_options()
+
+        self._file_api = AsyncFileAPI(url = self.url, token = self.token, upload_cache = self.upload_cache, **options)
+        self._classification_api = AsyncClassificationAPI(url = self.url, token = self.token, **options)
+        self._language_api = AsyncLanguageAPI(url = self.url, token = self.token, **options)
+        self._extraction_api = AsyncExtractionAPI(url = self.url, token = self.token, **options)
+        self._field_api = AsyncFieldAPI(url = self.url, token = self.token, **options)
+        self._ocr_api = AsyncOCRAPI(url = self.url, token = self.token, **options)
+        self._mlc_api = AsyncMLCAPI(url = self.url, token = self.token, **options)
+        self._normalization_api = AsyncNormalizationAPI(url = self.url, token = self.token, cache = self.normalization_cache, **options)
+
+    def _call_options(self) -> dict:
+        """
+        Returns the options that every API class passes on to its AsyncApiCalls
+        """
+        return {'session': self._session,
+                'retry_policy': self.retry_policy,
+                'rate_limiter': self.rate_limiter,
+                'concurrency_controller': self.concurrency_controller}
+
+    def has_access(self):
+        return all(f is not None for f in [self.url, self.token])
+
+    async def close(self):
+        """
+        Closes the pooled connections, if the session was created by the SDK
+        """
+        if self._owns_session:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def session(self) -> AsyncSession:
+        """
+        Returns the AsyncSession shared by every API class
+        """
+        return self._session
+
+    @property
+    def file(self) -> AsyncFileAPI:
+        """
+        Returns the AsyncFileAPI instance
+        """
+        return self._file_api
+
+    @property
+    def classification(self) -> AsyncClassificationAPI:
+        """
+        Returns the AsyncClassificationAPI instance
+        """
+        return self._classification_api
+
+    @property
+    def language(self) -> AsyncLanguageAPI:
+        """
+        Returns the AsyncLanguageAPI instance
+        """
+        return self._language_api
+
+    @property
+    def extraction(self) -> AsyncExtractionAPI:
+        """
+        Returns the AsyncExtractionAPI instance
+        """
+        return self._extraction_api
+
+    @property
+    def fields(self) -> AsyncFieldAPI:
+        """
+        Returns the AsyncFieldAPI instance
+        """
+        return self._field_api
+
+    @property
+    def ocr(self) -> AsyncOCRAPI:
+        """
+        Returns the AsyncOCRAPI instance
+        """
+        return self._ocr_api
+
+    @property
+    def mlc(self) -> AsyncMLCAPI:
+        """
+        Returns the AsyncMLCAPI instance
+        """
+        return self._mlc_api
+
+    @property
+    def normalization(self) -> AsyncNormalizationAPI:
+        """
+        Returns the AsyncNormalizationAPI instance
+        """
+        return self._normalization_api
+
+    @property
+    def config(self):
+        """
+        Returns the config
+        """
+        return zdai.config
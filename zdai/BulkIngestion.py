@@ -0,0 +1,244 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import fnmatch
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, TextIO
+
+from .DocumentPipeline import DocumentPipeline
+from .ZDAISDK import ZDAISDK
+from .models.file import File
+from .models.pipeline_result import PipelineResult
+
+_EXPIRATION_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+class BulkIngestion(object):
+    """
+    BulkIngestion uploads many files (and optionally sends them for OCR, classification, MLC and extraction)
+    through a DocumentPipeline, and writes what happened to each of them to a JSONL manifest:
+
+        {"event": "uploaded", "path": ..., "file_id": ..., "expiration": ..., "size": ...}
+        {"event": "complete", "path": ..., "file_id": ..., "ocr_request_id": ..., "extraction_request_id": ...}
+        {"event": "failed", "path": ..., "file_id": ..., "stage": ..., "error": ...}
+
+    The manifest is also the checkpoint: when ingesting into an existing manifest, the files that completed are
+    skipped and the files that were uploaded (and haven't expired) aren't uploaded again.
+
+    Example:
+        ingestion = BulkIngestion(sdk, manifest = 'archive.jsonl', field_ids = field_ids)
+        ingestion.run(BulkIngestion.find_files('archive/', pattern = '*.pdf'))
+    """
+
+    def __init__(self, sdk: ZDAISDK, manifest: str, field_ids: List[str] = None, ocr: bool = False,
+                 classification: bool = False, mlc: bool = False, workers: Dict[str, int] = None,
+                 expiration: str = None, expiration_margin: timedelta = timedelta(hours = 1),
+                 report: TextIO = sys.stderr, report_interval: float = 5.0):
+        """
+        :param sdk: The ZDAISDK used to upload and process the files
+        :param manifest: The JSONL manifest (and checkpoint) file, appended to
+        :param field_ids: The field ids to extract. If not provided, the files aren't sent for extraction.
+        :param ocr: Whether to OCR the files
+        :param classification: Whether to classify the files
+        :param mlc: Whether to obtain the files' multi-level classification
+        :param workers: The number of workers of each stage, see DocumentPipeline
+        :param expiration: The expiration of the uploaded files, see FileAPI.create
+        :param expiration_margin: Uploaded files that expire sooner than this are uploaded again when resuming
+        :param report: Where the throughput is reported (None to disable)
+        :param report_interval: The number of seconds between two throughput reports
+        """
+        self.manifest = manifest
+        self.expiration_margin = expiration_margin
+        self.report = report
+        self.report_interval = report_interval
+        self._lock = threading.Lock()
+        self._sizes = {}
+        self._resumed = set()
+        self._pipeline = DocumentPipeline(sdk,
+                                          field_ids = field_ids,
+                                          ocr = ocr,
+                                          classification = classification,
+                                          mlc = mlc,
+                                          fetch_results = False,
+                                          workers = workers,
+                                          expiration = expiration,
+                                          on_stage_complete = self._on_stage_complete)
+
+    @staticmethod
+    def find_files(root: str, pattern: str = None) -> Iterator[str]:
+        """
+        Yields the files of the directory tree, in a stable order, optionally filtered with a glob pattern
+        matched against the file names (e.g. *.pdf)
+        """
+        for directory, directories, files in os.walk(root):
+            directories.sort()
+
+            for name in sorted(files):
+                if pattern is None or fnmatch.fnmatch(name, pattern):
+                    yield os.path.join(directory, name)
+
+    @staticmethod
+    def read_paths(path: str) -> Iterator[str]:
+        """
+        Yields the paths listed in a text file, one per line. Blank lines and lines starting with # are skipped.
+        """
+        with open(path, encoding = 'utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    yield line
+
+    def load_checkpoint(self) -> Dict[str, dict]:
+        """
+        Returns the latest manifest entry of every path in the manifest, if it exists
+        """
+        entries = {}
+
+        if not os.path.exists(self.manifest):
+            return entries
+
+        with open(self.manifest, encoding = 'utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A line cut short by an interruption
+                    continue
+
+                entries[entry.get('path')] = entry
+
+        return entries
+
+    def run(self, paths: Iterable[str]) -> Dict[str, int]:
+        """
+        Ingests the files, and returns the number of files that completed, failed and were skipped
+        (because they had completed in a previous run)
+
+        :param paths: The paths of the files to ingest
+        :return:
+        """
+        checkpoint = self.load_checkpoint()
+        counts = {'complete': 0, 'failed': 0, 'skipped': 0}
+        self._started = time.monotonic()
+        self._uploaded_bytes = 0
+        self._reported = self._started
+
+        with open(self.manifest, 'a', encoding = 'utf-8') as self._output:
+            for result in self._pipeline.run(self._documents(paths, checkpoint, counts)):
+                path = result.document
+
+                if result.is_successful():
+                    self._count(counts, 'complete')
+                    self._write(event = 'complete',
+                                path = path,
+                                file_id = result.file.id,
+                                ocr_request_id = result.ocr.id if result.ocr else None,
+                                classification_request_id = result.classification.id if result.classification else None,
+                                mlc_request_id = result.mlc.id if result.mlc else None,
+                                extraction_request_id = result.extraction.id if result.extraction else None)
+                else:
+                    self._count(counts, 'failed')
+                    self._write(event = 'failed',
+                                path = path,
+                                file_id = result.file.id if result.file else None,
+                                content_type = result.file.content_type if result.file else None,
+                                expiration = result.file.expiration.strftime(_EXPIRATION_FORMAT) if result.file else None,
+                                stage = result.failed_stage,
+                                error = str(result.error))
+
+                self._report(counts)
+
+        self._report(counts, final = True)
+        return counts
+
+    def _documents(self, paths: Iterable[str], checkpoint: Dict[str, dict], counts: Dict[str, int]) -> Iterator:
+        renew_before = datetime.utcnow() + self.expiration_margin
+
+        for path in paths:
+            entry = checkpoint.get(path, {})
+
+            if entry.get('event') == 'complete':
+                self._count(counts, 'skipped')
+                continue
+
+            try:
+                self._sizes[path] = os.path.getsize(path)
+            except OSError as error:
+                # Missing or unreadable: record it and keep going with the rest
+                self._count(counts, 'failed')
+                self._write(event = 'failed', path = path, stage = 'upload', error = str(error))
+                self._report(counts)
+                continue
+
+            expiration = entry.get('expiration')
+            if entry.get('file_id') and expiration and \
+                    datetime.strptime(expiration, _EXPIRATION_FORMAT) > renew_before:
+                # Uploaded by a previous run: resume after the upload
+                self._resumed.add(path)
+                yield PipelineResult(document = path,
+                                     file = File(id = entry['file_id'],
+                                                 content_type = entry.get('content_type'),
+                                                 expiration = datetime.strptime(expiration, _EXPIRATION_FORMAT)))
+            else:
+                yield path
+
+    def _on_stage_complete(self, stage: str, result: PipelineResult) -> None:
+        if stage != 'upload' or result.document in self._resumed:
+            return
+
+        with self._lock:
+            self._uploaded_bytes += self._sizes.get(result.document, 0)
+
+        self._write(event = 'uploaded',
+                    path = result.document,
+                    file_id = result.file.id,
+                    content_type = result.file.content_type,
+                    expiration = result.file.expiration.strftime(_EXPIRATION_FORMAT),
+                    size = self._sizes.get(result.document))
+
+    def _write(self, **entry) -> None:
+        line = json.dumps(entry) + '\n'
+
+        with self._lock:
+            self._output.write(line)
+            self._output.flush()
+
+    def _count(self, counts: Dict[str, int], key: str) -> None:
+        # The counts are updated by the pipeline's feed thread (skipped and unreadable files) and by run()
+        with self._lock:
+            counts[key] += 1
+
+    def _report(self, counts: Dict[str, int], final: bool = False) -> None:
+        with self._lock:
+            now = time.monotonic()
+
+            if self.report is None or (not final and now - self._reported < self.report_interval):
+                return
+
+            self._reported = now
+            counts = dict(counts)
+            elapsed = max(now - self._started, 1e-9)
+            megabytes = self._uploaded_bytes / (1024 * 1024)
+
+        done = counts['complete'] + counts['failed']
+
+        print(f'{done} files ({counts["complete"]} complete, {counts["failed"]} failed, {counts["skipped"]} skipped) '
+              f'in {elapsed:.1f}s: {done / elapsed:.2f} docs/s, '
+              f'{megabytes:.1f} MB uploaded, {megabytes / elapsed:.2f} MB/s',
+              file = self.report, flush = True)
@@ -0,0 +1,148 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+from dataclasses import asdict
+from typing import Dict, Iterable, List, Tuple, Union
+
+from .ZDAISDK import ZDAISDK
+from .api.extractionapi import ExtractionAPI
+from .cache.extractioncache import ExtractionCache
+from .models.field_extraction_answer import FieldExtractionAnswer
+from .models.field_extraction_result import FieldExtractionResult
+from .models.file import File
+
+
+class CachedExtractor(object):
+    """
+    CachedExtractor obtains the extraction results (and answers) of files through an ExtractionCache: only the
+    field ids that aren't cached for a file's content are sent for extraction, and the rest are merged from the
+    cache. Files are identified by the SHA-256 of their content (File.sha256, set when an UploadCache is used),
+    so the results are reused across uploads of the same content.
+
+    With versioned set, the cached results of a field are tied to a digest of its metadata (e.g. the documents
+    it was trained on), so that retrained custom fields are extracted again.
+
+    Example:
+        sdk = ZDAISDK(from_config = True, upload_cache = UploadCache('uploads.sqlite'))
+        extractor = CachedExtractor(sdk, ExtractionCache('extractions.sqlite'))
+
+        file, _ = sdk.file.create(content = Path('contract.pdf'))
+        results, answers = extractor.extract(file, field_ids = ['A', 'B', 'C'])
+    """
+
+    def __init__(self, sdk: ZDAISDK, cache: ExtractionCache, versioned: bool = False):
+        """
+        :param sdk: The ZDAISDK used to extract the fields that aren't cached
+        :param cache: The ExtractionCache
+        :param versioned: Whether cached results are tied to the version of their field's metadata
+        """
+        self._sdk = sdk
+        self.cache = cache
+        self.versioned = versioned
+        self._versions: Dict[str, str] = {}
+
+    def sdk(self) -> ZDAISDK:
+        """
+        An instance of the ZDAISDK that was passed through the CachedExtractor constructor
+        Returns as a method
+        """
+        return self._sdk
+
+    def extract(self, file: File, field_ids: List[str]) -> Tuple[List[FieldExtractionResult], List[FieldExtractionAnswer]]:
+        """
+        Returns the extraction results and answers of the file, for the field ids
+
+        :param file: The file, whose sha256 must be set
+        :param field_ids: The field ids
+        :return:
+        """
+        extracted = self.extract_many([file], field_ids)[file.id]
+
+        if isinstance(extracted, Exception):
+            raise extracted
+
+        return extracted
+
+    def extract_many(self, files: Iterable[File], field_ids: List[str]) -> Dict[str, Union[Tuple[List[FieldExtractionResult], List[FieldExtractionAnswer]], Exception]]:
+        """
+        Returns the extraction results and answers of each of the files (by file id), for the field ids.
+        The files missing the same field ids are sent in a single extraction call.
+
+        A file whose extraction failed (e.g. ApiRequestFailedError) is mapped to the error instead, and the
+        other files are still returned.
+
+        :param files: The files, whose sha256 must be set
+        :param field_ids: The field ids
+        :return:
+        """
+        files = list(files)
+        versions = self.get_versions(field_ids) if self.versioned else None
+        entries: Dict[str, Dict[str, dict]] = {}
+        missing: Dict[Tuple[str, ...], List[File]] = {}
+
+        for file in files:
+            if file.sha256 is None:
+                raise ValueError(f'The SHA-256 of file {file.id} is unknown: upload it with an UploadCache, '
+                                 f'or set its sha256')
+
+            entries[file.id] = self.cache.get(file.sha256, field_ids, versions)
+
+            missing_field_ids = tuple(f for f in field_ids if f not in entries[file.id])
+            if missing_field_ids:
+                missing.setdefault(missing_field_ids, []).append(file)
+
+        extraction = self.sdk().extraction
+        pending = []
+
+        for missing_field_ids, group in missing.items():
+            requests, _ = extraction.create(file_ids = [f.id for f in group], field_ids = list(missing_field_ids))
+
+            for file, request in zip(group, requests):
+                future = extraction.poller.submit(request, resolve = lambda r: r.api().get_result_content(r.id)[0])
+                pending.append((file, future))
+
+        extracted = {}
+
+        for file, future in pending:
+            try:
+                results = future.result().get('results') or []
+            except Exception as e:
+                extracted[file.id] = e
+                continue
+
+            self.cache.put(file.sha256, results, versions)
+            entries[file.id].update((entry['field_id'], entry) for entry in results)
+
+        for file in files:
+            if file.id in extracted:
+                continue
+
+            content = {'results': [entries[file.id][f] for f in field_ids if f in entries[file.id]]}
+            extracted[file.id] = ExtractionAPI._parse_results(content), ExtractionAPI._parse_answers(content)
+
+        return extracted
+
+    def get_versions(self, field_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Returns the version of each field id: a digest of its metadata, obtained once per CachedExtractor
+        """
+        for field_id in field_ids:
+            if field_id not in self._versions:
+                metadata, _ = self.sdk().fields.get_metadata(field_id = field_id)
+                content = json.dumps(asdict(metadata), sort_keys = True, default = str)
+                self._versions[field_id] = hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+        return {field_id: self._versions[field_id] for field_id in field_ids}
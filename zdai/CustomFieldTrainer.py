@@ -1,5 +1,4 @@
 from zdai import ZDAISDK
-import time
 import json
 
 
@@ -83,15 +82,9 @@ class CustomFieldTrainer(object):
         """
         json_annotation = json.dumps(self.annotations)
         request, _ = self.sdk().fields.train(field_id = self.field_id, annotations = json_annotation)
+        request.wait()
 
-        while True:
-            latest = request.update()
-            print(f'{latest.get("request_id")} is {latest.get("status")}')
-
-            if request.is_finished():
-                break
-
-            time.sleep(2)
+        print(f'{request.id} is {request.status}')
 
     def get_accuracy(self):
         """
@@ -0,0 +1,266 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List
+
+from .ZDAISDK import ZDAISDK
+from .models.pipeline_result import PipelineResult
+
+# Marks the end of the documents in a stage's queue
+_END = object()
+
+
+class DocumentPipeline(object):
+    """
+    DocumentPipeline runs a stream of documents through upload, then (optionally) OCR, classification and MLC,
+    then extraction of the field ids (if any) and finally the retrieval of the extraction results (and answers).
+
+    Every stage has its own pool of workers, and the stages are connected by bounded queues: when a stage falls
+    behind, its queue fills up and the stages upstream wait, rather than piling up documents (or uploads) that
+    can't be processed yet. The requests are polled by the SDK's shared RequestPoller, in batches.
+
+    A document that fails at any stage is reported with the error and the stage, and skips the stages that follow.
+
+    If the SDK has an ExpirationKeeper, the files are released once their document is through the pipeline.
+
+    Example:
+        pipeline = DocumentPipeline(sdk, field_ids = field_ids, classification = True,
+                                    workers = {'upload': 8, 'extraction': 32})
+
+        for result in pipeline.run(glob.iglob('contracts/*.pdf')):
+            if result.is_successful():
+                print(result.document, result.classification.classification, len(result.results))
+            else:
+                print(result.document, result.failed_stage, result.error)
+    """
+
+    # The stages, in order, and their default number of workers
+    stages = {
+        'upload': 4,
+        'ocr': 16,
+        'classification': 16,
+        'mlc': 16,
+        'extraction': 16,
+        'results': 4,
+    }
+
+    def __init__(self, sdk: ZDAISDK, field_ids: List[str] = None, ocr: bool = False, classification: bool = False,
+                 mlc: bool = False, answers: bool = False, fetch_results: bool = True, workers: Dict[str, int] = None,
+                 queue_size: int = 16, is_zuva_ocr: bool = False, expiration: str = None,
+                 on_stage_complete: Callable[[str, PipelineResult], None] = None):
+        """
+        :param sdk: The ZDAISDK used by every stage
+        :param field_ids: The field ids to extract. If not provided, the documents aren't sent for extraction.
+        :param ocr: Whether to OCR the documents
+        :param classification: Whether to classify the documents
+        :param mlc: Whether to obtain the documents' multi-level classification
+        :param answers: Whether to obtain the extraction answers, along with the results
+        :param fetch_results: Whether to obtain the extraction results once the extraction requests complete
+        :param workers: The number of workers of each stage (see DocumentPipeline.stages), e.g. {'upload': 8}.
+                        The workers of the ocr, classification, mlc and extraction stages wait for requests,
+                        so they can be numerous: the requests are polled in batches.
+        :param queue_size: The maximum number of documents waiting between two stages
+        :param is_zuva_ocr: Passed through to FileAPI.create
+        :param expiration: Passed through to FileAPI.create
+        :param on_stage_complete: Called (from the stage's worker) with the stage and the PipelineResult, each time
+                                  a document completes a stage successfully, e.g. to checkpoint the uploads
+        """
+        unknown = set(workers or {}) - set(self.stages)
+        if unknown:
+            raise ValueError(f'Unknown stages: {", ".join(sorted(unknown))}')
+
+        self._sdk = sdk
+        self.field_ids = field_ids
+        self.answers = answers
+        self.queue_size = queue_size
+        self.is_zuva_ocr = is_zuva_ocr
+        self.expiration = expiration
+        self.workers = {**self.stages, **(workers or {})}
+        self.on_stage_complete = on_stage_complete
+
+        enabled = {
+            'ocr': ocr,
+            'classification': classification,
+            'mlc': mlc,
+            'extraction': bool(field_ids),
+            'results': bool(field_ids) and fetch_results,
+        }
+        self.enabled_stages = [stage for stage in self.stages if enabled.get(stage, True)]
+
+    def sdk(self) -> ZDAISDK:
+        """
+        An instance of the ZDAISDK that was passed through the DocumentPipeline constructor
+        Returns as a method
+        """
+        return self._sdk
+
+    def run(self, documents: Iterable) -> Iterator[PipelineResult]:
+        """
+        Runs the documents through the pipeline, and yields their PipelineResult as they complete (which is not
+        necessarily the order of the documents). The documents are read from the iterable as the first stage
+        has room for them.
+
+        :param documents: Anything that FileAPI.create accepts (paths, bytes, binary file objects, ...), or
+                          PipelineResults whose file is already set, which aren't uploaded again.
+                          Strings are file paths (e.g. from glob.iglob).
+        :return:
+        """
+        stop = threading.Event()
+        errors = []
+        queues = [queue.Queue(maxsize = self.queue_size) for _ in range(len(self.enabled_stages) + 1)]
+        threads = [threading.Thread(target = self._feed, args = (documents, queues[0], stop, errors),
+                                    name = 'zdai-pipeline-feed', daemon = True)]
+
+        for i, stage in enumerate(self.enabled_stages):
+            remaining = [self.workers[stage]]
+            lock = threading.Lock()
+
+            for n in range(self.workers[stage]):
+                threads.append(threading.Thread(target = self._work,
+                                                 args = (stage, queues[i], queues[i + 1], stop, remaining, lock),
+                                                 name = f'zdai-pipeline-{stage}-{n}', daemon = True))
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = queues[-1].get()
+                if item is _END:
+                    if errors:
+                        raise errors[0]
+                    return
+
+                self._release(item)
+                yield item
+        finally:
+            # Stops the workers if the caller stops iterating early.
+            stop.set()
+
+    def _feed(self, documents: Iterable, output: queue.Queue, stop: threading.Event, errors: List[Exception]) -> None:
+        try:
+            for document in documents:
+                item = document if isinstance(document, PipelineResult) else PipelineResult(document = document)
+
+                if not self._put(output, item, stop):
+                    return
+        except Exception as e:
+            # Raised by run(), once the documents read so far are through the pipeline.
+            errors.append(e)
+        finally:
+            self._put(output, _END, stop)
+
+    def _work(self, stage: str, input: queue.Queue, output: queue.Queue, stop: threading.Event,
+              remaining: List[int], lock: threading.Lock) -> None:
+        process = getattr(self, f'_{stage}')
+
+        while True:
+            item = self._get(input, stop)
+
+            if item is None:
+                return
+
+            if item is _END:
+                # Lets the stage's other workers see the end too; the last one passes it downstream.
+                input.put(item)
+
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+
+                if last:
+                    self._put(output, _END, stop)
+                return
+
+            if item.is_successful():
+                start = time.monotonic()
+
+                try:
+                    process(item)
+                    item.timings[stage] = time.monotonic() - start
+
+                    if self.on_stage_complete is not None:
+                        self.on_stage_complete(stage, item)
+                except Exception as e:
+                    item.timings[stage] = time.monotonic() - start
+                    item.error = e
+                    item.failed_stage = stage
+
+            if not self._put(output, item, stop):
+                return
+
+    @staticmethod
+    def _get(input: queue.Queue, stop: threading.Event):
+        while not stop.is_set():
+            try:
+                return input.get(timeout = 0.1)
+            except queue.Empty:
+                pass
+
+        return None
+
+    @staticmethod
+    def _put(output: queue.Queue, item, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                output.put(item, timeout = 0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def _release(self, item: PipelineResult) -> None:
+        # The document is through the pipeline, so its file no longer needs renewing.
+        keeper = self.sdk().expiration_keeper
+        if keeper is not None and item.file is not None:
+            keeper.release(item.file.id)
+
+    def _upload(self, item: PipelineResult) -> None:
+        if item.file is not None:
+            # Files uploaded beforehand are tracked too, so they don't expire while in the pipeline.
+            keeper = self.sdk().expiration_keeper
+            if keeper is not None and item.file.expiration is not None:
+                keeper.track(item.file)
+            return
+
+        item.file, _ = self.sdk().file.create(content = item.document, is_zuva_ocr = self.is_zuva_ocr,
+                                               expiration = self.expiration)
+
+    @staticmethod
+    def _wait(submit: Callable, **kwargs):
+        futures, _ = submit(**kwargs)
+        return futures[0].result()
+
+    def _ocr(self, item: PipelineResult) -> None:
+        item.ocr = self._wait(self.sdk().ocr.submit, file_ids = [item.file.id])
+
+    def _classification(self, item: PipelineResult) -> None:
+        item.classification = self._wait(self.sdk().classification.submit, file_ids = [item.file.id])
+
+    def _mlc(self, item: PipelineResult) -> None:
+        item.mlc = self._wait(self.sdk().mlc.submit, file_ids = [item.file.id])
+
+    def _extraction(self, item: PipelineResult) -> None:
+        item.extraction = self._wait(self.sdk().extraction.submit, file_ids = [item.file.id],
+                                     field_ids = self.field_ids)
+
+    def _results(self, item: PipelineResult) -> None:
+        if self.answers:
+            item.results, item.answers = item.extraction.get_results_and_answers()
+        else:
+            item.results = item.extraction.get_results()
@@ -0,0 +1,200 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Union
+
+from .models.file import File, FileExpiration
+
+
+class ExpirationKeeper(object):
+    """
+    ExpirationKeeper keeps track of the files created through a FileAPI (see ZDAISDK's expiration_keeper) and their
+    expiration, so that long-running jobs don't lose their files:
+        - renew() extends, in parallel, the expiration of the files that still have pending work and expire soon.
+          A background thread can do so periodically (see start).
+        - release() marks a file's work as done: it is no longer renewed, and delete_finished() deletes it.
+
+    Example:
+        keeper = ExpirationKeeper(renew_before = timedelta(days = 2), extension = '7d')
+        sdk = ZDAISDK(from_config = True, expiration_keeper = keeper)
+        keeper.start()
+
+        file, _ = sdk.file.create(content = Path('contract.pdf'))    # Tracked, and renewed until released
+        ...
+        keeper.release(file.id)
+        keeper.delete_finished()
+    """
+
+    def __init__(self, api = None, renew_before: timedelta = timedelta(days = 1), extension: str = '13d',
+                 interval: float = 900.0, max_workers: int = 8):
+        """
+        :param api: The FileAPI used to renew and delete the files. Set by the FileAPI the keeper is given to.
+        :param renew_before: Files with pending work are renewed when they expire within this delay
+        :param extension: The expiration set when renewing, see FileAPI.set_expiration (at most 13d)
+        :param interval: The number of seconds between two renewals of the background thread
+        :param max_workers: The number of calls sent at once when renewing or deleting files
+        """
+        self.api = api
+        self.renew_before = renew_before
+        self.extension = extension
+        self.interval = interval
+        self.max_workers = max_workers
+        self.errors: Dict[str, Exception] = {}
+        self._expirations: Dict[str, datetime] = {}
+        self._released = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def bind(self, api) -> None:
+        """
+        Sets the FileAPI used to renew and delete the files, unless one is set already
+        """
+        if self.api is None:
+            self.api = api
+
+    def track(self, file: Union[File, FileExpiration]) -> None:
+        """
+        Starts tracking the file (or updates its expiration). Its work is considered pending until released.
+        """
+        with self._lock:
+            self._expirations[file.id] = file.expiration
+            self._released.discard(file.id)
+
+    def update(self, file_id: str, expiration: datetime) -> None:
+        """
+        Updates the expiration of a tracked file, e.g. after FileAPI.set_expiration
+        """
+        with self._lock:
+            if file_id in self._expirations:
+                self._expirations[file_id] = expiration
+
+    def release(self, *file_ids: str) -> None:
+        """
+        Marks the work on the files as done: they are no longer renewed, and are deleted by delete_finished()
+        """
+        with self._lock:
+            self._released.update(f for f in file_ids if f in self._expirations)
+
+    def forget(self, file_id: str) -> None:
+        """
+        Stops tracking the file, e.g. after FileAPI.delete
+        """
+        with self._lock:
+            self._expirations.pop(file_id, None)
+            self._released.discard(file_id)
+
+    @property
+    def pending(self) -> Dict[str, datetime]:
+        """
+        Returns the expiration of the tracked files whose work is pending
+        """
+        with self._lock:
+            return {f: e for f, e in self._expirations.items() if f not in self._released}
+
+    @property
+    def finished(self) -> List[str]:
+        """
+        Returns the ids of the tracked files whose work is done
+        """
+        with self._lock:
+            return list(self._released)
+
+    def due(self, now: datetime = None) -> List[str]:
+        """
+        Returns the ids of the files with pending work that expire within renew_before
+        """
+        limit = (now or datetime.utcnow()) + self.renew_before
+        return [file_id for file_id, expiration in self.pending.items() if expiration <= limit]
+
+    def renew(self, now: datetime = None) -> Dict[str, FileExpiration]:
+        """
+        Extends the expiration of the files that are due (see due), in parallel, and returns their new expiration.
+        The files that couldn't be renewed are in `errors`.
+        """
+        renewed = self._run(lambda file_id: self.api.set_expiration(file_id = file_id, expiration = self.extension)[0],
+                            self.due(now))
+
+        for file_id, expiration in renewed.items():
+            self.update(file_id, expiration.expiration)
+
+        return renewed
+
+    def delete_finished(self, file_ids: Iterable[str] = None) -> Dict[str, bool]:
+        """
+        Deletes the files whose work is done (or only those of file_ids), in parallel, and stops tracking them.
+        The files that couldn't be deleted are in `errors`.
+        """
+        finished = set(self.finished)
+        file_ids = [f for f in (file_ids if file_ids is not None else finished) if f in finished]
+
+        deleted = self._run(lambda file_id: self.api.delete(file_id = file_id)[0], file_ids)
+
+        for file_id in deleted:
+            self.forget(file_id)
+
+        return deleted
+
+    def _run(self, call: Callable[[str], object], file_ids: List[str]) -> dict:
+        results = {}
+
+        def run(file_id: str) -> None:
+            try:
+                results[file_id] = call(file_id)
+                self.errors.pop(file_id, None)
+            except Exception as e:
+                self.errors[file_id] = e
+
+        if len(file_ids) <= 1 or self.max_workers <= 1:
+            for file_id in file_ids:
+                run(file_id)
+        else:
+            with ThreadPoolExecutor(max_workers = min(self.max_workers, len(file_ids))) as executor:
+                list(executor.map(run, file_ids))
+
+        return results
+
+    def start(self) -> None:
+        """
+        Starts a background thread renewing the files every interval seconds
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._stop.clear()
+            self._thread = threading.Thread(target = self._run_periodically, name = 'zdai-expiration-keeper',
+                                            daemon = True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the background thread
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def _run_periodically(self) -> None:
+        while True:
+            self.renew()
+
+            if self._stop.wait(timeout = self.interval):
+                return
@@ -0,0 +1,274 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import bisect
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from difflib import SequenceMatcher
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .api.fieldapi import FieldAPI
+from .models.field import Field
+from .models.field_training import FieldAccuracy, FieldMetadata
+
+
+def normalize_name(name: str) -> str:
+    """
+    Returns the form of a field name used to look it up: case-folded, with punctuation removed
+    and whitespace collapsed (e.g. 'Governing  Law (Jurisdiction)' -> 'governing law jurisdiction')
+    """
+    return ' '.join(re.sub(r'[^\w\s]', ' ', name.casefold()).split())
+
+
+class FieldCatalog(object):
+    """
+    FieldCatalog keeps the list of fields in memory, and indexes it by id, name and normalized name, so that
+    resolving field names to ids doesn't download and scan the list each time.
+
+    The list is refreshed once it is older than the ttl, using a conditional request (If-None-Match) so that an
+    unchanged list isn't downloaded again when the server supports it. The fields' metadata and accuracy can be
+    prefetched in bulk, and are cached for the same ttl.
+
+    Example:
+        catalog = FieldCatalog(sdk.fields, ttl = 600)
+
+        field_ids = [field.id for field in catalog.resolve_many(['Governing Law', 'title', 'Parties']).values()]
+        catalog.search('assignmnt')        # Fields named or described like 'assignment'
+        catalog.prefetch_metadata(field_ids)
+    """
+
+    def __init__(self, api: FieldAPI, ttl: float = 300.0, max_workers: int = 8):
+        """
+        :param api: The FieldAPI (e.g. sdk.fields)
+        :param ttl: The number of seconds the fields (and their metadata and accuracy) are kept before being
+                    refreshed
+        :param max_workers: The number of calls sent at once when prefetching metadata or accuracy
+        """
+        self.api = api
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self._lock = threading.RLock()
+        self._etag = None
+        self._refreshed = None
+        self._fields: List[Field] = []
+        self._by_id: Dict[str, Field] = {}
+        self._by_name: Dict[str, List[Field]] = {}
+        self._by_normalized_name: Dict[str, List[Field]] = {}
+        self._sorted_names: List[Tuple[str, str]] = []
+        self._metadata: Dict[str, Tuple[float, FieldMetadata]] = {}
+        self._accuracy: Dict[str, Tuple[float, FieldAccuracy]] = {}
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Refreshes the fields if they are older than the ttl (or if forced), and returns whether they changed
+        """
+        with self._lock:
+            now = time.monotonic()
+
+            if not force and self._refreshed is not None and now - self._refreshed < self.ttl:
+                return False
+
+            fields, caller = self.api.get(if_none_match = self._etag)
+            self._refreshed = now
+
+            if fields is None:
+                return False
+
+            self._etag = caller.response.headers.get('ETag')
+            self._index(fields)
+
+            return True
+
+    def _index(self, fields: List[Field]) -> None:
+        by_name = {}
+        by_normalized_name = {}
+
+        for field in fields:
+            by_name.setdefault(field.name, []).append(field)
+            by_normalized_name.setdefault(normalize_name(field.name), []).append(field)
+
+        self._fields = fields
+        self._by_id = {field.id: field for field in fields}
+        self._by_name = by_name
+        self._by_normalized_name = by_normalized_name
+        self._sorted_names = sorted((normalize_name(field.name), field.id) for field in fields)
+
+    @property
+    def fields(self) -> List[Field]:
+        """
+        Returns the fields, refreshing them if needed
+        """
+        self.refresh()
+        return list(self._fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __iter__(self) -> Iterator[Field]:
+        return iter(self.fields)
+
+    def __contains__(self, field_id: str) -> bool:
+        self.refresh()
+        return field_id in self._by_id
+
+    def get(self, field_id: str) -> Optional[Field]:
+        """
+        Returns the field with this id, if any
+        """
+        self.refresh()
+        return self._by_id.get(field_id)
+
+    def find(self, name: str) -> List[Field]:
+        """
+        Returns the fields with this name: the exact name if any field has it, otherwise the normalized name
+        """
+        self.refresh()
+        return list(self._by_name.get(name) or self._by_normalized_name.get(normalize_name(name), []))
+
+    def resolve(self, name_or_id: str) -> Field:
+        """
+        Returns the field with this id or name. Raises a KeyError (suggesting similar names) if there is none,
+        or if the name is ambiguous.
+        """
+        field = self.get(name_or_id)
+        if field is not None:
+            return field
+
+        fields = self.find(name_or_id)
+
+        if len(fields) > 1:
+            raise KeyError(f'{name_or_id!r} is the name of {len(fields)} fields: '
+                           f'{", ".join(field.id for field in fields)}')
+
+        if not fields:
+            suggestions = ', '.join(repr(field.name) for field, _ in self.search(name_or_id, limit = 3))
+            raise KeyError(f'No field named {name_or_id!r}' + (f' (did you mean {suggestions}?)' if suggestions else ''))
+
+        return fields[0]
+
+    def resolve_many(self, names_or_ids: Iterable[str]) -> Dict[str, Field]:
+        """
+        Returns the field of each id or name. See resolve.
+        """
+        return {name_or_id: self.resolve(name_or_id) for name_or_id in names_or_ids}
+
+    def search_prefix(self, prefix: str, limit: int = None) -> List[Field]:
+        """
+        Returns the fields whose normalized name starts with the (normalized) prefix, by name
+        """
+        self.refresh()
+        prefix = normalize_name(prefix)
+        start = bisect.bisect_left(self._sorted_names, (prefix, ''))
+        fields = []
+
+        for name, field_id in self._sorted_names[start:]:
+            if not name.startswith(prefix) or (limit is not None and len(fields) >= limit):
+                break
+            fields.append(self._by_id[field_id])
+
+        return fields
+
+    def search(self, query: str, limit: int = 10, cutoff: float = 0.6) -> List[Tuple[Field, float]]:
+        """
+        Returns the fields whose name or description resembles the query (tolerating typos), with their score
+        (between 0 and 1), from the best match
+
+        :param query: The text to look for
+        :param limit: The maximum number of fields returned
+        :param cutoff: The minimum score of the fields returned
+        :return:
+        """
+        self.refresh()
+        query = normalize_name(query)
+        words = set(query.split())
+        matcher = SequenceMatcher(autojunk = False)
+        matcher.set_seq2(query)
+        scores = []
+
+        for field in self._fields:
+            name = normalize_name(field.name)
+            score = 1.0 if query in name else 0.0
+
+            if score < 1.0:
+                matcher.set_seq1(name)
+                if matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff:
+                    score = matcher.ratio()
+
+            if score < cutoff and words and field.description:
+                description = set(normalize_name(field.description).split())
+                score = max(score, 0.9 * len(words & description) / len(words))
+
+            if score >= cutoff:
+                scores.append((field, score))
+
+        scores.sort(key = lambda item: (-item[1], item[0].name))
+
+        return scores[:limit]
+
+    def get_metadata(self, field_id: str) -> FieldMetadata:
+        """
+        Returns the field's metadata, from the cache if it isn't older than the ttl
+        """
+        return self.prefetch_metadata([field_id])[field_id]
+
+    def get_accuracy(self, field_id: str) -> FieldAccuracy:
+        """
+        Returns the field's accuracy, from the cache if it isn't older than the ttl
+        """
+        return self.prefetch_accuracy([field_id])[field_id]
+
+    def prefetch_metadata(self, field_ids: Iterable[str]) -> Dict[str, FieldMetadata]:
+        """
+        Obtains the metadata of the fields that aren't cached, in parallel, and returns the metadata of every field
+        """
+        return self._prefetch(self._metadata, self.api.get_metadata, field_ids)
+
+    def prefetch_accuracy(self, field_ids: Iterable[str]) -> Dict[str, FieldAccuracy]:
+        """
+        Obtains the accuracy of the fields that aren't cached, in parallel, and returns the accuracy of every field
+        """
+        return self._prefetch(self._accuracy, self.api.get_accuracy, field_ids)
+
+    def _prefetch(self, cache: Dict[str, tuple], get: Callable, field_ids: Iterable[str]) -> dict:
+        field_ids = list(dict.fromkeys(field_ids))
+        now = time.monotonic()
+
+        with self._lock:
+            missing = [f for f in field_ids if f not in cache or now - cache[f][0] >= self.ttl]
+
+        if len(missing) == 1 or self.max_workers <= 1:
+            values = [get(field_id = field_id)[0] for field_id in missing]
+        elif missing:
+            with ThreadPoolExecutor(max_workers = min(self.max_workers, len(missing))) as executor:
+                values = list(executor.map(lambda field_id: get(field_id = field_id)[0], missing))
+        else:
+            values = []
+
+        with self._lock:
+            for field_id, value in zip(missing, values):
+                cache[field_id] = (now, value)
+
+            return {field_id: cache[field_id][1] for field_id in field_ids}
+
+    def invalidate(self) -> None:
+        """
+        Forgets the fields, metadata and accuracy, so that they are obtained again when next used
+        """
+        with self._lock:
+            self._refreshed = None
+            self._etag = None
+            self._metadata.clear()
+            self._accuracy.clear()
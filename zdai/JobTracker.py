@@ -0,0 +1,348 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Union
+
+from .api.exceptions import ApiRequestFailedError
+from .models.baserequest import BaseRequest
+from .models.polling import get_deadline, get_sleep
+
+
+def as_completed(requests: Iterable[BaseRequest], timeout: float = None,
+                 deadline: Union[float, datetime] = None) -> Iterator[BaseRequest]:
+    """
+    Yields the requests as they finish, polling their statuses in batches with an adaptive interval.
+    See JobTracker.as_completed.
+
+    Example:
+        for request in as_completed(ocr_requests + extraction_requests, timeout = 600):
+            print(request.id, request.status)
+    """
+    return JobTracker(requests).as_completed(timeout = timeout, deadline = deadline)
+
+
+class JobTracker(object):
+    """
+    JobTracker keeps track of many requests of any type (OCR, extraction, MLC, classification, ...) and refreshes
+    their statuses using as few calls as possible: the requests are grouped by API class and refreshed through its
+    get_multiple_batched(), rather than one request per call. Requests whose API class has no batch status endpoint
+    (e.g. field training) are refreshed one by one.
+
+    Example:
+        tracker = JobTracker(ocr_requests + extraction_requests)
+
+        for request in tracker.as_completed():
+            if request.is_type(FieldExtractionRequest):
+                print(request.get_results())
+    """
+
+    def __init__(self, requests: Iterable[BaseRequest] = None):
+        # API class instance id -> (API class instance, request id -> requests)
+        self._groups: Dict[int, tuple] = {}
+        self._lock = threading.RLock()
+
+        if requests:
+            self.add(*requests)
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def add(self, *requests: BaseRequest) -> None:
+        """
+        Starts tracking the requests
+        """
+        with self._lock:
+            for request in requests:
+                api = request.api()
+                _, group = self._groups.setdefault(id(api), (api, {}))
+                group.setdefault(request.id, []).append(request)
+
+    def remove(self, request: BaseRequest) -> None:
+        """
+        Stops tracking the request
+        """
+        with self._lock:
+            for key, (_, group) in list(self._groups.items()):
+                tracked = group.get(request.id, [])
+                if request in tracked:
+                    tracked.remove(request)
+                    if not tracked:
+                        del group[request.id]
+                if not group:
+                    del self._groups[key]
+
+    @property
+    def pending(self) -> List[BaseRequest]:
+        """
+        Returns the requests that haven't finished yet
+        """
+        with self._lock:
+            return [r for _, group in self._groups.values() for requests in group.values() for r in requests]
+
+    def refresh(self) -> List[BaseRequest]:
+        """
+        Refreshes the status of every pending request, and returns the ones that finished.
+        Finished requests are no longer tracked.
+        """
+        with self._lock:
+            groups = [(api, dict(group)) for api, group in self._groups.values()]
+
+        finished = []
+
+        for api, group in groups:
+            if hasattr(api, 'get_multiple_batched'):
+                self._refresh_multiple(api, group)
+            else:
+                for requests in group.values():
+                    for request in requests:
+                        request.update()
+
+            for requests in group.values():
+                finished.extend(r for r in requests if r.is_finished())
+
+        for request in finished:
+            self.remove(request)
+
+        return finished
+
+    def as_completed(self, poll_interval: float = None, timeout: float = None,
+                     deadline: Union[float, datetime] = None) -> Iterator[BaseRequest]:
+        """
+        Yields the requests as they finish, refreshing the pending ones in between.
+
+        :param poll_interval: The number of seconds between two refreshes. If not provided, the refreshes
+                              follow the shortest polling schedule of the pending requests, starting quickly
+                              and backing off geometrically.
+        :param timeout: The maximum number of seconds to wait for every request to finish
+        :param deadline: The time by which every request must be finished (a time.time() timestamp or a datetime)
+        :return:
+        """
+        end = get_deadline(timeout = timeout, deadline = deadline)
+        attempt = 0
+
+        while True:
+            yield from self.refresh()
+
+            pending = self.pending
+            if not pending:
+                return
+
+            if poll_interval is not None:
+                delay = poll_interval
+            else:
+                delay = min(r.get_polling_schedule().delay(attempt) for r in pending)
+
+            time.sleep(get_sleep(delay, end, f'{len(pending)} requests'))
+            attempt += 1
+
+    @staticmethod
+    def _refresh_multiple(api, group: Dict[str, List[BaseRequest]]) -> None:
+        latest, _ = api.get_multiple_batched(request_ids = list(group))
+        statuses = {request.id: request.json() for request in latest}
+
+        for request_id, requests in group.items():
+            status = statuses.get(request_id)
+
+            for request in requests:
+                if status is None:
+                    # The batch status didn't include the request: obtain it on its own.
+                    request.update()
+                else:
+                    request.set_json({**request.json(), **status})
+
+
+class RequestPoller(object):
+    """
+    RequestPoller resolves a concurrent.futures.Future for each request submitted to it, once the request finishes.
+    A single background thread refreshes every pending request in batches through a JobTracker, so no thread is
+    blocked per request. The thread is started on demand, and stops when nothing is pending.
+
+    A Future resolves to the finished request, or to the value returned by the request's `resolve` callable
+    (e.g. its results). It is resolved with an ApiRequestFailedError if the request failed.
+
+    Once closed, the poller stops polling, the pending Futures fail, and submit() raises a RuntimeError.
+
+    Example:
+        futures, _ = sdk.extraction.submit(file_ids = file_ids, field_ids = field_ids, fetch_results = True)
+        futures[0].add_done_callback(lambda future: store(future.result()))
+    """
+
+    def __init__(self, poll_interval: float = None, resolve_workers: int = 4, max_errors: int = 5):
+        """
+        :param poll_interval: The number of seconds between two refreshes. If not provided, the refreshes
+                              follow the shortest polling schedule of the pending requests.
+        :param resolve_workers: The number of threads running the `resolve` callables (e.g. fetching results),
+                                so that they don't delay the refreshes.
+        :param max_errors: The number of consecutive failed refreshes after which the pending Futures are
+                           resolved with the refresh's exception.
+        """
+        self.poll_interval = poll_interval
+        self.max_errors = max_errors
+        self._tracker = JobTracker()
+        self._futures: Dict[int, tuple] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._closed = False
+        self._resolvers = ThreadPoolExecutor(max_workers = resolve_workers, thread_name_prefix = 'zdai-resolve')
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._futures)
+
+    def submit(self, request: BaseRequest, resolve: Callable[[BaseRequest], object] = None) -> Future:
+        """
+        Returns a Future that resolves once the request finishes.
+
+        :param request: The request to poll
+        :param resolve: Called with the successful request; its return value becomes the Future's result
+        :return:
+        """
+        future = Future()
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('The RequestPoller is closed')
+
+            self._futures[id(request)] = (request, future, resolve)
+            self._tracker.add(request)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target = self._run, name = 'zdai-poller', daemon = True)
+                self._thread.start()
+
+        self._wakeup.set()
+        return future
+
+    def close(self) -> None:
+        """
+        Stops polling, and fails the pending Futures with a RuntimeError. The `resolve` callables already running
+        complete, on the resolver threads.
+        """
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+
+        self._wakeup.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+        self._fail_pending(RuntimeError('The RequestPoller was closed'))
+        self._resolvers.shutdown(wait = False)
+
+    def _run(self) -> None:
+        try:
+            self._poll()
+        except BaseException as e:
+            # Lets the next submit() start a new thread, rather than waiting on this one.
+            with self._lock:
+                self._thread = None
+
+            self._fail_pending(e)
+            raise
+
+    def _poll(self) -> None:
+        attempt = 0
+        errors = 0
+
+        while True:
+            with self._lock:
+                if self._closed:
+                    self._thread = None
+                    return
+
+            self._forget_cancelled()
+
+            try:
+                finished = self._tracker.refresh()
+                errors = 0
+            except Exception as e:
+                finished = []
+                errors += 1
+                if errors >= self.max_errors:
+                    self._fail_pending(e)
+                    errors = 0
+
+            for request in finished:
+                self._resolve(request)
+
+            with self._lock:
+                if not self._futures:
+                    self._thread = None
+                    return
+
+                pending = self._tracker.pending
+
+            if self.poll_interval is not None:
+                delay = self.poll_interval
+            else:
+                delay = min((r.get_polling_schedule().delay(attempt) for r in pending), default = 0.0)
+
+            # New submissions restart the schedule, so that short requests are picked up quickly.
+            if self._wakeup.wait(timeout = delay):
+                attempt = 0
+            else:
+                attempt += 1
+
+            self._wakeup.clear()
+
+    def _resolve(self, request: BaseRequest) -> None:
+        with self._lock:
+            entry = self._futures.pop(id(request), None)
+
+        if entry is None:
+            return
+
+        _, future, resolve = entry
+        if not future.set_running_or_notify_cancel():
+            return
+
+        if request.is_failed():
+            future.set_exception(ApiRequestFailedError(request))
+        elif resolve is None:
+            future.set_result(request)
+        else:
+            try:
+                self._resolvers.submit(self._run_resolve, future, resolve, request)
+            except RuntimeError as e:
+                # The resolver threads were shut down
+                future.set_exception(e)
+
+    @staticmethod
+    def _run_resolve(future: Future, resolve: Callable, request: BaseRequest) -> None:
+        try:
+            future.set_result(resolve(request))
+        except Exception as e:
+            future.set_exception(e)
+
+    def _forget_cancelled(self) -> None:
+        with self._lock:
+            for key, (request, future, _) in list(self._futures.items()):
+                if future.cancelled():
+                    del self._futures[key]
+                    self._tracker.remove(request)
+
+    def _fail_pending(self, exception: Exception) -> None:
+        with self._lock:
+            futures, self._futures = self._futures, {}
+
+        for request, future, _ in futures.values():
+            self._tracker.remove(request)
+            if future.set_running_or_notify_cancel():
+                future.set_exception(exception)
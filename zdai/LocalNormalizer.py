@@ -0,0 +1,303 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import random
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .api.normalizationapi import NORMALIZATIONS, NormalizationAPI
+from .models.slotted import slotted
+
+_MONTHS = {name: i + 1 for i, name in enumerate(['january', 'february', 'march', 'april', 'may', 'june', 'july',
+                                                  'august', 'september', 'october', 'november', 'december'])}
+_MONTHS.update({name[:3]: month for name, month in list(_MONTHS.items())})
+_MONTHS['sept'] = 9
+
+_NUMBERS = {word: i for i, word in enumerate(['zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight',
+                                              'nine', 'ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen',
+                                              'sixteen', 'seventeen', 'eighteen', 'nineteen'])}
+_TENS = {'twenty': 20, 'thirty': 30, 'forty': 40, 'fifty': 50, 'sixty': 60, 'seventy': 70, 'eighty': 80, 'ninety': 90}
+
+_CURRENCY_SYMBOLS = {'$': '$', 'us$': '$', 'usd': '$', '€': '€', 'eur': '€', '£': '£', 'gbp': '£', '¥': '¥', 'jpy': '¥'}
+_DURATION_UNITS = {'day': 'days', 'week': 'weeks', 'month': 'months', 'year': 'years'}
+
+_MONTH = r'(?P<month>[a-z]+)\.?'
+_DAY = r'(?P<day>\d{1,2})(?:st|nd|rd|th)?'
+_YEAR = r'(?P<year>\d{4})'
+
+_DATE_PATTERNS = [
+    re.compile(r'(?P<year>\d{4})-(?P<month_number>\d{2})-(?P<day>\d{2})'),
+    re.compile(rf'{_MONTH}\s+{_DAY},?\s+{_YEAR}'),
+    re.compile(rf'{_DAY}\s+(?:day\s+of\s+)?{_MONTH},?\s+{_YEAR}'),
+    re.compile(rf'the\s+{_DAY}\s+day\s+of\s+{_MONTH},?\s+{_YEAR}'),
+]
+_CURRENCY_PATTERN = re.compile(r'(?P<symbol>us\$|\$|€|£|¥|usd|eur|gbp|jpy)\s?(?P<amount>\d{1,3}(?:,\d{3})+|\d+)(?:\.(?P<cents>\d+))?')
+_DURATION_PATTERN = re.compile(r'(?:(?P<words>[a-z]+(?:[- ][a-z]+)?)\s*\((?P<parenthesized>\d+)\)|(?P<number>\d+)|(?P<word>[a-z]+(?:-[a-z]+)?))'
+                               r'\s+(?P<unit>day|week|month|year)s?')
+
+
+def _clean(text: str) -> str:
+    return ' '.join(text.strip().rstrip('.;,').lower().split())
+
+
+def _words_to_number(words: str) -> Optional[int]:
+    words = words.replace('-', ' ').split()
+
+    if len(words) == 1:
+        return _NUMBERS.get(words[0], _TENS.get(words[0]))
+
+    if len(words) == 2 and words[0] in _TENS and words[1] in _NUMBERS and 0 < _NUMBERS[words[1]] < 10:
+        return _TENS[words[0]] + _NUMBERS[words[1]]
+
+    return None
+
+
+def parse_date(text: str) -> Optional[dict]:
+    """
+    Returns the json of normalize/date for a text that is a single, unambiguous date (e.g. 2021-01-05,
+    January 5, 2021, 5th January 2021, the 5th day of January, 2021), or None
+    """
+    cleaned = _clean(text)
+
+    for pattern in _DATE_PATTERNS:
+        match = pattern.fullmatch(cleaned)
+        if not match:
+            continue
+
+        groups = match.groupdict()
+        month = int(groups['month_number']) if groups.get('month_number') else _MONTHS.get(groups['month'])
+        if month is None:
+            return None
+
+        try:
+            day = date(int(groups['year']), month, int(groups['day']))
+        except ValueError:
+            return None
+
+        return {'date': [{'day': day.day, 'month': day.month, 'year': day.year}]}
+
+    return None
+
+
+def parse_currency(text: str) -> Optional[dict]:
+    """
+    Returns the json of normalize/currency for a text that is a single amount with an unambiguous currency
+    (e.g. $1,000.00, USD 250, €15), or None
+    """
+    match = _CURRENCY_PATTERN.fullmatch(_clean(text))
+    if not match:
+        return None
+
+    cents = match.group('cents') or ''
+    value = float(match.group('amount').replace(',', '') + ('.' + cents if cents else ''))
+
+    return {'currency': [{'value': value, 'symbol': _CURRENCY_SYMBOLS[match.group('symbol')], 'precision': len(cents)}]}
+
+
+def parse_duration(text: str) -> Optional[dict]:
+    """
+    Returns the json of normalize/duration for a text that is a single duration (e.g. thirty (30) days, 6 months,
+    two years), or None. Durations whose number in words and in digits disagree are not normalized.
+    """
+    match = _DURATION_PATTERN.fullmatch(_clean(text))
+    if not match:
+        return None
+
+    if match.group('parenthesized'):
+        value = int(match.group('parenthesized'))
+        if _words_to_number(match.group('words')) != value:
+            return None
+    elif match.group('number'):
+        value = int(match.group('number'))
+    else:
+        value = _words_to_number(match.group('word'))
+        if value is None:
+            return None
+
+    return {'duration': [{'unit': _DURATION_UNITS[match.group('unit')], 'value': value}]}
+
+
+PARSERS: Dict[str, Callable[[str], Optional[dict]]] = {
+    'date': parse_date,
+    'duration': parse_duration,
+    'currency': parse_currency,
+}
+
+
+@slotted
+@dataclass
+class ParityReport:
+    """
+    Dataclass to store the comparison of the local and remote normalizations of a sample of texts
+    """
+    kind: str
+    checked: int = 0
+    local: int = 0
+    matched: int = 0
+    mismatches: List[Tuple[str, dict, dict]] = field(default_factory = list)
+
+    def is_consistent(self) -> bool:
+        return not self.mismatches
+
+
+class LocalNormalizer(object):
+    """
+    LocalNormalizer normalizes the most common, unambiguous forms of dates, currencies and durations locally,
+    and sends anything else to the NormalizationAPI. It returns the same DateNormalization, CurrencyNormalization
+    and DurationNormalization as the NormalizationAPI, and None instead of an ApiCall for the texts it normalized.
+
+    Only texts that are entirely a single date, amount or duration are normalized locally: anything that isn't
+    matched with confidence is sent to the API. Use check_parity() on a sample of your texts to verify that the
+    local normalizations agree with the API's, and disable the kinds that don't (see `kinds`).
+
+    Example:
+        normalizer = LocalNormalizer(sdk.normalization)
+
+        dates, callers = normalizer.get_multiple_dates(['January 5, 2021', 'on the first business day'])
+        report = normalizer.check_parity('date', sample_texts)
+    """
+
+    def __init__(self, remote: NormalizationAPI, kinds: Tuple[str, ...] = ('date', 'duration', 'currency')):
+        """
+        :param remote: The NormalizationAPI used for the texts that aren't normalized locally
+        :param kinds: The kinds of normalization done locally; the others are all sent to the API
+        """
+        self.remote = remote
+        self.kinds = kinds
+
+    def normalize_locally(self, kind: str, text: str) -> Optional[dict]:
+        """
+        Returns the local normalization's json, or None if the text can't be normalized locally with confidence
+        """
+        if kind not in self.kinds:
+            return None
+
+        content = PARSERS[kind](text)
+        if content is not None:
+            content.update({'text': text, 'sha-256': hashlib.sha256(text.encode('utf-8')).hexdigest()})
+
+        return content
+
+    def get_dates(self, text: str):
+        """
+        Gets the normalized date values from the input string, locally if possible. See NormalizationAPI.get_dates.
+        The ApiCall is None when the string was normalized locally.
+        """
+        return self._normalize('date', text, self.remote.get_dates)
+
+    def get_durations(self, text: str):
+        """
+        Gets the normalized duration values from the input string, locally if possible.
+        See NormalizationAPI.get_durations. The ApiCall is None when the string was normalized locally.
+        """
+        return self._normalize('duration', text, self.remote.get_durations)
+
+    def get_currencies(self, text: str):
+        """
+        Gets the normalized currency values from the input string, locally if possible.
+        See NormalizationAPI.get_currencies. The ApiCall is None when the string was normalized locally.
+        """
+        return self._normalize('currency', text, self.remote.get_currencies)
+
+    def get_multiple_dates(self, texts: List[str]):
+        """
+        Gets the normalized date values of each of the input strings, in their order. See get_multiple.
+        """
+        return self.get_multiple('date', texts)
+
+    def get_multiple_durations(self, texts: List[str]):
+        """
+        Gets the normalized duration values of each of the input strings, in their order. See get_multiple.
+        """
+        return self.get_multiple('duration', texts)
+
+    def get_multiple_currencies(self, texts: List[str]):
+        """
+        Gets the normalized currency values of each of the input strings, in their order. See get_multiple.
+        """
+        return self.get_multiple('currency', texts)
+
+    def get_multiple(self, kind: str, texts: List[str]) -> Tuple[list, list]:
+        """
+        Normalizes the texts, in their order: locally if possible, otherwise with NormalizationAPI.get_multiple
+
+        :return: The normalizations, and the ApiCalls that were sent
+        """
+        local = {text: self.normalize_locally(kind, text) for text in dict.fromkeys(texts)}
+        remaining = [text for text, content in local.items() if content is None]
+        normalizations = {}
+        callers = []
+
+        if remaining:
+            remote, callers = self.remote.get_multiple(kind, remaining)
+            normalizations.update(zip(remaining, remote))
+
+        for text, content in local.items():
+            if content is not None:
+                normalizations[text] = NORMALIZATIONS[kind](api = self.remote, json = content)
+
+        return [normalizations[text] for text in texts], callers
+
+    def check_parity(self, kind: str, texts: List[str], sample_size: int = None, seed: int = None) -> ParityReport:
+        """
+        Normalizes a sample of the texts both locally and with the API, and reports the texts whose local
+        normalization differs from the API's
+
+        :param kind: The kind of normalization: date, duration or currency
+        :param texts: The texts
+        :param sample_size: The number of texts compared, chosen at random (all of them if not provided)
+        :param seed: The seed of the sample, to make it reproducible
+        :return:
+        """
+        texts = list(dict.fromkeys(texts))
+        if sample_size is not None and sample_size < len(texts):
+            texts = random.Random(seed).sample(texts, sample_size)
+
+        report = ParityReport(kind = kind, checked = len(texts))
+        local = {text: PARSERS[kind](text) for text in texts}
+        compared = [text for text, content in local.items() if content is not None]
+        report.local = len(compared)
+
+        if compared:
+            remote, _ = self.remote.get_multiple(kind, compared)
+
+            for text, normalization in zip(compared, remote):
+                remote_values = self._comparable(kind, normalization.json())
+                if self._comparable(kind, local[text]) == remote_values:
+                    report.matched += 1
+                else:
+                    report.mismatches.append((text, local[text], normalization.json()))
+
+        return report
+
+    @staticmethod
+    def _comparable(kind: str, content: dict) -> list:
+        values = content.get(kind) or []
+
+        if kind == 'currency':
+            return [(float(v.get('value')), v.get('symbol'), v.get('precision')) for v in values]
+        if kind == 'duration':
+            return [(v.get('unit'), float(v.get('value'))) for v in values]
+
+        return [(v.get('day'), v.get('month'), v.get('year')) for v in values]
+
+    def _normalize(self, kind: str, text: str, remote: Callable) -> tuple:
+        content = self.normalize_locally(kind, text)
+        if content is None:
+            return remote(text = text)
+
+        return NORMALIZATIONS[kind](api = self.remote, json = content), None
@@ -12,8 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import requests
+
 import zdai as zdai
+from .api.concurrency import ConcurrencyController
 from .api.exceptions import ApiNoAccessProvidedError
+from .api.ratelimiter import RateLimiter
+from .api.retry import RetryPolicy
+from .api.session import create_session
+from .cache.normalizationcache import NormalizationCache
+from .cache.uploadcache import UploadCache
+from .ExpirationKeeper import ExpirationKeeper
+from .JobTracker import RequestPoller
 
 
 class ZDAISDK(object):
@@ -22,9 +32,48 @@ class ZDAISDK(object):
     an API class that's associated to a ZDAI microservice.
     """
 
-    def __init__(self, url: str = None, token: str = None, from_config=False):
+    def __init__(self, url: str = None, token: str = None, from_config=False,
+                 session: requests.Session = None,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 pool_block: bool = False,
+                 keep_alive: bool = True,
+                 retry_policy: RetryPolicy = None,
+                 rate_limiter: RateLimiter = None,
+                 concurrency_controller: ConcurrencyController = None,
+                 upload_cache: UploadCache = None,
+                 normalization_cache: NormalizationCache = None,
+                 expiration_keeper: ExpirationKeeper = None):
+        """
+        :param url: The url of the ZDAI region
+        :param token: The API token
+        :param from_config: Whether to load the url and token from config/access.json
+        :param session: A requests.Session to share across the API classes. If not provided,
+                        a connection-pooled session is created using the pool options below.
+        :param pool_connections: The number of per-host connection pools to cache.
+        :param pool_maxsize: The maximum number of connections kept alive per host.
+        :param pool_block: Whether to block when all of a host's connections are in use.
+        :param keep_alive: Whether connections are kept alive between calls.
+        :param retry_policy: The RetryPolicy used to retry failed calls. Calls are not retried if not provided.
+        :param rate_limiter: The RateLimiter that paces the calls of every API class. Calls are not paced if not provided.
+        :param concurrency_controller: The ConcurrencyController that adapts the number of calls in flight.
+        :param upload_cache: The UploadCache used to reuse files whose content was already uploaded.
+        :param normalization_cache: The NormalizationCache used to reuse the normalizations of texts.
+        :param expiration_keeper: The ExpirationKeeper tracking (and renewing) the files created by the SDK.
+        """
         self.url = url
         self.token = token
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.concurrency_controller = concurrency_controller
+        self.upload_cache = upload_cache
+        self.normalization_cache = normalization_cache
+        self.expiration_keeper = expiration_keeper
+        self._owns_session = session is None
+        self._session = session if session is not None else create_session(pool_connections = pool_connections,
+                                                                            pool_maxsize = pool_maxsize,
+                                                                            pool_block = pool_block,
+                                                                            keep_alive = keep_alive)
 
         if from_config:
             self.url, self.token = zdai.config.get_access()
@@ -35,18 +84,60 @@ class ZDAISDK(object):
         self._load_apis()
 
     def _load_apis(self):
-        self._file_api = zdai.FileAPI(url = self.url, token = self.token)
-        self._classification_api = zdai.ClassificationAPI(url = self.url, token = self.token)
-        self._language_api = zdai.LanguageAPI(url = self.url, token = self.token)
-        self._extraction_api = zdai.ExtractionAPI(url = self.url, token = self.token)
-        self._field_api = zdai.FieldAPI(url = self.url, token = self.token)
-        self._ocr_api = zdai.OCRAPI(url = self.url, token = self.token)
-        self._mlc_api = zdai.MLCAPI(url = self.url, token = self.token)
-        self._normalization_api = zdai.NormalizationAPI(url = self.url, token = self.token)
+        options = self._call_options()
+        self._poller = RequestPoller()
+
+        self._file_api = zdai.FileAPI(url = self.url, token = self.token, upload_cache = self.upload_cache,
+                                      expiration_keeper = self.expiration_keeper, **options)
+        self._classification_api = zdai.ClassificationAPI(url = self.url, token = self.token, poller = self._poller, **options)
+        self._language_api = zdai.LanguageAPI(url = self.url, token = self.token, **options)
+        self._extraction_api = zdai.ExtractionAPI(url = self.url, token = self.token, poller = self._poller, **options)
+        self._field_api = zdai.FieldAPI(url = self.url, token = self.token, **options)
+        self._ocr_api = zdai.OCRAPI(url = self.url, token = self.token, poller = self._poller, **options)
+        self._mlc_api = zdai.MLCAPI(url = self.url, token = self.token, poller = self._poller, **options)
+        self._normalization_api = zdai.NormalizationAPI(url = self.url, token = self.token, cache = self.normalization_cache, **options)
+
+    def _call_options(self) -> dict:
+        """
+        Returns the options that every API class passes on to its ApiCalls
+        """
+        return {'session': self._session,
+                'retry_policy': self.retry_policy,
+                'rate_limiter': self.rate_limiter,
+                'concurrency_controller': self.concurrency_controller}
 
     def has_access(self):
         return all(f is not None for f in [self.url, self.token])
 
+    def close(self):
+        """
+        Closes the pooled connections, if the session was created by the SDK, and the request poller
+        """
+        self._poller.close()
+
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def poller(self) -> RequestPoller:
+        """
+        Returns the RequestPoller shared by the API classes' submit() methods
+        """
+        return self._poller
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Returns the requests.Session shared by every API class
+        """
+        return self._session
+
     @property
     def file(self) -> zdai.FileAPI:
         """
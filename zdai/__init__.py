@@ -16,3 +16,11 @@ from .api import *
 from .config import config
 from .models import *
 from .ZDAISDK import ZDAISDK
+from .AsyncZDAISDK import AsyncZDAISDK
+from .JobTracker import JobTracker, RequestPoller, as_completed
+from .DocumentPipeline import DocumentPipeline
+from .cache import ExtractionCache, NormalizationCache, UploadCache
+from .CachedExtractor import CachedExtractor
+from .LocalNormalizer import LocalNormalizer
+from .FieldCatalog import FieldCatalog
+from .ExpirationKeeper import ExpirationKeeper
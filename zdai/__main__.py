@@ -14,7 +14,10 @@
 
 from .config import config
 from .ZDAISDK import ZDAISDK
+from .BulkIngestion import BulkIngestion
+from .cache import UploadCache
 import argparse
+import sys
 
 parser = argparse.ArgumentParser()
 parser.add_argument("--get",
@@ -32,12 +35,90 @@ parser.add_argument("--test",
                     choices = ["connection"],
                     help = 'Perform an test action')
 
+subparsers = parser.add_subparsers(dest = 'command')
+ingest_parser = subparsers.add_parser('ingest',
+                                      help = 'Uploads the files of a directory tree (or listed in a file), '
+                                             'optionally sends them for OCR, classification, MLC and extraction, '
+                                             'and writes the file and request ids to a JSONL manifest')
+ingest_parser.add_argument("directory",
+                           type = str,
+                           nargs = '?',
+                           help = 'The directory tree to ingest')
+ingest_parser.add_argument("--paths",
+                           type = str,
+                           help = 'A text file listing the files to ingest, one per line')
+ingest_parser.add_argument("--pattern",
+                           type = str,
+                           help = 'Only ingest the files of the directory tree matching the pattern (e.g. *.pdf)')
+ingest_parser.add_argument("--manifest",
+                           type = str,
+                           required = True,
+                           help = 'The JSONL manifest. Ingesting into an existing manifest resumes from it.')
+ingest_parser.add_argument("--ocr",
+                           action = 'store_true',
+                           help = 'Send the files for OCR')
+ingest_parser.add_argument("--classification",
+                           action = 'store_true',
+                           help = 'Send the files for classification')
+ingest_parser.add_argument("--mlc",
+                           action = 'store_true',
+                           help = 'Send the files for multi-level classification')
+ingest_parser.add_argument("--field-ids",
+                           type = str,
+                           nargs = '+',
+                           help = 'Send the files for extraction of these field ids')
+ingest_parser.add_argument("--expiration",
+                           type = str,
+                           help = 'The expiration of the uploaded files (e.g. 13d)')
+ingest_parser.add_argument("--upload-cache",
+                           type = str,
+                           help = 'An SQLite file remembering the uploaded content, so that duplicate files '
+                                  '(and files uploaded by previous runs) are not uploaded again')
+ingest_parser.add_argument("--upload-workers",
+                           type = int,
+                           default = 8,
+                           help = 'The number of files uploaded at once')
+ingest_parser.add_argument("--request-workers",
+                           type = int,
+                           default = 32,
+                           help = 'The number of files waited on at once by each of the OCR, classification, '
+                                  'MLC and extraction stages')
+
 args = parser.parse_args()
 
 if __name__ == "__main__":
     url, token = config.get_access()
 
-    if args.get == "token":
+    if args.command == 'ingest':
+        if bool(args.directory) == bool(args.paths):
+            ingest_parser.error('Provide either a directory or --paths')
+
+        upload_cache = UploadCache(args.upload_cache) if args.upload_cache else None
+        sdk = ZDAISDK(from_config = True, pool_maxsize = max(args.upload_workers, 10), upload_cache = upload_cache)
+        workers = {'upload': args.upload_workers}
+        for stage in ('ocr', 'classification', 'mlc', 'extraction'):
+            workers[stage] = args.request_workers
+
+        ingestion = BulkIngestion(sdk,
+                                  manifest = args.manifest,
+                                  field_ids = args.field_ids,
+                                  ocr = args.ocr,
+                                  classification = args.classification,
+                                  mlc = args.mlc,
+                                  workers = workers,
+                                  expiration = args.expiration)
+
+        if args.directory:
+            paths = BulkIngestion.find_files(args.directory, pattern = args.pattern)
+        else:
+            paths = BulkIngestion.read_paths(args.paths)
+
+        counts = ingestion.run(paths)
+        sdk.close()
+
+        if counts['failed']:
+            sys.exit(1)
+    elif args.get == "token":
         if not token:
             print(f'No default token found')
         else:
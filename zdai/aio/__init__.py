@@ -0,0 +1,25 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from .asyncapicall import AsyncApiCall, AsyncResponse
+from .classificationapi import AsyncClassificationAPI
+from .extractionapi import AsyncExtractionAPI
+from .fieldapi import AsyncFieldAPI
+from .fileapi import AsyncFileAPI
+from .languageapi import AsyncLanguageAPI
+from .mlcapi import AsyncMLCAPI
+from .normalizationapi import AsyncNormalizationAPI
+from .ocrapi import AsyncOCRAPI
+from .session import AsyncSession
@@ -0,0 +1,149 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import json
+import time
+
+import requests
+
+from ..api.apicall import ApiCall
+from ..api.concurrency import ConcurrencyController
+from ..api.ratelimiter import RateLimiter
+from ..api.retry import RetryPolicy
+from .session import AsyncSession, _require_aiohttp, aiohttp
+
+
+class AsyncResponse(object):
+    """
+    AsyncResponse holds a fully-read aiohttp response. It exposes the same attributes of a requests.Response
+    that the API classes and exceptions use, so that the synchronous and asynchronous API classes can share
+    their parsing.
+    """
+
+    def __init__(self, status_code: int, reason: str, headers: dict, content: bytes, url: str):
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.request = requests.Request(url = url)
+
+    def __repr__(self) -> str:
+        return f'<AsyncResponse [{self.status_code}]>'
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if 400 <= self.status_code < 600:
+            raise requests.exceptions.HTTPError(f'{self.status_code} Error: {self.reason} for url: {self.url}',
+                                                response = self)
+
+
+class AsyncApiCall(ApiCall):
+    """
+    AsyncApiCall is the asyncio counterpart of the ApiCall: send() is awaitable and does not block the event loop.
+    """
+
+    def __init__(self, token=None, url=None, method=None, path=None, session: AsyncSession = None,
+                 retry_policy: RetryPolicy = None, rate_limiter: RateLimiter = None,
+                 concurrency_controller: ConcurrencyController = None):
+        _require_aiohttp()
+        super().__init__(token = token, url = url, method = method, path = path, retry_policy = retry_policy,
+                         rate_limiter = rate_limiter, concurrency_controller = concurrency_controller)
+        self.session = session
+
+    def new(self, method: str, path: str) -> 'AsyncApiCall':
+        return AsyncApiCall(token = self.token, url = self.url, method = method, path = path, session = self.session,
+                            retry_policy = self.retry_policy, rate_limiter = self.rate_limiter,
+                            concurrency_controller = self.concurrency_controller)
+
+    def _query(self) -> list:
+        """
+        Converts the parameters to the key/value pairs accepted by aiohttp. Lists are sent as
+        repeated keys, which is how requests encodes them.
+        """
+        query = []
+        for key, value in self.parameters.items():
+            for v in (value if isinstance(value, (list, tuple)) else [value]):
+                query.append((key, str(v).lower() if isinstance(v, bool) else str(v)))
+
+        return query
+
+    async def send(self) -> None:
+        """
+        Calls the API Endpoint, using the shared session's connection pool if one was provided.
+        Failed attempts are retried according to the retry policy, if one was provided, and every
+        attempt waits for the rate limiter and for a slot of the concurrency controller, if provided.
+        :return:
+        """
+        self.attempts = 0
+        self._body_position = self._tell_body()
+
+        while True:
+            self.attempts += 1
+
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve(self.path))
+
+            if self.concurrency_controller is not None:
+                await self.concurrency_controller.acquire_async()
+
+            start = time.monotonic()
+
+            try:
+                await self._send()
+            except BaseException as e:
+                self._release_slot(start, exception = e)
+
+                if not isinstance(e, Exception) or not self._should_retry(exception = e):
+                    raise
+
+                await asyncio.sleep(self.retry_policy.get_delay(self.attempts))
+                continue
+
+            self._release_slot(start)
+
+            if not self._should_retry():
+                break
+
+            await asyncio.sleep(self.retry_policy.get_delay(self.attempts, self.response))
+
+        self._check_for_exception()
+
+    async def _send(self) -> None:
+        if self.session is not None:
+            await self._request(self.session.get())
+        else:
+            async with aiohttp.ClientSession() as session:
+                await self._request(session)
+
+    async def _request(self, session: 'aiohttp.ClientSession') -> None:
+        async with session.request(method = self.method,
+                                   params = self._query(),
+                                   headers = self.headers,
+                                   url = self.uri,
+                                   data = self.body) as response:
+            content = await response.read()
+            self.response = AsyncResponse(status_code = response.status,
+                                          reason = response.reason,
+                                          headers = response.headers,
+                                          content = content,
+                                          url = str(response.url))
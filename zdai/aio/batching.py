@@ -0,0 +1,42 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import List, Sequence, Tuple
+
+from .asyncapicall import AsyncApiCall
+from ..api.batching import DEFAULT_BATCH_SIZE, DEFAULT_MAX_WORKERS, chunk_ids, merge_statuses
+
+
+async def get_statuses(call: AsyncApiCall, path: str, request_ids: Sequence[str],
+                       batch_size: int = DEFAULT_BATCH_SIZE,
+                       max_workers: int = DEFAULT_MAX_WORKERS) -> Tuple[List[Tuple[str, dict]], List[AsyncApiCall]]:
+    """
+    Awaitable version of zdai.api.batching.get_statuses: at most max_workers batches are in flight at once.
+    """
+    batches = chunk_ids(request_ids, batch_size) or [[]]
+    semaphore = asyncio.Semaphore(max(max_workers, 1))
+
+    async def send(batch: List[str]) -> AsyncApiCall:
+        async with semaphore:
+            caller = call.new(method = 'GET', path = path)
+            caller.add_parameter('request_id', batch)
+            await caller.send()
+
+            return caller
+
+    callers = await asyncio.gather(*(send(batch) for batch in batches))
+    statuses = merge_statuses(request_ids, [caller.response.json().get('statuses') for caller in callers])
+
+    return statuses, list(callers)
@@ -0,0 +1,132 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import List, Tuple
+
+from .asyncapicall import AsyncApiCall
+from .batching import get_statuses
+from ..api.batching import DEFAULT_BATCH_SIZE, DEFAULT_MAX_WORKERS
+from ..api.extractionapi import ExtractionAPI
+from ..api.resultdecoder import loads
+from ..models.field_extraction_request import FieldExtractionRequest
+from ..models.field_extraction_result import FieldExtractionResult
+from ..models.field_extraction_answer import FieldExtractionAnswer
+
+
+class AsyncExtractionAPI(object):
+    """
+    AsyncExtractionAPI contains the awaitable functionality accepted by the Extraction Microservice
+    """
+
+    def __init__(self, token: str, url: str, **kwargs):
+        """
+        :param kwargs: Passed through to the AsyncApiCall (e.g. the shared session)
+        """
+        self._call = AsyncApiCall(token, url, **kwargs)
+
+    async def create(self, file_ids: List[str], field_ids: List[str]) -> Tuple[List[FieldExtractionRequest], AsyncApiCall]:
+        """
+        Creates a new extraction request for the file ids and field ids provided.
+
+        :return:
+        """
+        caller = self._call.new(method='POST', path='extraction')
+        caller.add_body(key='file_ids', value=file_ids)
+        caller.add_body(key='field_ids', value=field_ids)
+        await caller.send()
+
+        return [FieldExtractionRequest(api=self, json=c) for c in caller.response.json().get('file_ids')], caller
+
+    async def get(self, request_id: str) -> Tuple[FieldExtractionRequest, AsyncApiCall]:
+        """
+        Gets the Extraction Status data for the request_id.
+
+        :return:
+        """
+        caller = self._call.new(method='GET', path=f'extraction/{request_id}')
+        await caller.send()
+
+        return FieldExtractionRequest(api=self, json=caller.response.json()), caller
+
+    async def get_multiple(self, request_ids: List[str]) -> Tuple[List[FieldExtractionRequest], AsyncApiCall]:
+        """
+        Gets multiple extraction statuses, in a single call. See get_multiple_batched for many request ids.
+        """
+        requests, callers = await self.get_multiple_batched(request_ids, batch_size = max(len(request_ids), 1))
+
+        return requests, callers[0]
+
+    async def get_multiple_batched(self, request_ids: List[str], batch_size: int = DEFAULT_BATCH_SIZE,
+                                   max_workers: int = DEFAULT_MAX_WORKERS) -> Tuple[List[FieldExtractionRequest], List[AsyncApiCall]]:
+        """
+        Gets multiple extraction statuses
+
+        The request ids are sent in batches of at most batch_size ids, with up to max_workers batches in
+        flight at once. The statuses are returned in the order of request_ids, along with the AsyncApiCalls
+        (one per batch).
+        """
+        statuses, callers = await get_statuses(self._call, 'extractions', request_ids,
+                                               batch_size = batch_size, max_workers = max_workers)
+
+        field_extraction_requests = []
+
+        for request_id, result in statuses:
+            result['request_id'] = request_id
+            field_extraction_requests.append(FieldExtractionRequest(api = self, json = result))
+
+        return field_extraction_requests, callers
+
+    async def get_result_content(self, request_id: str) -> Tuple[dict, AsyncApiCall]:
+        """
+        Gets the Extraction Result json for the request_id, as returned by the API.
+
+        :return:
+        """
+        caller = self._call.new(
+            method='GET', path=f'extraction/{request_id}/results/text')
+        await caller.send()
+
+        return loads(caller.response.content), caller
+
+    async def get_result(self, request_id: str) -> Tuple[List[FieldExtractionResult], AsyncApiCall]:
+        """
+        Gets the Extraction Result data for the request_id.
+
+        :return:
+        """
+        content, caller = await self.get_result_content(request_id)
+
+        return ExtractionAPI._parse_results(content), caller
+
+    async def get_answer(self, request_id: str) -> Tuple[List[FieldExtractionAnswer], AsyncApiCall]:
+        """
+        Gets the Extraction Answers for the request_id.
+
+        :return:
+        """
+        content, caller = await self.get_result_content(request_id)
+
+        return ExtractionAPI._parse_answers(content), caller
+
+    async def get_results_and_answers(self, request_id: str) -> Tuple[List[FieldExtractionResult],
+                                                                      List[FieldExtractionAnswer], AsyncApiCall]:
+        """
+        Gets the Extraction Results and Answers for the request_id, from a single download of the results.
+
+        :return:
+        """
+        content, caller = await self.get_result_content(request_id)
+
+        return ExtractionAPI._parse_results(content), ExtractionAPI._parse_answers(content), caller
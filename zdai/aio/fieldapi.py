@@ -0,0 +1,128 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import List, Optional, Tuple
+
+from .asyncapicall import AsyncApiCall
+from ..api.fieldapi import FieldAPI
+from ..models.field import Field
+from ..models.field_training import FieldValidationDetails, FieldMetadata, FieldAccuracy
+from ..models.field_training_request import FieldTrainingRequest
+
+
+class AsyncFieldAPI(object):
+    """
+    AsyncFieldAPI contains the awaitable functionality accepted by the Fields Microservice
+    """
+
+    def __init__(self, token: str, url: str, **kwargs):
+        """
+        :param kwargs: Passed through to the AsyncApiCall (e.g. the shared session)
+        """
+        self._call = AsyncApiCall(token, url, **kwargs)
+
+    async def create(self, field_name: str, description: str = None, from_field_id: str = None) -> Tuple[str, AsyncApiCall]:
+        """
+        Creates a new field
+        """
+        caller = self._call.new(method='POST', path='fields')
+        caller.add_body(key='field_name', value=field_name)
+
+        if description:
+            caller.add_body(key='description', value=description)
+
+        if from_field_id:
+            caller.add_body(key='from_field_id', value=from_field_id)
+
+        await caller.send()
+
+        return caller.response.json().get('field_id'), caller
+
+    async def train(self, field_id: str, annotations: List[dict]) -> Tuple[FieldTrainingRequest, AsyncApiCall]:
+        """
+        Creates a field training for the annotations provided. See FieldAPI.train for the annotation format.
+        """
+        caller = self._call.new(method='POST', path=f'fields/{field_id}/train')
+        caller.set_body_value(annotations)
+        await caller.send()
+
+        return FieldTrainingRequest(api=self, json=caller.response.json()), caller
+
+    async def get_training_status(self, field_id: str, request_id: int) -> Tuple[FieldTrainingRequest, AsyncApiCall]:
+        """
+        Obtain the latest status of the Field Training Request
+        """
+        caller = self._call.new(
+            method='GET', path=f'fields/{field_id}/train/{request_id}')
+        await caller.send()
+
+        return FieldTrainingRequest(api=self, json=caller.response.json()), caller
+
+    async def get(self, if_none_match: str = None) -> Tuple[Optional[List[Field]], AsyncApiCall]:
+        """
+        Gets the list of fields that exist in the ZDAI, which
+        the API token has access to. See FieldAPI.get for if_none_match.
+        """
+        caller = self._call.new(method='GET', path='fields')
+        if if_none_match:
+            caller.add_header(key='If-None-Match', value=if_none_match)
+        await caller.send()
+
+        if caller.response.status_code == 304:
+            return None, caller
+
+        return FieldAPI._parse_fields(caller.response.json()), caller
+
+    async def get_metadata(self, field_id: str) -> Tuple[FieldMetadata, AsyncApiCall]:
+        """
+        Gets the field's metadata
+        """
+        caller = self._call.new(
+            method='GET', path=f'fields/{field_id}/metadata')
+        await caller.send()
+
+        return FieldMetadata(**caller.response.json()), caller
+
+    async def update_metadata(self, field_id: str, name: str, description: str) -> Tuple[bool, AsyncApiCall]:
+        """
+        Updates the field's metadata
+        """
+        caller = self._call.new(
+            method='PUT', path=f'fields/{field_id}/metadata')
+        caller.add_body(key='name', value=name)
+        caller.add_body(key='description', value=description)
+        await caller.send()
+
+        return caller.response.status_code == 204, caller
+
+    async def get_accuracy(self, field_id: str) -> Tuple[FieldAccuracy, AsyncApiCall]:
+        """
+        Gets the field's accuracy (precision, recall, fscore)
+        """
+        caller = self._call.new(
+            method='GET', path=f'fields/{field_id}/accuracy')
+        await caller.send()
+
+        return FieldAccuracy(**caller.response.json()), caller
+
+    async def get_validation_details(self, field_id: str) -> Tuple[List[FieldValidationDetails], AsyncApiCall]:
+        """
+        Gets the field's validation details (type of instance (true positive, false positive, false negative) & location)
+        """
+        caller = self._call.new(
+            method='GET', path=f'fields/{field_id}/validation-details')
+        await caller.send()
+
+        return FieldAPI._parse_validation_details(caller.response.json()), caller
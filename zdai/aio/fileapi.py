@@ -0,0 +1,126 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+from typing import Tuple
+
+from .asyncapicall import AsyncApiCall
+from ..api.fileapi import FileAPI, FileContent, _as_content, _lookup_upload, _open_content, _remember_upload
+from ..cache.uploadcache import UploadCache
+from ..models.file import File, FileExpiration
+
+
+def _as_payload(body):
+    """
+    Returns a body aiohttp can send: iterables of bytes chunks are wrapped in an asynchronous generator.
+    """
+    if isinstance(body, (bytes, bytearray, memoryview)) or hasattr(body, 'read') or hasattr(body, '__aiter__'):
+        return body
+
+    async def chunks():
+        for chunk in body:
+            yield chunk
+
+    return chunks()
+
+
+class AsyncFileAPI(object):
+    """
+    AsyncFileAPI contains the awaitable functionality accepted by the File/Storage Microservice
+    """
+
+    def __init__(self, token: str, url: str, upload_cache: UploadCache = None, **kwargs):
+        """
+        :param upload_cache: If provided, uploading content that was already uploaded reuses the existing file
+        :param kwargs: Passed through to the AsyncApiCall (e.g. the shared session)
+        """
+        self._call = AsyncApiCall(token, url, **kwargs)
+        self.upload_cache = upload_cache
+        self._namespace = UploadCache.namespace(url, token)
+
+    async def create(self, content: FileContent, is_zuva_ocr: bool = False, expiration: str = None, headers: dict = None) -> Tuple[File, AsyncApiCall]:
+        """
+        Creates a new file in the ZDAI
+
+        :param content: The content of the data to submit: its bytes, a path (str or e.g. pathlib.Path) to the
+                        file, an open binary file or an iterable of bytes chunks.
+        :param is_zuva_ocr: If the byte content provided comes from a .zuvaocr file.
+        :param expiration: Set the expiration of the document. Defaults to 7d in DocAI. Max 13d.
+        :param headers: Set additional headers.
+        :return: The File, and the AsyncApiCall (None if the file was found in the upload cache)
+        """
+        content = _as_content(content)
+        digest = None
+
+        if self.upload_cache is not None:
+            # Hashing reads the whole content: it is done off the event loop.
+            cached, digest, content = await asyncio.get_running_loop().run_in_executor(
+                None, _lookup_upload, self.upload_cache, self._namespace, content, is_zuva_ocr)
+            if cached is not None:
+                return cached, None
+
+        caller = self._call.new(method = 'POST', path = f'files')
+        caller.use_default_accept_type = False
+        caller.use_default_content_type = False
+        if is_zuva_ocr: caller.add_header(key = 'Content-Type', value = 'application/eocr')
+        if expiration: caller.add_header(key = 'Expiration', value = expiration)
+        caller.add_header(key='X-Attr-Pdf-Object-Streams', value='generate')
+
+        if headers:
+            for k, v in headers.items():
+                caller.add_header(key = k, value = v)
+
+        with _open_content(content) as body:
+            caller.set_body_value(value = _as_payload(body))
+            await caller.send()
+
+        file = FileAPI._parse_file(caller.response.json())
+
+        if self.upload_cache is not None:
+            _remember_upload(self.upload_cache, self._namespace, file, digest, content, is_zuva_ocr)
+
+        return file, caller
+
+    async def delete(self, file_id: str) -> Tuple[bool, AsyncApiCall]:
+        """
+        Deletes a file
+
+        :return:
+        """
+        caller = self._call.new(method = 'DELETE', path = f'files/{file_id}')
+        await caller.send()
+
+        if self.upload_cache is not None:
+            self.upload_cache.discard(file_id)
+
+        return caller.response.status_code == 204, caller
+
+    async def set_expiration(self, file_id: str, expiration: str) -> Tuple[FileExpiration, AsyncApiCall]:
+        """
+        Sets the file expiration. See FileAPI.set_expiration for the accepted expiration formats.
+
+        :param file_id: The file ID for which the file expiration will be set
+        :param expiration: The new expiration (formatted YYYY-MM-DDTHH:mm:ssZ), or length of time (e.g. 7d for 7 days),
+        :return: The file_id updated and the new expiration date
+        """
+        caller = self._call.new(method = 'PUT', path = f'files/{file_id}/expiration')
+        caller.add_header(key = 'Expiration', value = expiration)
+        await caller.send()
+        file_expiration = FileAPI._parse_expiration(file_id, caller.response.json())
+
+        if self.upload_cache is not None:
+            self.upload_cache.set_expiration(file_id, file_expiration.expiration)
+
+        return file_expiration, caller
@@ -0,0 +1,84 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import List, Tuple
+
+from .asyncapicall import AsyncApiCall
+from .batching import get_statuses
+from ..api.batching import DEFAULT_BATCH_SIZE, DEFAULT_MAX_WORKERS
+from ..models.mlc_request import MLCRequest
+
+
+class AsyncMLCAPI(object):
+    """
+    AsyncMLCAPI contains the awaitable functionality accepted by the Multilevel Classification Microservice
+    """
+
+    def __init__(self, token: str, url: str, **kwargs):
+        """
+        :param kwargs: Passed through to the AsyncApiCall (e.g. the shared session)
+        """
+        self._call = AsyncApiCall(token, url, **kwargs)
+
+    async def create(self, file_ids: List[str]) -> Tuple[List[MLCRequest], AsyncApiCall]:
+        """
+        Creates a new MLC request for the file ids provided.
+
+        :return:
+        """
+        caller = self._call.new(method = 'POST', path = 'mlc')
+        caller.add_body(key = 'file_ids', value = file_ids)
+        await caller.send()
+
+        return [MLCRequest(api = self, json = c) for c in caller.response.json().get('file_ids')], caller
+
+    async def get(self, request_id: str) -> Tuple[MLCRequest, AsyncApiCall]:
+        """
+        Gets the MLC data for the request_id.
+
+        :return:
+        """
+        caller = self._call.new(method = 'GET', path = f'mlc/{request_id}')
+        await caller.send()
+
+        return MLCRequest(api = self, json = caller.response.json()), caller
+
+    async def get_multiple(self, request_ids: List[str]) -> Tuple[List[MLCRequest], AsyncApiCall]:
+        """
+        Gets multiple MLC statuses, in a single call. See get_multiple_batched for many request ids.
+        """
+        requests, callers = await self.get_multiple_batched(request_ids, batch_size = max(len(request_ids), 1))
+
+        return requests, callers[0]
+
+    async def get_multiple_batched(self, request_ids: List[str], batch_size: int = DEFAULT_BATCH_SIZE,
+                                   max_workers: int = DEFAULT_MAX_WORKERS) -> Tuple[List[MLCRequest], List[AsyncApiCall]]:
+        """
+        Gets multiple MLC statuses
+
+        The request ids are sent in batches of at most batch_size ids, with up to max_workers batches in
+        flight at once. The statuses are returned in the order of request_ids, along with the AsyncApiCalls
+        (one per batch).
+        """
+        statuses, callers = await get_statuses(self._call, 'mlcs', request_ids,
+                                               batch_size = batch_size, max_workers = max_workers)
+
+        mlc_requests = []
+
+        for request_id, result in statuses:
+            result['request_id'] = request_id
+            mlc_requests.append(MLCRequest(api = self, json = result))
+
+        return mlc_requests, callers
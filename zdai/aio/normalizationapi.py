@@ -0,0 +1,129 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import List, Optional, Tuple
+
+from .asyncapicall import AsyncApiCall
+from ..api.normalizationapi import NORMALIZATIONS
+from ..cache.normalizationcache import NormalizationCache
+from ..models.date_normalization import DateNormalization
+from ..models.currency_normalization import CurrencyNormalization
+from ..models.duration_normalization import DurationNormalization
+
+
+class AsyncNormalizationAPI(object):
+    """
+    AsyncNormalizationAPI contains the awaitable functionality accepted by the Normalization services
+    """
+
+    def __init__(self, token: str, url: str, cache: NormalizationCache = None, max_workers: int = 8, **kwargs):
+        """
+        :param cache: If provided, texts that were already normalized are served from the cache
+        :param max_workers: The maximum number of calls in flight for the get_multiple_* methods
+        :param kwargs: Passed through to the AsyncApiCall (e.g. the shared session)
+        """
+        self._call = AsyncApiCall(token, url, **kwargs)
+        self.cache = cache
+        self.max_workers = max_workers
+
+    async def get_dates(self, text: str) -> Tuple[DateNormalization, Optional[AsyncApiCall]]:
+        """
+        Gets the normalized date values from the input string
+
+        :return: The DateNormalization, and the AsyncApiCall (None if the text was found in the cache)
+        """
+        return await self._normalize('date', text)
+
+    async def get_durations(self, text: str) -> Tuple[DurationNormalization, Optional[AsyncApiCall]]:
+        """
+        Gets the normalized duration values from the input string
+
+        :return: The DurationNormalization, and the AsyncApiCall (None if the text was found in the cache)
+        """
+        return await self._normalize('duration', text)
+
+    async def get_currencies(self, text: str) -> Tuple[CurrencyNormalization, Optional[AsyncApiCall]]:
+        """
+        Gets the normalized currency values from the input string
+
+        :return: The CurrencyNormalization, and the AsyncApiCall (None if the text was found in the cache)
+        """
+        return await self._normalize('currency', text)
+
+    async def get_multiple_dates(self, texts: List[str]) -> Tuple[List[DateNormalization], List[AsyncApiCall]]:
+        """
+        Gets the normalized date values of each of the input strings, in their order. See get_multiple.
+        """
+        return await self.get_multiple('date', texts)
+
+    async def get_multiple_durations(self, texts: List[str]) -> Tuple[List[DurationNormalization], List[AsyncApiCall]]:
+        """
+        Gets the normalized duration values of each of the input strings, in their order. See get_multiple.
+        """
+        return await self.get_multiple('duration', texts)
+
+    async def get_multiple_currencies(self, texts: List[str]) -> Tuple[List[CurrencyNormalization], List[AsyncApiCall]]:
+        """
+        Gets the normalized currency values of each of the input strings, in their order. See get_multiple.
+        """
+        return await self.get_multiple('currency', texts)
+
+    async def get_multiple(self, kind: str, texts: List[str]) -> Tuple[list, List[AsyncApiCall]]:
+        """
+        Awaitable version of NormalizationAPI.get_multiple: at most max_workers calls are in flight at once.
+        """
+        normalization = NORMALIZATIONS[kind]
+        contents = {text: self._get_cached(kind, text) for text in dict.fromkeys(texts)}
+        missing = [text for text, content in contents.items() if content is None]
+        semaphore = asyncio.Semaphore(max(self.max_workers, 1))
+
+        async def send(text: str) -> AsyncApiCall:
+            async with semaphore:
+                return await self._send(kind, text)
+
+        callers = list(await asyncio.gather(*(send(text) for text in missing)))
+
+        for text, caller in zip(missing, callers):
+            contents[text] = caller.response.json()
+            self._put_cached(kind, text, contents[text])
+
+        return [normalization(api = self, json = contents[text]) for text in texts], callers
+
+    async def _normalize(self, kind: str, text: str) -> tuple:
+        content = self._get_cached(kind, text)
+        if content is not None:
+            return NORMALIZATIONS[kind](api = self, json = content), None
+
+        caller = await self._send(kind, text)
+        self._put_cached(kind, text, caller.response.json())
+
+        return NORMALIZATIONS[kind](api = self, json = caller.response.json()), caller
+
+    async def _send(self, kind: str, text: str) -> AsyncApiCall:
+        caller = self._call.new(method = 'POST', path = f'normalize/{kind}')
+        caller.add_body(key = 'text', value = text)
+        await caller.send()
+
+        return caller
+
+    def _get_cached(self, kind: str, text: str):
+        if self.cache is None:
+            return None
+
+        return self.cache.get(kind, NormalizationCache.sha256(text))
+
+    def _put_cached(self, kind: str, text: str, content: dict) -> None:
+        if self.cache is not None:
+            self.cache.put(kind, NormalizationCache.sha256(text), content)
@@ -0,0 +1,170 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import os
+from typing import BinaryIO, List, Tuple, Union
+
+from .asyncapicall import AsyncApiCall
+from .batching import get_statuses
+from ..api.batching import DEFAULT_BATCH_SIZE, DEFAULT_MAX_WORKERS
+from ..api.download import save
+from ..models.download import Download
+from ..models.ocr_request import OCRRequest
+
+
+class AsyncOCRAPI(object):
+    """
+    AsyncOCRAPI contains the awaitable functionality accepted by the OCR Microservice
+    """
+
+    def __init__(self, token: str, url: str, **kwargs):
+        """
+        :param kwargs: Passed through to the AsyncApiCall (e.g. the shared session)
+        """
+        self._call = AsyncApiCall(token, url, **kwargs)
+
+    async def create(self, file_ids: List[str], generate_layout: bool = None) -> Tuple[List[OCRRequest], AsyncApiCall]:
+        """
+        Creates a new OCR request for the file ids provided.
+
+        :return:
+        """
+        caller = self._call.new(method = 'POST', path = 'ocr')
+        caller.add_body(key = 'file_ids', value = file_ids)
+        if generate_layout != None:
+            caller.add_body(key = 'layout', value = generate_layout)
+
+        await caller.send()
+
+        return [OCRRequest(api = self, json = c) for c in caller.response.json().get('file_ids')], caller
+
+    async def get(self, request_id: str) -> Tuple[OCRRequest, AsyncApiCall]:
+        """
+        Gets the OCR status for the request_id.
+
+        :return:
+        """
+        caller = self._call.new(method = 'GET', path = f'ocr/{request_id}')
+        await caller.send()
+
+        return OCRRequest(api = self, json = caller.response.json()), caller
+
+    async def get_multiple(self, request_ids: List[str]) -> Tuple[List[OCRRequest], AsyncApiCall]:
+        """
+        Gets multiple OCR statuses, in a single call. See get_multiple_batched for many request ids.
+        """
+        requests, callers = await self.get_multiple_batched(request_ids, batch_size = max(len(request_ids), 1))
+
+        return requests, callers[0]
+
+    async def get_multiple_batched(self, request_ids: List[str], batch_size: int = DEFAULT_BATCH_SIZE,
+                                   max_workers: int = DEFAULT_MAX_WORKERS) -> Tuple[List[OCRRequest], List[AsyncApiCall]]:
+        """
+        Gets multiple OCR statuses
+
+        The request ids are sent in batches of at most batch_size ids, with up to max_workers batches in
+        flight at once. The statuses are returned in the order of request_ids, along with the AsyncApiCalls
+        (one per batch).
+        """
+        statuses, callers = await get_statuses(self._call, 'ocrs', request_ids,
+                                               batch_size = batch_size, max_workers = max_workers)
+
+        ocr_requests = []
+
+        for request_id, result in statuses:
+            result['request_id'] = request_id
+            ocr_requests.append(OCRRequest(api = self, json = result))
+
+        return ocr_requests, callers
+
+    async def get_text(self, request_id: str) -> Tuple[dict, AsyncApiCall]:
+        """
+        Gets the OCR text for the request_id.
+
+        :return:
+        """
+        caller = self._call.new(method = 'GET', path = f'ocr/{request_id}/text')
+        await caller.send()
+
+        return caller.response.json(), caller
+
+    async def get_images(self, request_id: str) -> AsyncApiCall:
+        """
+        Gets the bytes of a .zip package which contains all of the images.
+
+        :return:
+        """
+        caller = self._call.new(method = 'GET', path = f'ocr/{request_id}/images')
+        await caller.send()
+
+        return caller
+
+    async def get_eocr(self, request_id: str) -> AsyncApiCall:
+        """
+        Gets the file's layout in eOCR format
+
+        :return:
+        """
+        caller = self._call.new(method = 'GET', path = f'ocr/{request_id}/eocr')
+        await caller.send()
+
+        return caller
+
+    async def get_layouts(self, request_id: str) -> AsyncApiCall:
+        """
+        Gets the file's protobuf layout
+
+        :return:
+        """
+        caller = self._call.new(method = 'GET', path = f'ocr/{request_id}/layouts')
+        await caller.send()
+
+        return caller
+
+    async def download_images(self, request_id: str, destination: Union[str, os.PathLike, BinaryIO],
+                              sha256: str = None) -> Tuple[Download, AsyncApiCall]:
+        """
+        Writes the .zip package which contains all of the images to a path or binary file object.
+        Unlike OCRAPI.download_images, the package is received in full before it is written.
+
+        :param sha256: The expected SHA-256 hex digest of the package. If provided, it is checked once downloaded.
+        :return:
+        """
+        return await self._download(f'ocr/{request_id}/images', destination, sha256)
+
+    async def download_eocr(self, request_id: str, destination: Union[str, os.PathLike, BinaryIO],
+                            sha256: str = None) -> Tuple[Download, AsyncApiCall]:
+        """
+        Writes the file's layout in eOCR format to a path or binary file object. See download_images.
+        """
+        return await self._download(f'ocr/{request_id}/eocr', destination, sha256)
+
+    async def download_layouts(self, request_id: str, destination: Union[str, os.PathLike, BinaryIO],
+                               sha256: str = None) -> Tuple[Download, AsyncApiCall]:
+        """
+        Writes the file's protobuf layout to a path or binary file object. See download_images.
+        """
+        return await self._download(f'ocr/{request_id}/layouts', destination, sha256)
+
+    async def _download(self, path: str, destination, sha256: str) -> Tuple[Download, AsyncApiCall]:
+        caller = self._call.new(method = 'GET', path = path)
+        await caller.send()
+
+        # Writing to the destination is done off the event loop.
+        download = await asyncio.get_running_loop().run_in_executor(
+            None, save, path, caller.response.content, destination, sha256)
+
+        return download, caller
@@ -0,0 +1,73 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - aiohttp is an optional dependency
+    aiohttp = None
+
+
+def _require_aiohttp():
+    if aiohttp is None:
+        raise ImportError('The asynchronous SDK requires aiohttp. Install it using: pip3 install zdai[async]')
+
+
+class AsyncSession(object):
+    """
+    AsyncSession holds the connection-pooled aiohttp.ClientSession shared by every asynchronous API class.
+
+    The aiohttp.ClientSession is bound to an event loop, so it is only created the first time a call is made.
+    """
+
+    def __init__(self, session: 'aiohttp.ClientSession' = None,
+                 limit: int = 100,
+                 limit_per_host: int = 10,
+                 keep_alive: bool = True,
+                 keepalive_timeout: float = 15.0):
+        """
+        :param session: An existing aiohttp.ClientSession to use instead of creating one.
+        :param limit: The maximum number of simultaneous connections.
+        :param limit_per_host: The maximum number of simultaneous connections per host.
+        :param keep_alive: Whether connections are kept alive between calls.
+        :param keepalive_timeout: The number of seconds an idle connection is kept alive.
+        """
+        _require_aiohttp()
+        self._session = session
+        self._owns_session = session is None
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keep_alive = keep_alive
+        self.keepalive_timeout = keepalive_timeout
+
+    def get(self) -> 'aiohttp.ClientSession':
+        """
+        Returns the aiohttp.ClientSession, creating it if needed. Must be called from within the event loop.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit = self.limit,
+                                             limit_per_host = self.limit_per_host,
+                                             force_close = not self.keep_alive,
+                                             keepalive_timeout = self.keepalive_timeout if self.keep_alive else None)
+            self._session = aiohttp.ClientSession(connector = connector)
+            self._owns_session = True
+
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Closes the pooled connections, if the aiohttp.ClientSession was created by the AsyncSession
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
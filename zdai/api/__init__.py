@@ -10,3 +10,7 @@ from .languageapi import LanguageAPI
 from .ocrapi import OCRAPI
 from .mlcapi import MLCAPI
 from .normalizationapi import NormalizationAPI
+from .session import create_session
+from .retry import RetryPolicy
+from .ratelimiter import RateLimiter, TokenBucket
+from .concurrency import ConcurrencyController
@@ -12,11 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+
 import requests
 from requests import Response
 
 from .apiendpoint import ApiEndpoint
+from .concurrency import ConcurrencyController
 from .exceptions import *
+from .ratelimiter import RateLimiter
+from .retry import RetryPolicy
 
 
 class ApiCall(ApiEndpoint):
@@ -24,9 +29,19 @@ class ApiCall(ApiEndpoint):
     ApiCall class contains data relating to an ApiEndpoint's call.
     """
 
-    def __init__(self, token=None, url=None, method=None, path=None):
+    def __init__(self, token=None, url=None, method=None, path=None, session: requests.Session = None,
+                 retry_policy: RetryPolicy = None, rate_limiter: RateLimiter = None,
+                 concurrency_controller: ConcurrencyController = None):
         super().__init__(token = token, url = url)
         self._response = None
+        self.session = session
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.concurrency_controller = concurrency_controller
+        self.stream = False
+        self.attempts = 0
+        self._body_position = None
+        self._held_slot = None
 
         if method: self.method = method
         if path: self.path = path
@@ -36,7 +51,9 @@ class ApiCall(ApiEndpoint):
         return f'{self.__class__.__name__}({data})'
 
     def new(self, method: str, path: str) -> 'ApiCall':
-        return ApiCall(token = self.token, url = self.url, method = method, path = path)
+        return ApiCall(token = self.token, url = self.url, method = method, path = path, session = self.session,
+                       retry_policy = self.retry_policy, rate_limiter = self.rate_limiter,
+                       concurrency_controller = self.concurrency_controller)
 
     @property
     def response(self) -> Response:
@@ -82,20 +99,138 @@ class ApiCall(ApiEndpoint):
                 raise ApiCallTooManyRequestsError(self)
             elif self.response.status_code == 500:
                 raise ApiCallInternalServerError(self)
+            elif self.response.status_code == 502:
+                raise ApiCallBadGatewayError(self)
+            elif self.response.status_code == 503:
+                raise ApiCallServiceUnavailableError(self)
+            elif self.response.status_code == 504:
+                raise ApiCallGatewayTimeoutError(self)
             else:
                 raise Exception(f'HTTP Error: {e}')
-        except Exception as e:
-            raise Exception(f'Exception: {e}')
 
     def send(self) -> None:
         """
-        Calls the API Endpoint
+        Calls the API Endpoint, using the shared session's connection pool if one was provided.
+        If stream is set, the response's content is not downloaded until it is read, and the concurrency
+        controller's slot is held until close() is called.
+        Failed attempts are retried according to the retry policy, if one was provided, and every
+        attempt waits for the rate limiter and for a slot of the concurrency controller, if provided.
         :return:
         """
-        self.response = requests.request(method = self.method,
-                                         params = self.parameters,
-                                         headers = self.headers,
-                                         url = self.uri,
-                                         data = self.body)
+        self.attempts = 0
+        self._body_position = self._tell_body()
+
+        while True:
+            self.attempts += 1
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self.path)
+
+            if self.concurrency_controller is not None:
+                self.concurrency_controller.acquire()
+
+            start = time.monotonic()
+
+            try:
+                self._send()
+            except BaseException as e:
+                self._release_slot(start, exception = e)
+
+                if not isinstance(e, Exception) or not self._should_retry(exception = e):
+                    raise
+
+                time.sleep(self.retry_policy.get_delay(self.attempts))
+                continue
+
+            if not self._should_retry():
+                if self.stream and self.concurrency_controller is not None and self.response.ok:
+                    # The content is still to be read: the slot is held until close()
+                    self._held_slot = start
+                else:
+                    self._release_slot(start)
+                break
+
+            self._release_slot(start)
+            self.response.close()
+            time.sleep(self.retry_policy.get_delay(self.attempts, self.response))
 
         self._check_for_exception()
+
+    def close(self) -> None:
+        """
+        Closes the response, and frees the concurrency controller's slot held by a streamed response, if any.
+        The latency reported is the time taken to read the content.
+        :return:
+        """
+        if self.response is not None:
+            self.response.close()
+
+        if self._held_slot is not None:
+            start, self._held_slot = self._held_slot, None
+            self._release_slot(start)
+
+    def _send(self) -> None:
+        requester = self.session if self.session is not None else requests
+
+        self.response = requester.request(method = self.method,
+                                          params = self.parameters,
+                                          headers = self.headers,
+                                          url = self.uri,
+                                          data = self.body,
+                                          stream = self.stream)
+
+    def _release_slot(self, start: float, exception: Exception = None) -> None:
+        """
+        Returns the concurrency controller's slot taken by the latest attempt, if any, reporting its latency and
+        whether the server signalled that it is overloaded.
+
+        :param start: The time.monotonic() at which the attempt started
+        :param exception: The exception raised by the latest attempt, if any. Otherwise, the response is checked.
+        :return:
+        """
+        if self.concurrency_controller is None:
+            return
+
+        overloaded = self.concurrency_controller.is_overloaded(response = self.response if exception is None else None,
+                                                               exception = exception)
+        self.concurrency_controller.release(time.monotonic() - start, overloaded = overloaded)
+
+    def _tell_body(self):
+        """
+        Returns the position of the body, if it is a seekable stream, so that it can be rewound between attempts.
+        """
+        try:
+            return self._body.tell() if hasattr(self._body, 'read') and self._body.seekable() else None
+        except (AttributeError, OSError):
+            return None
+
+    def _rewind_body(self) -> bool:
+        """
+        Prepares the body to be sent again. Returns False if the body is a stream that cannot be replayed.
+        """
+        if hasattr(self._body, 'read'):
+            if self._body_position is None:
+                return False
+
+            self._body.seek(self._body_position)
+            return True
+
+        # Unlike iterators of chunks, bytes, strings and dictionaries can be sent again as they are.
+        return isinstance(self._body, (bytes, bytearray, memoryview, str, dict, list, tuple))
+
+    def _should_retry(self, exception: Exception = None) -> bool:
+        """
+        Returns whether the latest attempt failed in a way the retry policy allows to be retried.
+
+        :param exception: The exception raised by the latest attempt, if any. Otherwise, the response is checked.
+        :return:
+        """
+        if self.retry_policy is None:
+            return False
+
+        if exception is not None:
+            retryable = self.retry_policy.is_retryable_exception(self.method, self.attempts, exception)
+        else:
+            retryable = self.retry_policy.is_retryable_response(self.method, self.attempts, self.response)
+
+        return retryable and self._rewind_body()
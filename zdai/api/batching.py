@@ -0,0 +1,86 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+from .apicall import ApiCall
+
+# The number of request ids sent per batch status call, which keeps the query string well below
+# the URL length limits of servers and proxies.
+DEFAULT_BATCH_SIZE = 100
+
+# The number of batch status calls sent at once, over the shared connection pool.
+DEFAULT_MAX_WORKERS = 4
+
+
+def chunk_ids(request_ids: Sequence[str], batch_size: int) -> List[List[str]]:
+    """
+    Splits the request ids into batches of at most batch_size ids, dropping duplicates
+    and keeping the order in which the ids were provided.
+    """
+    if batch_size < 1:
+        raise ValueError(f'batch_size must be at least 1, not {batch_size}')
+
+    unique = list(dict.fromkeys(request_ids))
+    return [unique[i:i + batch_size] for i in range(0, len(unique), batch_size)]
+
+
+def merge_statuses(request_ids: Sequence[str], statuses: List[Dict[str, dict]]) -> List[Tuple[str, dict]]:
+    """
+    Merges the statuses returned for each batch into (request id, status) pairs, in the order in which the
+    request ids were provided. Statuses for ids that weren't asked for are kept, at the end.
+    """
+    merged = {}
+    for batch in statuses:
+        merged.update(batch)
+
+    ordered = [(request_id, merged.pop(request_id)) for request_id in dict.fromkeys(request_ids)
+               if request_id in merged]
+
+    return ordered + list(merged.items())
+
+
+def get_statuses(call: ApiCall, path: str, request_ids: Sequence[str],
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_workers: int = DEFAULT_MAX_WORKERS) -> Tuple[List[Tuple[str, dict]], List[ApiCall]]:
+    """
+    Obtains the statuses of the request ids from a batch status endpoint (e.g. ocrs, extractions), splitting them
+    into batches of batch_size ids that are sent in parallel.
+
+    :param call: The API class' ApiCall, whose session, retry policy, etc. are used by every batch
+    :param path: The batch status endpoint
+    :param request_ids: The request ids
+    :param batch_size: The maximum number of request ids sent per call
+    :param max_workers: The maximum number of calls sent at once
+    :return: The (request id, status) pairs in the order of request_ids, and the ApiCalls (one per batch)
+    """
+    batches = chunk_ids(request_ids, batch_size) or [[]]
+
+    def send(batch: List[str]) -> ApiCall:
+        caller = call.new(method = 'GET', path = path)
+        caller.add_parameter('request_id', batch)
+        caller.send()
+
+        return caller
+
+    if len(batches) == 1 or max_workers <= 1:
+        callers = [send(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers = min(max_workers, len(batches))) as executor:
+            callers = list(executor.map(send, batches))
+
+    statuses = merge_statuses(request_ids, [caller.response.json().get('statuses') for caller in callers])
+
+    return statuses, callers
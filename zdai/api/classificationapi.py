@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import Future
 from typing import List, Tuple
 
 from ..api.apicall import ApiCall
+from ..api.batching import DEFAULT_BATCH_SIZE, DEFAULT_MAX_WORKERS, get_statuses
+from ..JobTracker import RequestPoller
 from ..models.document_classification_request import DocumentClassificationRequest
 
 
@@ -23,8 +26,24 @@ class ClassificationAPI(object):
     ClassificationAPI contains the functionality accepted by the Classification Microservice
     """
 
-    def __init__(self, token: str, url: str):
-        self._call = ApiCall(token, url)
+    def __init__(self, token: str, url: str, poller: RequestPoller = None, **kwargs):
+        """
+        :param poller: The RequestPoller that resolves the Futures returned by submit(). Created when first needed,
+                       if not provided.
+        :param kwargs: Passed through to the ApiCall (e.g. the shared session)
+        """
+        self._call = ApiCall(token, url, **kwargs)
+        self._poller = poller
+
+    @property
+    def poller(self) -> RequestPoller:
+        """
+        Returns the RequestPoller that resolves the Futures returned by submit()
+        """
+        if self._poller is None:
+            self._poller = RequestPoller()
+
+        return self._poller
 
     def create(self, file_ids: List[str]) -> Tuple[List[DocumentClassificationRequest], ApiCall]:
         """
@@ -38,6 +57,18 @@ class ClassificationAPI(object):
 
         return [DocumentClassificationRequest(api = self, json = c) for c in caller.response.json().get('file_ids')], caller
 
+    def submit(self, file_ids: List[str]) -> Tuple[List[Future], ApiCall]:
+        """
+        Creates a new classification request for the file ids provided, without waiting for them to finish.
+        Returns one Future per file id, which resolves to the finished DocumentClassificationRequest.
+        See RequestPoller.
+
+        :return:
+        """
+        requests, caller = self.create(file_ids = file_ids)
+
+        return [self.poller.submit(request) for request in requests], caller
+
     def get(self, request_id: str) -> Tuple[DocumentClassificationRequest, ApiCall]:
         """
         Gets the Classification data for the request_id.
@@ -51,17 +82,28 @@ class ClassificationAPI(object):
 
     def get_multiple(self, request_ids: List[str]) -> Tuple[List[DocumentClassificationRequest], ApiCall]:
         """
+        Gets multiple Classification statuses, in a single call. See get_multiple_batched for many request ids.
+        """
+        requests, callers = self.get_multiple_batched(request_ids, batch_size = max(len(request_ids), 1))
+
+        return requests, callers[0]
+
+    def get_multiple_batched(self, request_ids: List[str], batch_size: int = DEFAULT_BATCH_SIZE,
+                             max_workers: int = DEFAULT_MAX_WORKERS) -> Tuple[List[DocumentClassificationRequest], List[ApiCall]]:
+        """
         Gets multiple Classification statuses
 
+        The request ids are sent in batches of at most batch_size ids, with up to max_workers batches in
+        flight at once. The statuses are returned in the order of request_ids, along with the ApiCalls
+        (one per batch).
         """
-        caller = self._call.new(method= 'GET', path=f'classifications')
-        caller.add_parameter('request_id', request_ids)
-        caller.send()
+        statuses, callers = get_statuses(self._call, 'classifications', request_ids,
+                                         batch_size = batch_size, max_workers = max_workers)
 
         classification_requests = []
 
-        for request_id, result in caller.response.json().get('statuses').items():
+        for request_id, result in statuses:
             result['request_id'] = request_id
             classification_requests.append(DocumentClassificationRequest(api = self, json = result))
 
-        return classification_requests, caller
+        return classification_requests, callers
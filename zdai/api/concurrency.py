@@ -0,0 +1,270 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import List, Tuple
+
+import requests
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - aiohttp is an optional dependency
+    aiohttp = None
+
+
+class ConcurrencyController(object):
+    """
+    ConcurrencyController limits the number of calls in flight using an AIMD (additive increase,
+    multiplicative decrease) window: the window grows by `increase` every time a window's worth of calls
+    complete with a stable latency, and is cut by `decrease_factor` when the server signals that it is
+    overloaded (429, 5xx or a timeout).
+
+    Every ApiCall sharing the controller waits for a slot before each attempt, so any thread pool built on
+    the SDK adapts to the server's capacity as long as it has at least `max_limit` workers.
+
+    Example:
+        controller = ConcurrencyController(initial_limit = 4, max_limit = 64)
+        sdk = ZDAISDK(from_config = True, concurrency_controller = controller, pool_maxsize = 64)
+
+        with ThreadPoolExecutor(max_workers = controller.max_limit) as executor:
+            executor.map(lambda text: sdk.normalization.get_dates(text), texts)
+
+        print(controller.limit, controller.history[-5:])
+    """
+
+    overload_status_codes = frozenset([429, 500, 502, 503, 504])
+
+    def __init__(self,
+                 initial_limit: int = 4,
+                 min_limit: int = 1,
+                 max_limit: int = 64,
+                 increase: float = 1.0,
+                 decrease_factor: float = 0.5,
+                 latency_tolerance: float = 2.0,
+                 history_size: int = 1000):
+        """
+        :param initial_limit: The number of calls allowed in flight at first.
+        :param min_limit: The lowest the window can be cut to.
+        :param max_limit: The highest the window can grow to.
+        :param increase: The number of slots added once a window's worth of calls succeeded with a stable latency.
+        :param decrease_factor: The factor the window is multiplied by when the server is overloaded.
+        :param latency_tolerance: Latency is stable while it stays under this multiple of the baseline latency.
+        :param history_size: The number of window changes kept in the history.
+        """
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f'The decrease_factor must be between 0 and 1. Input: {decrease_factor}')
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._latency = None
+        self._baseline = None
+        self._last_decrease = 0.0
+        self._history = deque(maxlen = history_size)
+        self._condition = threading.Condition()
+        self._async_waiters = deque()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(limit={self.limit}, in_flight={self.in_flight}, ' \
+               f'min_limit={self.min_limit}, max_limit={self.max_limit})'
+
+    @property
+    def limit(self) -> int:
+        """
+        Returns the current window: the number of calls allowed in flight
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Returns the number of calls currently in flight
+        """
+        return self._in_flight
+
+    @property
+    def latency(self) -> float:
+        """
+        Returns the smoothed latency of the recent calls, in seconds
+        """
+        return self._latency
+
+    @property
+    def history(self) -> List[Tuple[float, int, str]]:
+        """
+        Returns the window changes as (time.time(), limit, reason) tuples, oldest first
+        """
+        with self._condition:
+            return list(self._history)
+
+    def acquire(self) -> None:
+        """
+        Blocks until a call may be made
+        """
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+
+            self._in_flight += 1
+
+    def try_acquire(self) -> bool:
+        """
+        Takes a slot if one is free, without blocking. Returns whether a slot was taken.
+        """
+        with self._condition:
+            if self._in_flight >= self.limit:
+                return False
+
+            self._in_flight += 1
+            return True
+
+    async def acquire_async(self) -> None:
+        """
+        Waits for a slot without blocking the event loop. Waiting coroutines are handed the freed slots
+        in the order they arrived.
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._condition:
+            if self._in_flight < self.limit and not self._async_waiters:
+                self._in_flight += 1
+                return
+
+            waiter = loop.create_future()
+            self._async_waiters.append((loop, waiter))
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._condition:
+                try:
+                    self._async_waiters.remove((loop, waiter))
+                except ValueError:
+                    # A slot was handed over before the cancellation: give it back
+                    self._in_flight -= 1
+                    self._wake_waiters()
+            raise
+
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        """
+        Frees a slot and adjusts the window.
+
+        :param latency: The number of seconds the call took
+        :param overloaded: Whether the server signalled that it is overloaded
+        :return:
+        """
+        with self._condition:
+            self._in_flight -= 1
+
+            if overloaded:
+                self._on_overload()
+            else:
+                self._on_success(latency)
+
+            self._wake_waiters()
+
+    def is_overloaded(self, response=None, exception: Exception = None) -> bool:
+        """
+        Returns whether the response or exception of a call signals that the server is overloaded
+        """
+        if exception is not None:
+            timeouts = (requests.exceptions.Timeout, asyncio.TimeoutError)
+            if aiohttp is not None:
+                timeouts += (aiohttp.ServerTimeoutError,)
+
+            return isinstance(exception, timeouts)
+
+        return response is not None and response.status_code in self.overload_status_codes
+
+    @contextmanager
+    def slot(self):
+        """
+        Context manager that holds a slot for the duration of a call. Exceptions count as overloads
+        if they are timeouts, or ApiCallErrors raised for one of the overload status codes.
+        """
+        self.acquire()
+        start = time.monotonic()
+        overloaded = False
+
+        try:
+            yield
+        except Exception as e:
+            call = getattr(e, 'call', None)
+            overloaded = self.is_overloaded(exception = e) or \
+                         self.is_overloaded(response = getattr(call, 'response', None))
+            raise
+        finally:
+            self.release(time.monotonic() - start, overloaded = overloaded)
+
+    def _wake_waiters(self) -> None:
+        # Called with the condition held: hands the free slots to the waiting coroutines first, in order,
+        # then lets the waiting threads compete for the rest.
+        while self._async_waiters and self._in_flight < self.limit:
+            loop, waiter = self._async_waiters.popleft()
+            self._in_flight += 1
+
+            try:
+                loop.call_soon_threadsafe(_grant, waiter)
+            except RuntimeError:
+                # The waiter's event loop is closed
+                self._in_flight -= 1
+
+        self._condition.notify_all()
+
+    def _on_success(self, latency: float) -> None:
+        self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+
+        # The baseline follows the lowest latency seen, but drifts towards the recent latency so that
+        # a lasting change in the server's speed eventually becomes the new normal.
+        if self._baseline is None or self._latency < self._baseline:
+            self._baseline = self._latency
+        else:
+            self._baseline += (self._latency - self._baseline) * 0.01
+
+        if latency > self._baseline * self.latency_tolerance or self._limit >= self.max_limit:
+            return
+
+        previous = self.limit
+        self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+
+        if self.limit != previous:
+            self._history.append((time.time(), self.limit, 'increase'))
+
+    def _on_overload(self) -> None:
+        # Calls that were in flight together tend to fail together: only cut the window once per round trip.
+        now = time.monotonic()
+        if now - self._last_decrease < (self._latency or 0.0):
+            return
+
+        self._last_decrease = now
+        previous = self.limit
+        self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+
+        if self.limit != previous:
+            self._history.append((time.time(), self.limit, 'decrease'))
+
+
+def _grant(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
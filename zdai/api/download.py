@@ -0,0 +1,227 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import hashlib
+import os
+import re
+import uuid
+from typing import BinaryIO, Callable, Iterator, Union
+
+import requests
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+from .apicall import ApiCall
+from .exceptions import ApiDownloadIntegrityError
+from ..models.download import Download
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# The start of the range in a 206 response's Content-Range header (e.g. bytes 1024-2047/4096)
+_CONTENT_RANGE = re.compile(r'bytes\s+(\d+)-')
+
+# The exceptions raised when the connection drops while the response's content is being read
+_STREAM_ERRORS = (requests.exceptions.ChunkedEncodingError,
+                  requests.exceptions.ConnectionError,
+                  Urllib3HTTPError)
+
+
+def iter_download(caller: ApiCall,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  resume: bool = True,
+                  max_resumes: int = 5) -> Iterator[bytes]:
+    """
+    Sends the caller and yields the response's content in chunks, holding at most one chunk in memory.
+
+    If the connection drops, the download is resumed from where it stopped using a Range request. If the server
+    ignores the Range header, the part that was already received is skipped. Once the content ends, its length is
+    checked against the Content-Length announced by the server.
+
+    The content is requested without compression (Accept-Encoding: identity), so that the bytes received are the
+    bytes the Range header counts. A response compressed anyway is not resumed.
+
+    :param caller: The ApiCall of the download (e.g. GET ocr/{request_id}/images), not sent yet
+    :param chunk_size: The number of bytes read at a time
+    :param resume: Whether to resume the download if the connection drops
+    :param max_resumes: The maximum number of times the download is resumed
+    :return:
+    """
+    caller.stream = True
+    caller.add_header(key = 'Accept-Encoding', value = 'identity')
+    caller.send()
+
+    resume = resume and _is_identity(caller.response)
+    expected = _content_length(caller.response)
+    received = 0
+    resumes = 0
+    current = caller
+    response = caller.response
+
+    try:
+        while True:
+            skip = received
+
+            if response.status_code == 206:
+                start = _range_start(current)
+                if start > received:
+                    raise ApiDownloadIntegrityError(caller.path, f'the resumed content starts at byte {start}, '
+                                                                 f'after the {received} bytes received')
+                skip = received - start
+
+            try:
+                for chunk in response.iter_content(chunk_size = chunk_size):
+                    if skip:
+                        if len(chunk) <= skip:
+                            skip -= len(chunk)
+                            continue
+
+                        chunk, skip = chunk[skip:], 0
+
+                    received += len(chunk)
+                    yield chunk
+                break
+            except _STREAM_ERRORS:
+                if not resume or resumes >= max_resumes:
+                    raise
+
+                resumes += 1
+                current.close()
+
+                current = caller.new(method = caller.method, path = caller.path)
+                current.stream = True
+                current.add_header(key = 'Accept-Encoding', value = 'identity')
+                current.add_header(key = 'Range', value = f'bytes={received}-')
+                current.send()
+                response = current.response
+
+                if not _is_identity(response):
+                    raise ApiDownloadIntegrityError(caller.path, 'the resumed content is compressed')
+    finally:
+        # Frees the concurrency controller's slot, held while the content is read
+        current.close()
+
+    if expected is not None and received != expected:
+        raise ApiDownloadIntegrityError(caller.path, f'received {received} bytes, expected {expected}')
+
+
+def download(caller: ApiCall,
+             destination: Union[str, os.PathLike, BinaryIO],
+             chunk_size: int = DEFAULT_CHUNK_SIZE,
+             sha256: str = None,
+             resume: bool = True,
+             max_resumes: int = 5) -> Download:
+    """
+    Sends the caller and writes the response's content to the destination in chunks.
+
+    :param caller: The ApiCall of the download (e.g. GET ocr/{request_id}/images), not sent yet
+    :param destination: The path to write the content to, or a binary file object
+    :param chunk_size: The number of bytes read at a time
+    :param sha256: The expected SHA-256 hex digest of the content. If provided, it is checked once downloaded.
+    :param resume: Whether to resume the download if the connection drops
+    :param max_resumes: The maximum number of times the download is resumed
+    :return:
+    """
+    digest = hashlib.sha256()
+    size = 0
+
+    def write(f):
+        nonlocal size
+        for chunk in iter_download(caller, chunk_size = chunk_size, resume = resume, max_resumes = max_resumes):
+            f.write(chunk)
+            digest.update(chunk)
+            size += len(chunk)
+
+        if sha256 is not None and digest.hexdigest() != sha256.lower():
+            raise ApiDownloadIntegrityError(caller.path, f'SHA-256 {digest.hexdigest()} does not match {sha256}')
+
+    _write(destination, write)
+
+    return Download(destination = destination, size = size, sha256 = digest.hexdigest())
+
+
+def save(path: str, content: bytes, destination: Union[str, os.PathLike, BinaryIO], sha256: str = None) -> Download:
+    """
+    Writes content that was already received (e.g. by an AsyncApiCall) to the destination, the way download() does.
+
+    :param path: The path of the API endpoint the content comes from, used in the errors
+    :param content: The content received
+    :param destination: The path to write the content to, or a binary file object
+    :param sha256: The expected SHA-256 hex digest of the content. If provided, it is checked before writing.
+    :return:
+    """
+    digest = hashlib.sha256(content).hexdigest()
+
+    if sha256 is not None and digest != sha256.lower():
+        raise ApiDownloadIntegrityError(path, f'SHA-256 {digest} does not match {sha256}')
+
+    _write(destination, lambda f: f.write(content))
+
+    return Download(destination = destination, size = len(content), sha256 = digest)
+
+
+def _write(destination: Union[str, os.PathLike, BinaryIO], write: Callable[[BinaryIO], None]) -> None:
+    """
+    Calls write with the destination file object. A path destination is written to a temporary file next to it,
+    which replaces the destination only once write returns, so that a failed download never leaves a partial file.
+    """
+    if hasattr(destination, 'write'):
+        write(destination)
+        return
+
+    destination = os.fspath(destination)
+    temporary = f'{destination}.{uuid.uuid4().hex}.part'
+
+    try:
+        with open(temporary, 'xb') as f:
+            write(f)
+
+        os.replace(temporary, destination)
+    except BaseException:
+        try:
+            os.remove(temporary)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _is_identity(response) -> bool:
+    """
+    Returns whether the response's content is sent as is. Content that is compressed in transit is decoded while
+    being read, so the number of bytes read doesn't match the Content-Length, nor the offsets of a Range request.
+    """
+    return response.headers.get('Content-Encoding', 'identity').lower() == 'identity'
+
+
+def _range_start(caller: ApiCall) -> int:
+    """
+    Returns the offset the content of a 206 (Partial Content) response starts at
+    """
+    match = _CONTENT_RANGE.match(caller.response.headers.get('Content-Range', ''))
+    if match is None:
+        raise ApiDownloadIntegrityError(caller.path, 'the resumed content has no Content-Range')
+
+    return int(match.group(1))
+
+
+def _content_length(response) -> int:
+    """
+    Returns the number of bytes the response's content should contain, if known (see _is_identity)
+    """
+    if not _is_identity(response):
+        return None
+
+    try:
+        return int(response.headers['Content-Length'])
+    except (KeyError, ValueError):
+        return None
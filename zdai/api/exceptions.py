@@ -93,6 +93,30 @@ class ApiCallInternalServerError(ApiCallError):
         super().__init__(call)
 
 
+class ApiCallBadGatewayError(ApiCallError):
+    def __init__(self, call):
+        self.call = call
+        self.error_code, self.error_message = _get_error_data(call.response.content)
+        self.formatted_message = f'Bad Gateway: {self.error_code}: {self.error_message}'
+        super().__init__(call)
+
+
+class ApiCallServiceUnavailableError(ApiCallError):
+    def __init__(self, call):
+        self.call = call
+        self.error_code, self.error_message = _get_error_data(call.response.content)
+        self.formatted_message = f'Service Unavailable: {self.error_code}: {self.error_message}'
+        super().__init__(call)
+
+
+class ApiCallGatewayTimeoutError(ApiCallError):
+    def __init__(self, call):
+        self.call = call
+        self.error_code, self.error_message = _get_error_data(call.response.content)
+        self.formatted_message = f'Gateway Timeout: {self.error_code}: {self.error_message}'
+        super().__init__(call)
+
+
 class ApiNoTokenError(Exception):
     def __init__(self):
         message = 'No token provided'
@@ -109,3 +133,15 @@ class ApiNoAccessProvidedError(Exception):
     def __init__(self, url: str, token: str):
         message = f'No Access Provided: A token and url are required. [URL: {url}, Token: {token}]'
         super().__init__(message)
+
+
+class ApiDownloadIntegrityError(Exception):
+    def __init__(self, path: str, message: str):
+        self.path = path
+        super().__init__(f'Download of {path} failed its integrity check: {message}')
+
+
+class ApiRequestFailedError(Exception):
+    def __init__(self, request):
+        self.request = request
+        super().__init__(f'{request.type} {request.id} failed: {request.json()}')
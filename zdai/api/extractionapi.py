@@ -12,16 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Tuple
+from concurrent.futures import Future
+from typing import Iterator, List, Tuple
 
 from .apicall import ApiCall
+from .batching import DEFAULT_BATCH_SIZE, DEFAULT_MAX_WORKERS, get_statuses
+from .download import iter_download
+from .resultdecoder import decode_answers, decode_result, decode_results, iter_result_items, loads
+from ..JobTracker import RequestPoller
 from ..models.field_extraction_request import FieldExtractionRequest
-from ..models.field_extraction_result import BoundingBoxesByPage, FieldExtractionResult, \
-    FieldExtractionResultDefinedTerm, FieldExtractionResultSpan, DurationNormalizedValues, \
-    CurrencyNormalizedValues, DateNormalizedValues
+from ..models.field_extraction_result import FieldExtractionResult
 from ..models.field_extraction_answer import FieldExtractionAnswer
-import json
-from types import SimpleNamespace
+
+# The number of bytes of the results read at a time by iter_results
+RESULTS_CHUNK_SIZE = 64 * 1024
 
 
 class ExtractionAPI(object):
@@ -29,8 +33,24 @@ class ExtractionAPI(object):
     ExtractionAPI contains the functionality accepted by the Extraction Microservice
     """
 
-    def __init__(self, token: str, url: str):
-        self._call = ApiCall(token, url)
+    def __init__(self, token: str, url: str, poller: RequestPoller = None, **kwargs):
+        """
+        :param poller: The RequestPoller that resolves the Futures returned by submit(). Created when first needed,
+                       if not provided.
+        :param kwargs: Passed through to the ApiCall (e.g. the shared session)
+        """
+        self._call = ApiCall(token, url, **kwargs)
+        self._poller = poller
+
+    @property
+    def poller(self) -> RequestPoller:
+        """
+        Returns the RequestPoller that resolves the Futures returned by submit()
+        """
+        if self._poller is None:
+            self._poller = RequestPoller()
+
+        return self._poller
 
     def create(self, file_ids: List[str], field_ids: List[str]) -> Tuple[List[FieldExtractionRequest], ApiCall]:
         """
@@ -45,6 +65,20 @@ class ExtractionAPI(object):
 
         return [FieldExtractionRequest(api=self, json=c) for c in caller.response.json().get('file_ids')], caller
 
+    def submit(self, file_ids: List[str], field_ids: List[str],
+               fetch_results: bool = False) -> Tuple[List[Future], ApiCall]:
+        """
+        Creates a new extraction request for the file ids and field ids provided, without waiting for them
+        to finish. Returns one Future per file id, which resolves to the finished FieldExtractionRequest, or
+        to its FieldExtractionResults if fetch_results is set. See RequestPoller.
+
+        :return:
+        """
+        requests, caller = self.create(file_ids = file_ids, field_ids = field_ids)
+        resolve = (lambda request: request.get_results()) if fetch_results else None
+
+        return [self.poller.submit(request, resolve = resolve) for request in requests], caller
+
     def get(self, request_id: str) -> Tuple[FieldExtractionRequest, ApiCall]:
         """
         Gets the Extraction Status data for the request_id.
@@ -58,28 +92,36 @@ class ExtractionAPI(object):
 
     def get_multiple(self, request_ids: List[str]) -> Tuple[List[FieldExtractionRequest], ApiCall]:
         """
+        Gets multiple extraction statuses, in a single call. See get_multiple_batched for many request ids.
+        """
+        requests, callers = self.get_multiple_batched(request_ids, batch_size = max(len(request_ids), 1))
+
+        return requests, callers[0]
+
+    def get_multiple_batched(self, request_ids: List[str], batch_size: int = DEFAULT_BATCH_SIZE,
+                             max_workers: int = DEFAULT_MAX_WORKERS) -> Tuple[List[FieldExtractionRequest], List[ApiCall]]:
+        """
         Gets multiple extraction statuses
 
+        The request ids are sent in batches of at most batch_size ids, with up to max_workers batches in
+        flight at once. The statuses are returned in the order of request_ids, along with the ApiCalls
+        (one per batch).
         """
-        caller = self._call.new(method='GET', path='extractions')
-        caller.add_parameter('request_id', request_ids)
-        caller.send()
+        statuses, callers = get_statuses(self._call, 'extractions', request_ids,
+                                         batch_size = batch_size, max_workers = max_workers)
 
         field_extraction_requests = []
 
-        # What if the user provides invalid ID? Should likely expose the errors via the SDK..
-        # For now assume all is well
-
-        for request_id, result in caller.response.json().get('statuses').items():
+        for request_id, result in statuses:
             result['request_id'] = request_id
-            field_extraction_requests.append(
-                FieldExtractionRequest(api=self, json=result))
+            field_extraction_requests.append(FieldExtractionRequest(api = self, json = result))
 
-        return field_extraction_requests, caller
+        return field_extraction_requests, callers
 
-    def get_result(self, request_id: str) -> Tuple[List[FieldExtractionResult], ApiCall]:
+    def get_result_content(self, request_id: str) -> Tuple[dict, ApiCall]:
         """
-        Gets the Extraction Result data for the request_id.
+        Gets the Extraction Result json for the request_id, as returned by the API: the results and answers
+        of each field id.
 
         :return:
         """
@@ -87,126 +129,63 @@ class ExtractionAPI(object):
             method='GET', path=f'extraction/{request_id}/results/text')
         caller.send()
 
-        data = json.dumps(caller.response.json())
-
-        namespaces = json.loads(
-            data, object_hook=lambda d: SimpleNamespace(**d))
-
-        results = []
-
-        # Go through each of the Extraction Results
-        for result in namespaces.results:
-
-            # If there's no extracted data for the Field, then append an empty field extraction result
-            if not result.extractions:
-                # Regardless if there's extracted text, tag each result with a field_id.
-                results.append(FieldExtractionResult(field_id=result.field_id))
-                continue
-
-            # If there's extracted data for the Field, then create a new instance of FieldExtractionResult
-            # for each of the entries. Append the spans list for each text extraction.
-            for extraction in result.extractions:
-                defined_term = None
-
-                if hasattr(extraction, 'defined_term'):
-                    defined_term = FieldExtractionResultDefinedTerm(
-                        term=extraction.defined_term.term
-                    )
-                    if hasattr(extraction.defined_term, 'spans'):
-                        for span in extraction.defined_term.spans:
-                            defined_term_span = FieldExtractionResultSpan(
-                                text_start=span.start,
-                                text_end=span.end,
-                                page_start=span.pages.start,
-                                page_end=span.pages.end,
-                                top=span.bounds.top,
-                                left=span.bounds.left,
-                                bottom=span.bounds.bottom,
-                                right=span.bounds.right)
-                            for page in span.bboxes:
-                                defined_term_span.bboxes.append(
-                                    BoundingBoxesByPage(page))
-
-                            defined_term.spans.append(defined_term_span)
-
-                # Set the field_id and the text that was extracted.
-                # The text can have null values.
-                extraction_result = FieldExtractionResult(
-                    field_id=result.field_id,
-                    text=extraction.text,
-                    defined_term=defined_term
-                )
-
-                # Add normalized durations, if any
-                if hasattr(extraction, 'durations'):
-                    durations = [DurationNormalizedValues(unit = d.unit,
-                                                          value = d.value)
-                                 for d in extraction.durations]
-
-                    extraction_result.durations_normalized.extend(durations)
-
-                # Add normalized currencies, if any
-                if hasattr(extraction, 'currencies'):
-                    currencies = [CurrencyNormalizedValues(value = c.value,
-                                                           symbol = c.symbol,
-                                                           precision = c.precision)
-                                 for c in extraction.currencies]
-
-                    extraction_result.currencies_normalized.extend(currencies)
-
-                # Add normalized dates, if any
-                if hasattr(extraction, 'dates'):
-                    dates = [DateNormalizedValues(day = c.day,
-                                                  month = c.month,
-                                                  year = c.year)
-                                 for c in extraction.dates]
-
-                    extraction_result.dates_normalized.extend(dates)
-
-                if hasattr(extraction, 'spans'):
-                    for span in extraction.spans:
-                        extraction_span = FieldExtractionResultSpan(
-                            confidence=span.score,
-                            text_start=span.start,
-                            text_end=span.end,
-                            page_start=span.pages.start,
-                            page_end=span.pages.end,
-                            top=span.bounds.top,
-                            left=span.bounds.left,
-                            bottom=span.bounds.bottom,
-                            right=span.bounds.right)
-                        for page in span.bboxes:
-                            extraction_span.bboxes.append(
-                                BoundingBoxesByPage(page))
-
-                        extraction_result.spans.append(extraction_span)
-                results.append(extraction_result)
-
-        return results, caller
+        return loads(caller.response.content), caller
 
-    def get_answer(self, request_id: str) -> Tuple[List[FieldExtractionAnswer], ApiCall]:
-        caller = self._call.new(
-            method='GET', path=f'extraction/{request_id}/results/text')
-        caller.send()
+    def get_result(self, request_id: str) -> Tuple[List[FieldExtractionResult], ApiCall]:
+        """
+        Gets the Extraction Result data for the request_id.
+
+        :return:
+        """
+        content, caller = self.get_result_content(request_id)
+
+        return self._parse_results(content), caller
+
+    def iter_results(self, request_id: str, chunk_size: int = RESULTS_CHUNK_SIZE,
+                     resume: bool = True) -> Iterator[FieldExtractionResult]:
+        """
+        Yields the Extraction Results for the request_id while the response arrives, holding at most the results
+        of one field id (and a chunk) in memory rather than the whole response. Uses ijson, if installed.
+
+        :param request_id: The extraction request id
+        :param chunk_size: The number of bytes of the response read at a time
+        :param resume: Whether to resume the download if the connection drops. The results are requested
+                       uncompressed, so that the download resumes at the byte where the JSON stopped
+                       (see iter_download).
+        :return:
+        """
+        chunks = iter_download(self._call.new(method = 'GET', path = f'extraction/{request_id}/results/text'),
+                               chunk_size = chunk_size, resume = resume)
 
-        data = json.dumps(caller.response.json())
+        for result in iter_result_items(chunks):
+            yield from decode_result(result)
 
-        namespaces = json.loads(
-            data, object_hook=lambda d: SimpleNamespace(**d))
+    @staticmethod
+    def _parse_results(content: dict) -> List[FieldExtractionResult]:
+        """
+        Parses the json of the extraction/{request_id}/results/text endpoint into FieldExtractionResults
+        """
+        return decode_results(content)
 
-        results = []
+    def get_answer(self, request_id: str) -> Tuple[List[FieldExtractionAnswer], ApiCall]:
+        content, caller = self.get_result_content(request_id)
 
-        # Go through each of the Extraction Results
-        for result in namespaces.results:
-            if not hasattr(result, 'answers') or not result.answers:
-                results.append(FieldExtractionAnswer(field_id=result.field_id))
-                continue
+        return self._parse_answers(content), caller
 
-            for answer in result.answers:
-                extraction_result = FieldExtractionAnswer(field_id=result.field_id,
-                                                          option=answer.option,
-                                                          value=answer.value)
+    def get_results_and_answers(self, request_id: str) -> Tuple[List[FieldExtractionResult],
+                                                                List[FieldExtractionAnswer], ApiCall]:
+        """
+        Gets the Extraction Results and Answers for the request_id, from a single download of the results.
 
-                results.append(extraction_result)
+        :return:
+        """
+        content, caller = self.get_result_content(request_id)
+
+        return self._parse_results(content), self._parse_answers(content), caller
 
-        return results, caller
+    @staticmethod
+    def _parse_answers(content: dict) -> List[FieldExtractionAnswer]:
+        """
+        Parses the json of the extraction/{request_id}/results/text endpoint into FieldExtractionAnswers
+        """
+        return decode_answers(content)
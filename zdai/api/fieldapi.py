@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from ..api.apicall import ApiCall
 from ..models.field import Field
@@ -25,8 +25,11 @@ class FieldAPI(object):
     FieldAPI contains the functionality accepted by the Fields Microservice
     """
 
-    def __init__(self, token: str, url: str):
-        self._call = ApiCall(token, url)
+    def __init__(self, token: str, url: str, **kwargs):
+        """
+        :param kwargs: Passed through to the ApiCall (e.g. the shared session)
+        """
+        self._call = ApiCall(token, url, **kwargs)
 
     def create(self, field_name: str, description: str = None, from_field_id: str = None) -> Tuple[str, ApiCall]:
         """
@@ -84,16 +87,32 @@ class FieldAPI(object):
 
         return FieldTrainingRequest(api=self, json=caller.response.json()), caller
 
-    def get(self) -> Tuple[List[Field], ApiCall]:
+    def get(self, if_none_match: str = None) -> Tuple[Optional[List[Field]], ApiCall]:
         """
         Gets the list of fields that exist in the ZDAI, which
         the API token has access to.
+
+        :param if_none_match: The ETag of a previous response (caller.response.headers.get('ETag')). If the
+                              fields haven't changed since, and the server supports conditional requests,
+                              None is returned instead of the fields (the response's status code is 304).
         """
         caller = self._call.new(method='GET', path='fields')
+        if if_none_match:
+            caller.add_header(key='If-None-Match', value=if_none_match)
         caller.send()
 
+        if caller.response.status_code == 304:
+            return None, caller
+
+        return self._parse_fields(caller.response.json()), caller
+
+    @staticmethod
+    def _parse_fields(content: list) -> List[Field]:
+        """
+        Parses the json returned by the fields endpoint into Fields
+        """
         fields = []
-        for field in caller.response.json():
+        for field in content:
             fields.append(Field(
                 id=str(field.get('field_id')),
                 name=str(field.get('name')),
@@ -107,7 +126,7 @@ class FieldAPI(object):
                 has_answers=bool(field.get('has_answers'))
             ))
 
-        return fields, caller
+        return fields
 
     def get_metadata(self, field_id: str):
         """
@@ -153,7 +172,13 @@ class FieldAPI(object):
             method='GET', path=f'fields/{field_id}/validation-details')
         caller.send()
 
-        response = caller.response.json()
+        return self._parse_validation_details(caller.response.json()), caller
+
+    @staticmethod
+    def _parse_validation_details(response: list) -> List[FieldValidationDetails]:
+        """
+        Parses the json returned by the fields/{field_id}/validation-details endpoint
+        """
         validation_details = []
 
         for validation_detail in response:
@@ -166,4 +191,4 @@ class FieldAPI(object):
 
             validation_details.append(v)
 
-        return validation_details, caller
+        return validation_details
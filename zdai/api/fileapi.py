@@ -13,9 +13,83 @@
 # limitations under the License.
 
 from ..api.apicall import ApiCall
+from ..cache.hashing import HashingIterator, sha256_content
+from ..cache.uploadcache import UploadCache
 from ..models.file import File, FileExpiration
-from typing import Tuple
+from contextlib import contextmanager
+from typing import BinaryIO, Iterable, Optional, Tuple, Union
 from datetime import datetime
+import mmap
+import os
+import pathlib
+
+FileContent = Union[bytes, str, os.PathLike, BinaryIO, Iterable[bytes]]
+
+
+def _as_content(content: FileContent) -> FileContent:
+    """
+    Strings are paths to the file to upload: bytes are the way to upload literal content.
+    """
+    return pathlib.Path(content) if isinstance(content, str) else content
+
+
+@contextmanager
+def _open_content(content: FileContent):
+    """
+    Yields a body for the content of a file that can be sent without first reading it into memory:
+        - bytes are sent as they are.
+        - paths (os.PathLike, e.g. pathlib.Path, see _as_content) are memory-mapped and sent without being copied.
+        - binary file objects are streamed in blocks, with a Content-Length if their size can be determined.
+        - iterables of bytes chunks are streamed using chunked transfer-encoding.
+    """
+    if not isinstance(content, os.PathLike):
+        yield content
+        return
+
+    with open(content, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+
+        mapped = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+        view = memoryview(mapped)
+
+        try:
+            yield view
+        finally:
+            view.release()
+            try:
+                mapped.close()
+            except BufferError:
+                # A view of the map outlived the call (e.g. in a traceback). The map is closed once it is collected.
+                pass
+
+
+def _lookup_upload(cache: UploadCache, namespace: str, content: FileContent,
+                   is_zuva_ocr: bool) -> Tuple[Optional[File], Optional[str], FileContent]:
+    """
+    Returns the File previously uploaded with the same content (if any), the content's SHA-256, and the content
+    to upload. Content that can only be read once is wrapped so that it is hashed while it is uploaded.
+    """
+    digest = sha256_content(content)
+
+    if digest is not None:
+        return cache.get(namespace, digest, is_zuva_ocr), digest, content
+
+    if not hasattr(content, 'read'):
+        content = HashingIterator(content)
+
+    return None, None, content
+
+
+def _remember_upload(cache: UploadCache, namespace: str, file: File, digest: Optional[str],
+                     content: FileContent, is_zuva_ocr: bool) -> None:
+    if digest is None and isinstance(content, HashingIterator):
+        digest = content.hexdigest()
+
+    if digest is not None:
+        file.sha256 = digest
+        cache.put(namespace, digest, file, is_zuva_ocr)
 
 
 class FileAPI(object):
@@ -23,19 +97,42 @@ class FileAPI(object):
     FileAPI contains the functionality accepted by the File/Storage Microservice
     """
 
-    def __init__(self, token: str, url: str):
-        self._call = ApiCall(token, url)
+    def __init__(self, token: str, url: str, upload_cache: UploadCache = None, expiration_keeper = None, **kwargs):
+        """
+        :param upload_cache: If provided, uploading content that was already uploaded reuses the existing file
+        :param expiration_keeper: If provided, the ExpirationKeeper tracking the files created (or reused)
+        :param kwargs: Passed through to the ApiCall (e.g. the shared session)
+        """
+        self._call = ApiCall(token, url, **kwargs)
+        self.upload_cache = upload_cache
+        self.expiration_keeper = expiration_keeper
+        self._namespace = UploadCache.namespace(url, token)
+
+        if expiration_keeper is not None:
+            expiration_keeper.bind(self)
 
-    def create(self, content: bytes, is_zuva_ocr: bool = False, expiration: str = None, headers: dict = None) -> Tuple[File, ApiCall]:
+    def create(self, content: FileContent, is_zuva_ocr: bool = False, expiration: str = None, headers: dict = None) -> Tuple[File, ApiCall]:
         """
         Creates a new file in the ZDAI
 
-        :param content: The byte-content of the data to submit.
+        :param content: The content of the data to submit: its bytes, a path (str or e.g. pathlib.Path) to the
+                        file, an open binary file or an iterable of bytes chunks. Paths and files are streamed
+                        rather than read into memory.
         :param is_zuva_ocr: If the byte content provided comes from a .zuvaocr file.
         :param expiration: Set the expiration of the document. Defaults to 7d in DocAI. Max 13d.
         :param headers: Set additional headers.
-        :return:
+        :return: The File, and the ApiCall (None if the file was found in the upload cache)
         """
+        content = _as_content(content)
+        digest = None
+
+        if self.upload_cache is not None:
+            cached, digest, content = _lookup_upload(self.upload_cache, self._namespace, content, is_zuva_ocr)
+            if cached is not None:
+                if self.expiration_keeper is not None:
+                    self.expiration_keeper.track(cached)
+                return cached, None
+
         caller = self._call.new(method = 'POST', path = f'files')
         caller.use_default_accept_type = False
         caller.use_default_content_type = False
@@ -47,19 +144,31 @@ class FileAPI(object):
             for k, v in headers.items():
                 caller.add_header(key = k, value = v)
 
-        caller.set_body_value(value = content)
-        caller.send()
+        with _open_content(content) as body:
+            caller.set_body_value(value = body)
+            caller.send()
+
+        file = self._parse_file(caller.response.json())
 
-        data = caller.response.json()
+        if self.upload_cache is not None:
+            _remember_upload(self.upload_cache, self._namespace, file, digest, content, is_zuva_ocr)
 
-        file = File(
+        if self.expiration_keeper is not None:
+            self.expiration_keeper.track(file)
+
+        return file, caller
+
+    @staticmethod
+    def _parse_file(data: dict) -> File:
+        """
+        Parses the json returned by the files endpoint into a File
+        """
+        return File(
             id = data.get('file_id'),
             content_type = data.get('attributes').get('content-type'),
             expiration = datetime.strptime(data.get('expiration'), '%Y-%m-%dT%H:%M:%SZ')
         )
 
-        return file, caller
-
     def delete(self, file_id: str) -> Tuple[bool, ApiCall]:
         """
         Deletes a file
@@ -69,6 +178,12 @@ class FileAPI(object):
         caller = self._call.new(method = 'DELETE', path = f'files/{file_id}')
         caller.send()
 
+        if self.upload_cache is not None:
+            self.upload_cache.discard(file_id)
+
+        if self.expiration_keeper is not None:
+            self.expiration_keeper.forget(file_id)
+
         return caller.response.status_code == 204, caller
 
     def set_expiration(self, file_id: str, expiration: str):
@@ -88,12 +203,26 @@ class FileAPI(object):
         caller = self._call.new(method = 'PUT', path = f'files/{file_id}/expiration')
         caller.add_header(key = 'Expiration', value = expiration)
         caller.send()
+        file_expiration = self._parse_expiration(file_id, caller.response.json())
+
+        if self.upload_cache is not None:
+            self.upload_cache.set_expiration(file_id, file_expiration.expiration)
 
-        new_expiration = caller.response.json().get('expiration')
+        if self.expiration_keeper is not None:
+            self.expiration_keeper.update(file_id, file_expiration.expiration)
+
+        return file_expiration, caller
+
+    @staticmethod
+    def _parse_expiration(file_id: str, data: dict) -> FileExpiration:
+        """
+        Parses the json returned by the files/{file_id}/expiration endpoint into a FileExpiration
+        """
+        new_expiration = data.get('expiration')
         if not new_expiration:
             raise Exception(f'No expiration found for file_id {file_id}.')
 
         new_expiration = datetime.strptime(new_expiration, "%Y-%m-%dT%H:%M:%SZ")
 
-        return FileExpiration(id = caller.response.json().get('file_id'),
-                              expiration = new_expiration), caller
+        return FileExpiration(id = data.get('file_id'),
+                              expiration = new_expiration)
@@ -15,6 +15,7 @@
 from typing import List, Tuple
 
 from ..api.apicall import ApiCall
+from ..api.batching import DEFAULT_BATCH_SIZE, DEFAULT_MAX_WORKERS, get_statuses
 from ..models.language_classification_request import LanguageClassificationRequest
 
 
@@ -23,8 +24,11 @@ class LanguageAPI(object):
     LanguageAPI contains the functionality accepted by the Language Microservice
     """
 
-    def __init__(self, token: str, url: str):
-        self._call = ApiCall(token, url)
+    def __init__(self, token: str, url: str, **kwargs):
+        """
+        :param kwargs: Passed through to the ApiCall (e.g. the shared session)
+        """
+        self._call = ApiCall(token, url, **kwargs)
 
     def create(self, file_ids: List[str]) -> Tuple[List[LanguageClassificationRequest], ApiCall]:
         """
@@ -51,17 +55,28 @@ class LanguageAPI(object):
 
     def get_multiple(self, request_ids: List[str]) -> Tuple[List[LanguageClassificationRequest], ApiCall]:
         """
+        Gets multiple Language statuses, in a single call. See get_multiple_batched for many request ids.
+        """
+        requests, callers = self.get_multiple_batched(request_ids, batch_size = max(len(request_ids), 1))
+
+        return requests, callers[0]
+
+    def get_multiple_batched(self, request_ids: List[str], batch_size: int = DEFAULT_BATCH_SIZE,
+                             max_workers: int = DEFAULT_MAX_WORKERS) -> Tuple[List[LanguageClassificationRequest], List[ApiCall]]:
+        """
         Gets multiple Language statuses
 
+        The request ids are sent in batches of at most batch_size ids, with up to max_workers batches in
+        flight at once. The statuses are returned in the order of request_ids, along with the ApiCalls
+        (one per batch).
         """
-        caller = self._call.new(method='GET', path=f'languages')
-        caller.add_parameter('request_id', request_ids)
-        caller.send()
+        statuses, callers = get_statuses(self._call, 'languages', request_ids,
+                                         batch_size = batch_size, max_workers = max_workers)
 
         language_requests = []
 
-        for request_id, result in caller.response.json().get('statuses').items():
+        for request_id, result in statuses:
             result['request_id'] = request_id
             language_requests.append(LanguageClassificationRequest(api = self, json = result))
 
-        return language_requests, caller
\ No newline at end of file
+        return language_requests, callers
\ No newline at end of file
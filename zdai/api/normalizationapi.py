@@ -12,57 +12,134 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 from ..api.apicall import ApiCall
+from ..cache.normalizationcache import NormalizationCache
 from ..models.date_normalization import DateNormalization
 from ..models.currency_normalization import CurrencyNormalization
 from ..models.duration_normalization import DurationNormalization
 
+# The normalization class of each endpoint (normalize/{kind})
+NORMALIZATIONS = {
+    'date': DateNormalization,
+    'duration': DurationNormalization,
+    'currency': CurrencyNormalization,
+}
+
 
 class NormalizationAPI(object):
     """
     NormalizationAPI contains the functionality accepted by the Normalization services
     """
 
-    def __init__(self, token: str, url: str):
-        self._call = ApiCall(token, url)
+    def __init__(self, token: str, url: str, cache: NormalizationCache = None, max_workers: int = 8, **kwargs):
+        """
+        :param cache: If provided, texts that were already normalized are served from the cache
+        :param max_workers: The maximum number of calls sent at once by the get_multiple_* methods
+        :param kwargs: Passed through to the ApiCall (e.g. the shared session)
+        """
+        self._call = ApiCall(token, url, **kwargs)
+        self.cache = cache
+        self.max_workers = max_workers
 
-    def get_dates(self, text: str) -> Tuple[DateNormalization, ApiCall]:
+    def get_dates(self, text: str) -> Tuple[DateNormalization, Optional[ApiCall]]:
         """
         Gets the normalized date values from the input string
 
-        :return:
+        :return: The DateNormalization, and the ApiCall (None if the text was found in the cache)
         """
+        return self._normalize('date', text)
 
-        caller = self._call.new(method = 'POST', path = 'normalize/date')
-        caller.add_body(key = 'text', value = text)
-        caller.send()
+    def get_durations(self, text: str) -> tuple[DurationNormalization, Optional[ApiCall]]:
+        """
+        Gets the normalized duration values from the input string
 
-        return DateNormalization(api = self, json = caller.response.json()), caller
+        :return: The DurationNormalization, and the ApiCall (None if the text was found in the cache)
+        """
+        return self._normalize('duration', text)
 
-    def get_durations(self, text: str) -> tuple[DurationNormalization, ApiCall]:
+    def get_currencies(self, text: str) -> Tuple[CurrencyNormalization, Optional[ApiCall]]:
         """
-        Gets the normalized duration values from the input string
+        Gets the normalized currency values from the input string
 
-        :return:
+        :return: The CurrencyNormalization, and the ApiCall (None if the text was found in the cache)
         """
+        return self._normalize('currency', text)
 
-        caller = self._call.new(method = 'POST', path = 'normalize/duration')
-        caller.add_body(key = 'text', value = text)
-        caller.send()
+    def get_multiple_dates(self, texts: List[str]) -> Tuple[List[DateNormalization], List[ApiCall]]:
+        """
+        Gets the normalized date values of each of the input strings, in their order. See get_multiple.
+        """
+        return self.get_multiple('date', texts)
 
-        return DurationNormalization(api = self, json = caller.response.json()), caller
+    def get_multiple_durations(self, texts: List[str]) -> Tuple[List[DurationNormalization], List[ApiCall]]:
+        """
+        Gets the normalized duration values of each of the input strings, in their order. See get_multiple.
+        """
+        return self.get_multiple('duration', texts)
 
-    def get_currencies(self, text: str) -> Tuple[CurrencyNormalization, ApiCall]:
+    def get_multiple_currencies(self, texts: List[str]) -> Tuple[List[CurrencyNormalization], List[ApiCall]]:
         """
-        Gets the normalized currency values from the input string
+        Gets the normalized currency values of each of the input strings, in their order. See get_multiple.
+        """
+        return self.get_multiple('currency', texts)
+
+    def get_multiple(self, kind: str, texts: List[str]) -> Tuple[list, List[ApiCall]]:
+        """
+        Gets the normalized values of each of the input strings, in their order. Each distinct string is only
+        normalized once: repeated strings, and strings found in the cache, aren't sent again. The other strings
+        are sent in parallel, up to max_workers at once.
 
-        :return:
+        :param kind: The kind of normalization: date, duration or currency
+        :param texts: The input strings
+        :return: The normalizations, and the ApiCalls that were sent
         """
+        normalization = NORMALIZATIONS[kind]
+        contents = {}
+
+        for text in dict.fromkeys(texts):
+            contents[text] = self._get_cached(kind, text)
+
+        missing = [text for text, content in contents.items() if content is None]
+        callers = []
+
+        if len(missing) == 1 or self.max_workers <= 1:
+            callers = [self._send(kind, text) for text in missing]
+        elif missing:
+            with ThreadPoolExecutor(max_workers = min(self.max_workers, len(missing))) as executor:
+                callers = list(executor.map(lambda text: self._send(kind, text), missing))
+
+        for text, caller in zip(missing, callers):
+            contents[text] = caller.response.json()
+            self._put_cached(kind, text, contents[text])
 
-        caller = self._call.new(method = 'POST', path = 'normalize/currency')
+        return [normalization(api = self, json = contents[text]) for text in texts], callers
+
+    def _normalize(self, kind: str, text: str) -> tuple:
+        content = self._get_cached(kind, text)
+        if content is not None:
+            return NORMALIZATIONS[kind](api = self, json = content), None
+
+        caller = self._send(kind, text)
+        self._put_cached(kind, text, caller.response.json())
+
+        return NORMALIZATIONS[kind](api = self, json = caller.response.json()), caller
+
+    def _send(self, kind: str, text: str) -> ApiCall:
+        caller = self._call.new(method = 'POST', path = f'normalize/{kind}')
         caller.add_body(key = 'text', value = text)
         caller.send()
 
-        return CurrencyNormalization(api = self, json = caller.response.json()), caller
+        return caller
+
+    def _get_cached(self, kind: str, text: str):
+        if self.cache is None:
+            return None
+
+        return self.cache.get(kind, NormalizationCache.sha256(text))
+
+    def _put_cached(self, kind: str, text: str, content: dict) -> None:
+        if self.cache is not None:
+            self.cache.put(kind, NormalizationCache.sha256(text), content)
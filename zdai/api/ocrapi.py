@@ -12,9 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Tuple
+from concurrent.futures import Future
+from typing import BinaryIO, Iterator, List, Tuple, Union
+import os
 
 from ..api.apicall import ApiCall
+from ..api.batching import DEFAULT_BATCH_SIZE, DEFAULT_MAX_WORKERS, get_statuses
+from ..JobTracker import RequestPoller
+from ..api.download import DEFAULT_CHUNK_SIZE, download, iter_download
+from ..models.download import Download
 from ..models.ocr_request import OCRRequest
 
 
@@ -23,8 +29,24 @@ class OCRAPI(object):
     OCRAPI contains the functionality accepted by the OCR Microservice
     """
 
-    def __init__(self, token: str, url: str):
-        self._call = ApiCall(token, url)
+    def __init__(self, token: str, url: str, poller: RequestPoller = None, **kwargs):
+        """
+        :param poller: The RequestPoller that resolves the Futures returned by submit(). Created when first needed,
+                       if not provided.
+        :param kwargs: Passed through to the ApiCall (e.g. the shared session)
+        """
+        self._call = ApiCall(token, url, **kwargs)
+        self._poller = poller
+
+    @property
+    def poller(self) -> RequestPoller:
+        """
+        Returns the RequestPoller that resolves the Futures returned by submit()
+        """
+        if self._poller is None:
+            self._poller = RequestPoller()
+
+        return self._poller
 
     def create(self, file_ids: List[str], generate_layout: bool = None) -> Tuple[List[OCRRequest], ApiCall]:
         """
@@ -41,6 +63,20 @@ class OCRAPI(object):
 
         return [OCRRequest(api = self, json = c) for c in caller.response.json().get('file_ids')], caller
 
+    def submit(self, file_ids: List[str], generate_layout: bool = None,
+               fetch_text: bool = False) -> Tuple[List[Future], ApiCall]:
+        """
+        Creates a new OCR request for the file ids provided, without waiting for them to finish.
+        Returns one Future per file id, which resolves to the finished OCRRequest, or to its text if
+        fetch_text is set. See RequestPoller.
+
+        :return:
+        """
+        requests, caller = self.create(file_ids = file_ids, generate_layout = generate_layout)
+        resolve = (lambda request: request.get_text()) if fetch_text else None
+
+        return [self.poller.submit(request, resolve = resolve) for request in requests], caller
+
     def get(self, request_id: str) -> Tuple[OCRRequest, ApiCall]:
         """
         Gets the OCR status for the request_id.
@@ -54,20 +90,31 @@ class OCRAPI(object):
 
     def get_multiple(self, request_ids: List[str]) -> Tuple[List[OCRRequest], ApiCall]:
         """
+        Gets multiple OCR statuses, in a single call. See get_multiple_batched for many request ids.
+        """
+        requests, callers = self.get_multiple_batched(request_ids, batch_size = max(len(request_ids), 1))
+
+        return requests, callers[0]
+
+    def get_multiple_batched(self, request_ids: List[str], batch_size: int = DEFAULT_BATCH_SIZE,
+                             max_workers: int = DEFAULT_MAX_WORKERS) -> Tuple[List[OCRRequest], List[ApiCall]]:
+        """
         Gets multiple OCR statuses
 
+        The request ids are sent in batches of at most batch_size ids, with up to max_workers batches in
+        flight at once. The statuses are returned in the order of request_ids, along with the ApiCalls
+        (one per batch).
         """
-        caller = self._call.new(method= 'GET', path=f'ocrs')
-        caller.add_parameter('request_id', request_ids)
-        caller.send()
+        statuses, callers = get_statuses(self._call, 'ocrs', request_ids,
+                                         batch_size = batch_size, max_workers = max_workers)
 
         ocr_requests = []
 
-        for request_id, result in caller.response.json().get('statuses').items():
+        for request_id, result in statuses:
             result['request_id'] = request_id
             ocr_requests.append(OCRRequest(api = self, json = result))
 
-        return ocr_requests, caller
+        return ocr_requests, callers
 
     def get_text(self, request_id: str) -> Tuple[dict, ApiCall]:
         """
@@ -122,3 +169,64 @@ class OCRAPI(object):
         :return:
         """
         return self.get_layouts(request_id)
+
+    def download_images(self, request_id: str, destination: Union[str, os.PathLike, BinaryIO],
+                        sha256: str = None, chunk_size: int = DEFAULT_CHUNK_SIZE, resume: bool = True) -> Tuple[Download, ApiCall]:
+        """
+        Streams the .zip package which contains all of the images to a path or binary file object,
+        without holding it in memory.
+
+        :param request_id: The OCR request id
+        :param destination: The path to write the package to, or a binary file object
+        :param sha256: The expected SHA-256 hex digest of the package. If provided, it is checked once downloaded.
+        :param chunk_size: The number of bytes read at a time
+        :param resume: Whether to resume the download if the connection drops
+        :return:
+        """
+        return self._download(f'ocr/{request_id}/images', destination, sha256, chunk_size, resume)
+
+    def download_eocr(self, request_id: str, destination: Union[str, os.PathLike, BinaryIO],
+                      sha256: str = None, chunk_size: int = DEFAULT_CHUNK_SIZE, resume: bool = True) -> Tuple[Download, ApiCall]:
+        """
+        Streams the file's layout in eOCR format to a path or binary file object. See download_images.
+        """
+        return self._download(f'ocr/{request_id}/eocr', destination, sha256, chunk_size, resume)
+
+    def download_layouts(self, request_id: str, destination: Union[str, os.PathLike, BinaryIO],
+                         sha256: str = None, chunk_size: int = DEFAULT_CHUNK_SIZE, resume: bool = True) -> Tuple[Download, ApiCall]:
+        """
+        Streams the file's protobuf layout to a path or binary file object. See download_images.
+        """
+        return self._download(f'ocr/{request_id}/layouts', destination, sha256, chunk_size, resume)
+
+    def iter_images(self, request_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE, resume: bool = True) -> Iterator[bytes]:
+        """
+        Yields the bytes of the .zip package which contains all of the images, one chunk at a time.
+
+        :return:
+        """
+        return iter_download(self._call.new(method = 'GET', path = f'ocr/{request_id}/images'),
+                             chunk_size = chunk_size, resume = resume)
+
+    def iter_eocr(self, request_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE, resume: bool = True) -> Iterator[bytes]:
+        """
+        Yields the bytes of the file's layout in eOCR format, one chunk at a time.
+
+        :return:
+        """
+        return iter_download(self._call.new(method = 'GET', path = f'ocr/{request_id}/eocr'),
+                             chunk_size = chunk_size, resume = resume)
+
+    def iter_layouts(self, request_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE, resume: bool = True) -> Iterator[bytes]:
+        """
+        Yields the bytes of the file's protobuf layout, one chunk at a time.
+
+        :return:
+        """
+        return iter_download(self._call.new(method = 'GET', path = f'ocr/{request_id}/layouts'),
+                             chunk_size = chunk_size, resume = resume)
+
+    def _download(self, path: str, destination, sha256: str, chunk_size: int, resume: bool) -> Tuple[Download, ApiCall]:
+        caller = self._call.new(method = 'GET', path = path)
+
+        return download(caller, destination, chunk_size = chunk_size, sha256 = sha256, resume = resume), caller
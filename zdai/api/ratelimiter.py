@@ -0,0 +1,134 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket(object):
+    """
+    Thread-safe token bucket that allows `rate` calls per second, with bursts of up to `capacity` calls.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        :param rate: The number of tokens added to the bucket per second.
+        :param capacity: The maximum number of tokens the bucket holds. Defaults to one second's worth of tokens.
+        """
+        if rate <= 0:
+            raise ValueError(f'The rate must be positive. Input: {rate}')
+
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(rate={self.rate!r}, capacity={self.capacity!r})'
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Takes the tokens from the bucket and returns the number of seconds the caller must wait before using them.
+        Tokens may be reserved ahead of time, so that waiting callers are served in the order they arrived.
+
+        :param tokens: The number of tokens to take.
+        :return:
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1) -> None:
+        """
+        Takes the tokens from the bucket, blocking until they are available.
+
+        :param tokens: The number of tokens to take.
+        :return:
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class RateLimiter(object):
+    """
+    RateLimiter paces the calls made by every ApiCall that shares it, using one TokenBucket per service path prefix.
+
+    Example:
+        limiter = RateLimiter(rates = {'files': 10, 'ocr': 20, 'extraction': 20, 'mlc': 20, 'normalize': 50},
+                              default_rate = 20)
+        sdk = ZDAISDK(from_config = True, rate_limiter = limiter)
+
+    A prefix matches every path that starts with it, so 'ocr' applies to both 'ocr/{request_id}' and 'ocrs',
+    and 'normalize' applies to all of the 'normalize/*' paths unless a longer prefix such as 'normalize/date'
+    is configured.
+    """
+
+    def __init__(self, rates: Dict[str, float] = None, default_rate: float = None, burst: float = None):
+        """
+        :param rates: The number of calls per second allowed for each path prefix.
+        :param default_rate: The number of calls per second shared by the paths that match no prefix.
+                             Those calls are not limited if not provided.
+        :param burst: The number of calls that may be made at once by each bucket. Defaults to its rate.
+        """
+        self._buckets = {prefix.strip('/'): TokenBucket(rate = rate, capacity = burst)
+                         for prefix, rate in (rates or {}).items()}
+        self._prefixes = sorted(self._buckets, key = len, reverse = True)
+        self._default_bucket = TokenBucket(rate = default_rate, capacity = burst) if default_rate else None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(buckets={self._buckets!r}, default={self._default_bucket!r})'
+
+    def bucket(self, path: str) -> Optional[TokenBucket]:
+        """
+        Returns the TokenBucket that applies to the path, if any.
+
+        :param path: The path of the call (e.g. 'ocr/{request_id}')
+        :return:
+        """
+        _path = path.lstrip('/')
+        for prefix in self._prefixes:
+            if _path.startswith(prefix):
+                return self._buckets[prefix]
+
+        return self._default_bucket
+
+    def reserve(self, path: str) -> float:
+        """
+        Reserves a call to the path and returns the number of seconds to wait before making it.
+
+        :param path: The path of the call
+        :return:
+        """
+        bucket = self.bucket(path)
+
+        return bucket.reserve() if bucket is not None else 0.0
+
+    def acquire(self, path: str) -> None:
+        """
+        Blocks until a call to the path may be made.
+
+        :param path: The path of the call
+        :return:
+        """
+        delay = self.reserve(path)
+        if delay > 0:
+            time.sleep(delay)
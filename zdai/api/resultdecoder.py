@@ -0,0 +1,260 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import codecs
+import json
+from typing import Iterable, Iterator, List, Union
+
+from ..models.field_extraction_answer import FieldExtractionAnswer
+from ..models.field_extraction_result import BoundingBoxesByPage, FieldExtractionResult, \
+    FieldExtractionResultDefinedTerm, FieldExtractionResultSpan, DurationNormalizedValues, \
+    CurrencyNormalizedValues, DateNormalizedValues
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is an optional dependency
+    ijson = None
+
+
+def loads(data: Union[bytes, str]):
+    """
+    Parses the json, using orjson when it is installed (pip3 install zdai[speedups])
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def decode_results(content: dict) -> List[FieldExtractionResult]:
+    """
+    Builds the FieldExtractionResults from the json of the extraction/{request_id}/results/text endpoint,
+    in a single pass over the parsed json.
+    """
+    results = []
+
+    for result in content['results']:
+        results.extend(decode_result(result))
+
+    return results
+
+
+def decode_result(result: dict) -> List[FieldExtractionResult]:
+    """
+    Builds the FieldExtractionResults of one of the field ids, from its entry in the results of the
+    extraction/{request_id}/results/text endpoint
+    """
+    field_id = result['field_id']
+    extractions = result.get('extractions')
+
+    # Regardless if there's extracted text, tag each result with a field_id.
+    if not extractions:
+        return [FieldExtractionResult(field_id = field_id)]
+
+    results = []
+
+    for extraction in extractions:
+        defined_term = extraction.get('defined_term')
+        if defined_term is not None:
+            defined_term = FieldExtractionResultDefinedTerm(
+                term = defined_term.get('term'),
+                spans = [_decode_span(span, None) for span in defined_term.get('spans') or ()])
+
+        # The text can have null values.
+        results.append(FieldExtractionResult(
+            field_id = field_id,
+            text = extraction.get('text'),
+            spans = [_decode_span(span, span.get('score')) for span in extraction.get('spans') or ()],
+            defined_term = defined_term,
+            durations_normalized = [DurationNormalizedValues(unit = d.get('unit'), value = d.get('value'))
+                                    for d in extraction.get('durations') or ()],
+            dates_normalized = [DateNormalizedValues(day = d.get('day'), month = d.get('month'),
+                                                     year = d.get('year'))
+                                for d in extraction.get('dates') or ()],
+            currencies_normalized = [CurrencyNormalizedValues(value = c.get('value'), symbol = c.get('symbol'),
+                                                              precision = c.get('precision'))
+                                     for c in extraction.get('currencies') or ()]))
+
+    return results
+
+
+def _decode_span(span: dict, confidence: float) -> FieldExtractionResultSpan:
+    pages = span['pages']
+    bounds = span['bounds']
+
+    return FieldExtractionResultSpan(
+        confidence = confidence,
+        text_start = span['start'],
+        text_end = span['end'],
+        page_start = pages['start'],
+        page_end = pages['end'],
+        top = bounds['top'],
+        left = bounds['left'],
+        bottom = bounds['bottom'],
+        right = bounds['right'],
+        bboxes = [BoundingBoxesByPage.from_json(page) for page in span.get('bboxes') or ()])
+
+
+def decode_answers(content: dict) -> List[FieldExtractionAnswer]:
+    """
+    Builds the FieldExtractionAnswers from the json of the extraction/{request_id}/results/text endpoint
+    """
+    answers = []
+
+    for result in content['results']:
+        field_id = result['field_id']
+
+        if not result.get('answers'):
+            answers.append(FieldExtractionAnswer(field_id = field_id))
+            continue
+
+        answers.extend(FieldExtractionAnswer(field_id = field_id, option = answer.get('option'),
+                                             value = answer.get('value'))
+                       for answer in result['answers'])
+
+    return answers
+
+
+def iter_result_items(chunks: Iterable[bytes]) -> Iterator[dict]:
+    """
+    Yields the entries of the results of the extraction/{request_id}/results/text endpoint (one per field id) as
+    the chunks of the response arrive, holding at most one entry and a chunk in memory. Uses ijson when it is
+    installed (pip3 install zdai[streaming]).
+    """
+    if ijson is not None:
+        yield from ijson.items(_ChunkReader(chunks), 'results.item', use_float = True)
+    else:
+        yield from _ResultItems(chunks)
+
+
+class _ChunkReader(object):
+    """
+    A file-like object reading from an iterable of bytes chunks, as expected by ijson
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = b''
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._buffer:
+            self._buffer = next(self._chunks, None)
+            if self._buffer is None:
+                self._buffer = b''
+                return b''
+
+        if size < 0 or size >= len(self._buffer):
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+
+        return data
+
+
+class _ResultItems(object):
+    """
+    Splits the json of the results/text endpoint into the entries of its results, using the json module on each
+    entry once it has arrived. The other keys of the json are skipped.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._text = ''
+        self._position = 0
+        self._ended = False
+
+    def __iter__(self) -> Iterator[dict]:
+        self._expect('{')
+
+        while not self._consume('}'):
+            self._consume(',')
+            key = self._value()
+            self._expect(':')
+
+            if key != 'results':
+                self._value()
+                continue
+
+            self._expect('[')
+            while not self._consume(']'):
+                self._consume(',')
+                yield self._value()
+
+                # The entries read are dropped, so that the text only holds the next entry.
+                self._text, self._position = self._text[self._position:], 0
+
+    def _read(self) -> bool:
+        chunk = next(self._chunks, None)
+
+        if chunk is None:
+            if not self._ended:
+                self._ended = True
+                self._text += self._decoder.decode(b'', final = True)
+            return False
+
+        self._text += self._decoder.decode(chunk)
+        return True
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            text, position = self._text, self._position
+            while position < len(text) and text[position] in ' \t\n\r':
+                position += 1
+            self._position = position
+
+            if position < len(text) or not self._read():
+                return
+
+    def _consume(self, character: str) -> bool:
+        self._skip_whitespace()
+
+        if self._text.startswith(character, self._position):
+            self._position += 1
+            return True
+
+        return False
+
+    def _expect(self, character: str) -> None:
+        if not self._consume(character):
+            raise json.JSONDecodeError(f'Expecting {character!r}', self._text, self._position)
+
+    def _value(self):
+        self._skip_whitespace()
+        # Parsing is only attempted again once the text has doubled, so that a large entry is parsed a few times
+        # rather than once per chunk.
+        attempt = 0
+
+        while True:
+            if len(self._text) - self._position >= attempt or self._ended:
+                try:
+                    value, end = self._json.raw_decode(self._text, self._position)
+
+                    # A number could continue in the next chunk
+                    if end < len(self._text) or self._ended:
+                        self._position = end
+                        return value
+                except json.JSONDecodeError:
+                    if self._ended:
+                        raise
+
+                attempt = 2 * (len(self._text) - self._position)
+
+            self._read()
@@ -0,0 +1,187 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - aiohttp is an optional dependency
+    aiohttp = None
+
+
+class RetryPolicy(object):
+    """
+    RetryPolicy describes which failed calls the ApiCall retries, and how long it waits between attempts.
+
+    Example:
+        sdk = ZDAISDK(from_config = True, retry_policy = RetryPolicy(max_attempts = 8, backoff_max = 120))
+    """
+
+    def __init__(self,
+                 max_attempts: int = 5,
+                 status_codes: Iterable[int] = (500, 502, 503, 504),
+                 rejection_status_codes: Iterable[int] = (429,),
+                 allowed_methods: Iterable[str] = ('GET', 'PUT', 'DELETE'),
+                 retry_connection_errors: bool = True,
+                 backoff_factor: float = 0.5,
+                 backoff_max: float = 60.0,
+                 jitter: bool = True,
+                 respect_retry_after: bool = True,
+                 retry_after_max: float = 300.0):
+        """
+        :param max_attempts: The maximum number of attempts made per call, including the first one.
+        :param status_codes: The status codes retried when the call's method is in allowed_methods.
+        :param rejection_status_codes: The status codes that mean the server rejected the call without
+                                       processing it. These are retried regardless of the call's method.
+        :param allowed_methods: The methods that are safe to retry after the server may have processed them.
+        :param retry_connection_errors: Whether connection errors and timeouts are retried. Failures to connect
+                                        are retried for every method, the others only for allowed_methods.
+        :param backoff_factor: The delay before the first retry. The delay doubles after each attempt.
+        :param backoff_max: The maximum delay between two attempts.
+        :param jitter: Whether the delay is randomized between 0 and the backoff ("full jitter"), which spreads
+                       out the retries of many workers that failed at the same time.
+        :param respect_retry_after: Whether the server's Retry-After header is used as the delay, when provided.
+        :param retry_after_max: The maximum delay accepted from a Retry-After header.
+        """
+        self.max_attempts = max_attempts
+        self.status_codes = frozenset(status_codes)
+        self.rejection_status_codes = frozenset(rejection_status_codes)
+        self.allowed_methods = frozenset(m.upper() for m in allowed_methods)
+        self.retry_connection_errors = retry_connection_errors
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.retry_after_max = retry_after_max
+
+    def __repr__(self) -> str:
+        data = ', '.join("{}={!r}".format(k, v) for k, v in vars(self).items())
+        return f'{self.__class__.__name__}({data})'
+
+    def is_retryable_response(self, method: str, attempt: int, response) -> bool:
+        """
+        Returns whether a call that received the response should be attempted again.
+
+        :param method: The HTTP method of the call
+        :param attempt: The number of attempts made so far
+        :param response: The response of the latest attempt
+        :return:
+        """
+        if attempt >= self.max_attempts:
+            return False
+
+        if response.status_code in self.rejection_status_codes:
+            return True
+
+        return response.status_code in self.status_codes and method.upper() in self.allowed_methods
+
+    def is_retryable_exception(self, method: str, attempt: int, exception: Exception) -> bool:
+        """
+        Returns whether a call that raised the exception should be attempted again.
+
+        :param method: The HTTP method of the call
+        :param attempt: The number of attempts made so far
+        :param exception: The exception raised by the latest attempt
+        :return:
+        """
+        if attempt >= self.max_attempts or not self.retry_connection_errors:
+            return False
+
+        if _is_connect_error(exception):
+            return True
+
+        return isinstance(exception, _connection_errors()) and method.upper() in self.allowed_methods
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Returns the exponential backoff to wait after the given number of attempts.
+
+        :param attempt: The number of attempts made so far
+        :return:
+        """
+        backoff = min(self.backoff_max, self.backoff_factor * (2 ** (attempt - 1)))
+
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def get_retry_after(self, response) -> Optional[float]:
+        """
+        Returns the number of seconds requested by the response's Retry-After header, if any.
+        The header may either be a number of seconds or an HTTP date.
+
+        :param response: The response of the latest attempt
+        :return:
+        """
+        value = response.headers.get('Retry-After') if response is not None else None
+        if not value:
+            return None
+
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+
+        return min(max(seconds, 0.0), self.retry_after_max)
+
+    def get_delay(self, attempt: int, response=None) -> float:
+        """
+        Returns the number of seconds to wait before the next attempt.
+
+        :param attempt: The number of attempts made so far
+        :param response: The response of the latest attempt, if one was received
+        :return:
+        """
+        if self.respect_retry_after:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None:
+                return retry_after
+
+        return self.get_backoff(attempt)
+
+
+def _is_connect_error(exception: Exception) -> bool:
+    """
+    Returns whether the exception was raised because a connection could not be established,
+    meaning the server never received the call
+    """
+    if isinstance(exception, requests.exceptions.ConnectTimeout):
+        return True
+
+    if isinstance(exception, requests.exceptions.ConnectionError) and exception.args:
+        reason = exception.args[0]
+        if isinstance(reason, MaxRetryError):
+            return isinstance(reason.reason, NewConnectionError)
+
+    return aiohttp is not None and isinstance(exception, aiohttp.ClientConnectorError)
+
+
+def _connection_errors() -> tuple:
+    """
+    The exceptions raised when a connection failed or timed out
+    """
+    errors = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    if aiohttp is not None:
+        errors += (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+    return errors
@@ -0,0 +1,46 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(pool_connections: int = 10,
+                   pool_maxsize: int = 10,
+                   pool_block: bool = False,
+                   keep_alive: bool = True) -> requests.Session:
+    """
+    Creates a connection-pooled requests.Session that can be shared by every API class.
+
+    :param pool_connections: The number of per-host connection pools to cache.
+    :param pool_maxsize: The maximum number of connections kept alive per host.
+    :param pool_block: Whether to block when all of a host's connections are in use,
+                       instead of opening (and then discarding) an extra connection.
+    :param keep_alive: Whether connections are kept alive between calls. If False,
+                       every call asks the server to close its connection.
+    :return:
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections = pool_connections,
+                          pool_maxsize = pool_maxsize,
+                          pool_block = pool_block)
+
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+
+    return session
@@ -0,0 +1,139 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import time
+from typing import Dict, Iterable, List
+
+from .store import SQLiteStore
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS extractions (
+    sha256 TEXT NOT NULL,
+    field_id TEXT NOT NULL,
+    version TEXT NOT NULL,
+    content TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (sha256, field_id)
+);
+CREATE INDEX IF NOT EXISTS extractions_accessed ON extractions (accessed);
+'''
+
+
+class ExtractionCache(object):
+    """
+    ExtractionCache keeps the extraction results of documents, keyed by the SHA-256 of the document's content and
+    the field id. Each field's entry of the extraction/{request_id}/results/text json is stored as it is, so that
+    both FieldExtractionResults and FieldExtractionAnswers can be obtained from it.
+
+    An entry can be tied to a version of its field (e.g. derived from the field's metadata): it is only returned
+    when the same version is asked for. When the cache grows past max_size, the least recently used entries are
+    evicted.
+
+    See CachedExtractor.
+    """
+
+    def __init__(self, path: str, max_size: int = 256 * 1024 * 1024):
+        """
+        :param path: The SQLite database file (':memory:' for a cache that only lasts as long as the process)
+        :param max_size: The maximum total size (in bytes of json) of the entries
+        """
+        self.max_size = max_size
+        self._store = SQLiteStore(path, _SCHEMA)
+
+    def get(self, sha256: str, field_ids: Iterable[str], versions: Dict[str, str] = None) -> Dict[str, dict]:
+        """
+        Returns the cached entries of the document, for those of the field ids that are cached (at their version,
+        if versions are provided)
+        """
+        field_ids = list(field_ids)
+        versions = versions or {}
+        placeholders = ', '.join('?' * len(field_ids))
+
+        rows = self._store.execute(f'SELECT field_id, version, content FROM extractions '
+                                   f'WHERE sha256 = ? AND field_id IN ({placeholders})',
+                                   [sha256, *field_ids])
+
+        entries = {field_id: json.loads(content) for field_id, version, content in rows
+                   if version == versions.get(field_id, '')}
+
+        if entries:
+            now = time.time()
+            self._store.executemany('UPDATE extractions SET accessed = ? WHERE sha256 = ? AND field_id = ?',
+                                    [(now, sha256, field_id) for field_id in entries])
+
+        return entries
+
+    def put(self, sha256: str, entries: List[dict], versions: Dict[str, str] = None) -> None:
+        """
+        Stores the entries of a document (the items of the json's results, which each have a field_id),
+        then evicts the least recently used entries if the cache is too large
+        """
+        versions = versions or {}
+        now = time.time()
+        rows = []
+
+        for entry in entries:
+            content = json.dumps(entry, separators = (',', ':'))
+            rows.append((sha256, entry['field_id'], versions.get(entry['field_id'], ''), content, len(content), now))
+
+        self._store.executemany('INSERT OR REPLACE INTO extractions VALUES (?, ?, ?, ?, ?, ?)', rows)
+        self.evict()
+
+    def size(self) -> int:
+        """
+        Returns the total size of the entries
+        """
+        return self._store.execute('SELECT COALESCE(SUM(size), 0) FROM extractions')[0][0]
+
+    def evict(self) -> int:
+        """
+        Evicts the least recently used entries until the cache is no larger than max_size, and returns
+        how many were evicted
+        """
+        excess = self.size() - self.max_size
+        if excess <= 0:
+            return 0
+
+        evicted = 0
+
+        with self._store.transaction() as connection:
+            rows = connection.execute('SELECT sha256, field_id, size FROM extractions ORDER BY accessed')
+
+            for sha256, field_id, size in rows.fetchall():
+                if excess <= 0:
+                    break
+
+                connection.execute('DELETE FROM extractions WHERE sha256 = ? AND field_id = ?', (sha256, field_id))
+                excess -= size
+                evicted += 1
+
+        return evicted
+
+    def discard(self, sha256: str, field_ids: Iterable[str] = None) -> None:
+        """
+        Forgets the entries of a document (only those of the field ids, if provided)
+        """
+        if field_ids is None:
+            self._store.execute('DELETE FROM extractions WHERE sha256 = ?', (sha256,))
+        else:
+            self._store.executemany('DELETE FROM extractions WHERE sha256 = ? AND field_id = ?',
+                                    [(sha256, field_id) for field_id in field_ids])
+
+    def clear(self) -> None:
+        self._store.execute('DELETE FROM extractions')
+
+    def close(self) -> None:
+        self._store.close()
@@ -0,0 +1,88 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import io
+import os
+from typing import Iterable, Iterator, Optional
+
+# The size of the blocks in which files are read to be hashed
+_BLOCK_SIZE = 1024 * 1024
+
+
+def sha256_content(content) -> Optional[str]:
+    """
+    Returns the SHA-256 hex digest of the content of a file, as accepted by FileAPI.create: its bytes, a path, or a
+    seekable binary file object (which is read from its current position, then rewound to it).
+
+    Returns None for content that can only be read once (e.g. iterables of bytes chunks, pipes): see HashingIterator.
+    """
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(content).hexdigest()
+
+    if isinstance(content, os.PathLike):
+        with open(content, 'rb') as f:
+            return _sha256_file(f)
+
+    if hasattr(content, 'read'):
+        try:
+            if not content.seekable():
+                return None
+            position = content.tell()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return None
+
+        try:
+            return _sha256_file(content)
+        finally:
+            content.seek(position)
+
+    return None
+
+
+def _sha256_file(f) -> str:
+    digest = hashlib.sha256()
+
+    for block in iter(lambda: f.read(_BLOCK_SIZE), b''):
+        digest.update(block)
+
+    return digest.hexdigest()
+
+
+class HashingIterator(object):
+    """
+    Wraps an iterable of bytes chunks, and computes their SHA-256 as they are consumed (e.g. streamed to the API).
+    The hexdigest is available once the chunks have all been consumed.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._digest = hashlib.sha256()
+        self.exhausted = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    def __next__(self) -> bytes:
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self.exhausted = True
+            raise
+
+        self._digest.update(chunk)
+        return chunk
+
+    def hexdigest(self) -> Optional[str]:
+        return self._digest.hexdigest() if self.exhausted else None
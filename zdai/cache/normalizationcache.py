@@ -0,0 +1,115 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from .store import SQLiteStore
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS normalizations (
+    kind TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    content TEXT NOT NULL,
+    PRIMARY KEY (kind, sha256)
+);
+'''
+
+
+class NormalizationCache(object):
+    """
+    NormalizationCache keeps the json returned by the normalization endpoints, keyed by the kind of normalization
+    (date, duration, currency) and the SHA-256 of the text. The most recently used entries are kept in memory,
+    and every entry is also kept on disk if a path is provided.
+
+    Example:
+        sdk = ZDAISDK(from_config = True, normalization_cache = NormalizationCache(path = 'normalizations.sqlite'))
+        dates, _ = sdk.normalization.get_multiple_dates(texts)
+    """
+
+    def __init__(self, max_entries: int = 10000, path: str = None):
+        """
+        :param max_entries: The number of entries kept in memory
+        :param path: The SQLite database file keeping every entry on disk, if provided
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._store = SQLiteStore(path, _SCHEMA) if path else None
+
+    @staticmethod
+    def sha256(text: str) -> str:
+        """
+        Returns the SHA-256 of the text, as returned by the normalization endpoints
+        """
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def get(self, kind: str, sha256: str) -> Optional[dict]:
+        """
+        Returns the cached json of the text with this SHA-256, if any
+        """
+        key = (kind, sha256)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        if self._store is None:
+            return None
+
+        rows = self._store.execute('SELECT content FROM normalizations WHERE kind = ? AND sha256 = ?', key)
+        if not rows:
+            return None
+
+        content = json.loads(rows[0][0])
+        self._remember(key, content)
+
+        return content
+
+    def put(self, kind: str, sha256: str, content: dict) -> None:
+        """
+        Caches the json of the text with this SHA-256
+        """
+        self._remember((kind, sha256), content)
+
+        if self._store is not None:
+            self._store.execute('INSERT OR REPLACE INTO normalizations VALUES (?, ?, ?)',
+                                (kind, sha256, json.dumps(content, separators = (',', ':'))))
+
+    def _remember(self, key: tuple, content: dict) -> None:
+        with self._lock:
+            self._entries[key] = content
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last = False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+        if self._store is not None:
+            self._store.execute('DELETE FROM normalizations')
+
+    def close(self) -> None:
+        if self._store is not None:
+            self._store.close()
@@ -0,0 +1,79 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterable, List
+
+
+class SQLiteStore(object):
+    """
+    SQLiteStore is a thread-safe SQLite database shared by the local caches. A single connection is used by
+    every thread, and the database is in WAL mode so that other processes (e.g. parallel runs) can read it
+    while it is written to.
+    """
+
+    def __init__(self, path: str, schema: str):
+        """
+        :param path: The database file (':memory:' for a cache that only lasts as long as the process)
+        :param schema: The statements creating the cache's tables, if they don't exist
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread = False, isolation_level = None, timeout = 30.0)
+
+        if path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode = WAL')
+            self._connection.execute('PRAGMA synchronous = NORMAL')
+
+        self._connection.executescript(schema)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def execute(self, sql: str, parameters: Iterable = ()) -> List[tuple]:
+        """
+        Runs the statement, and returns the rows it selected
+        """
+        with self._lock:
+            return self._connection.execute(sql, tuple(parameters)).fetchall()
+
+    def executemany(self, sql: str, parameters: Iterable[Iterable]) -> None:
+        """
+        Runs the statement for each of the parameters, in a single transaction
+        """
+        with self.transaction() as connection:
+            connection.executemany(sql, parameters)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Yields the connection within a transaction, which is committed if no exception is raised
+        """
+        with self._lock:
+            self._connection.execute('BEGIN')
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
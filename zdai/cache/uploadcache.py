@@ -0,0 +1,117 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+from datetime import datetime, timedelta
+from typing import Optional
+
+from .store import SQLiteStore
+from ..models.file import File
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS uploads (
+    namespace TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    is_zuva_ocr INTEGER NOT NULL,
+    file_id TEXT NOT NULL,
+    content_type TEXT,
+    expiration TEXT NOT NULL,
+    PRIMARY KEY (namespace, sha256, is_zuva_ocr)
+);
+CREATE INDEX IF NOT EXISTS uploads_file_id ON uploads (file_id);
+'''
+
+_EXPIRATION_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+class UploadCache(object):
+    """
+    UploadCache remembers the files uploaded by FileAPI.create, keyed by the SHA-256 of their content, so that
+    uploading the same content again reuses the existing file (and its OCR, if any) instead of uploading it
+    again, until shortly before the file expires.
+
+    The cache is kept per DocAI url and token, as files are only visible to the account that uploaded them.
+
+    Example:
+        sdk = ZDAISDK(from_config = True, upload_cache = UploadCache('uploads.sqlite'))
+
+        file, caller = sdk.file.create(content = pathlib.Path('contract.pdf'))
+        # caller is None if the file was found in the cache
+    """
+
+    def __init__(self, path: str, margin: timedelta = timedelta(hours = 1)):
+        """
+        :param path: The SQLite database file (':memory:' for a cache that only lasts as long as the process)
+        :param margin: Files expiring within this margin are uploaded again, rather than reused
+        """
+        self.margin = margin
+        self._store = SQLiteStore(path, _SCHEMA)
+
+    @staticmethod
+    def namespace(url: str, token: str) -> str:
+        """
+        Returns the key under which the files of a DocAI url and token are kept, without storing the token itself
+        """
+        return hashlib.sha256(f'{url}\n{token}'.encode('utf-8')).hexdigest()
+
+    def get(self, namespace: str, sha256: str, is_zuva_ocr: bool = False) -> Optional[File]:
+        """
+        Returns the File uploaded with this content, unless it expires within the margin
+        """
+        rows = self._store.execute('SELECT file_id, content_type, expiration FROM uploads '
+                                   'WHERE namespace = ? AND sha256 = ? AND is_zuva_ocr = ?',
+                                   (namespace, sha256, int(is_zuva_ocr)))
+        if not rows:
+            return None
+
+        file_id, content_type, expiration = rows[0]
+        expiration = datetime.strptime(expiration, _EXPIRATION_FORMAT)
+
+        if expiration <= datetime.utcnow() + self.margin:
+            return None
+
+        return File(id = file_id, content_type = content_type, expiration = expiration, sha256 = sha256)
+
+    def put(self, namespace: str, sha256: str, file: File, is_zuva_ocr: bool = False) -> None:
+        """
+        Remembers the File uploaded with this content
+        """
+        self._store.execute('INSERT OR REPLACE INTO uploads VALUES (?, ?, ?, ?, ?, ?)',
+                            (namespace, sha256, int(is_zuva_ocr), file.id, file.content_type,
+                             file.expiration.strftime(_EXPIRATION_FORMAT)))
+
+    def set_expiration(self, file_id: str, expiration: datetime) -> None:
+        """
+        Updates the expiration of a file, e.g. after FileAPI.set_expiration
+        """
+        self._store.execute('UPDATE uploads SET expiration = ? WHERE file_id = ?',
+                            (expiration.strftime(_EXPIRATION_FORMAT), file_id))
+
+    def discard(self, file_id: str) -> None:
+        """
+        Forgets a file, e.g. after FileAPI.delete
+        """
+        self._store.execute('DELETE FROM uploads WHERE file_id = ?', (file_id,))
+
+    def purge(self) -> int:
+        """
+        Forgets the files that expire within the margin, and returns how many there were
+        """
+        limit = (datetime.utcnow() + self.margin).strftime(_EXPIRATION_FORMAT)
+
+        with self._store.transaction() as connection:
+            return connection.execute('DELETE FROM uploads WHERE expiration <= ?', (limit,)).rowcount
+
+    def close(self) -> None:
+        self._store.close()
@@ -21,3 +21,8 @@ from .field_extraction_request import FieldExtractionRequest
 from .field_training_request import FieldTrainingRequest
 from .ocr_request import OCRRequest
 from .mlc_request import MLCRequest
+from .download import Download
+from .ocr_page_images import OCRPageImages
+from .polling import PollingSchedule
+from .pipeline_result import PipelineResult
+from .extraction_result_set import ExtractionResultSet
@@ -14,6 +14,8 @@
 
 
 class BaseNormalization:
+    __slots__ = ('_type', '_api', '_json')
+
     def __init__(self, api, json):
         self._type = type(self)
         self._api = api
@@ -12,10 +12,38 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import inspect
+import time
+from datetime import datetime
+from typing import Union
+
+from .polling import PollingSchedule, get_deadline, get_sleep
+
+
+def _resolve(result, callback):
+    """
+    Applies the callback to the value returned by an API class method. Asynchronous API classes
+    (e.g. AsyncOCRAPI) return awaitables, in which case an awaitable is returned as well so that
+    the request's helpers can be used as `await request.update()`.
+    """
+    if inspect.isawaitable(result):
+        async def resolve():
+            return callback(await result)
+
+        return resolve()
+
+    return callback(result)
+
+
 class BaseRequest:
     """
     The BaseRequest class for the Zuva DocAI requests
     """
+    __slots__ = ('_type', '_api', '_json')
+
+    polling_schedule = PollingSchedule(initial = 0.5, factor = 1.5, maximum = 30.0)
+
     def __init__(self, api, json):
         self._type = type(self)
         self._api = api
@@ -56,6 +84,12 @@ class BaseRequest:
         """
         return self._json
 
+    def set_json(self, json):
+        """
+        Replaces the raw json of the request, e.g. with a status obtained through the API's get_multiple()
+        """
+        self._json = json
+
     def api(self):
         """
         Returns the instance of the API class
@@ -107,5 +141,50 @@ class BaseRequest:
         """
         Updates the request with its latest status
         """
-        latest, call = self.api().get(request_id = self.id)
-        self._json = latest.json()
+        def apply(response):
+            latest, call = response
+            self._json = latest.json()
+
+        return _resolve(self.api().get(request_id = self.id), apply)
+
+    def get_polling_schedule(self) -> PollingSchedule:
+        """
+        Returns the schedule used to poll the request's status. Request types may adapt it to the
+        request (e.g. to the document's size).
+        """
+        return self.polling_schedule
+
+    def wait(self, timeout: float = None, deadline: Union[float, datetime] = None, schedule: PollingSchedule = None):
+        """
+        Polls the request's status until it finishes, starting quickly and backing off geometrically
+        following the request type's polling schedule. Returns the request.
+        If the API class is asynchronous, this returns an awaitable instead.
+
+        :param timeout: The maximum number of seconds to wait
+        :param deadline: The time by which the request must be finished (a time.time() timestamp or a datetime)
+        :param schedule: The PollingSchedule to use instead of the request type's
+        :return:
+        """
+        end = get_deadline(timeout = timeout, deadline = deadline)
+        result = self.update()
+
+        if inspect.isawaitable(result):
+            return self._wait_async(result, schedule, end)
+
+        attempt = 0
+        while not self.is_finished():
+            time.sleep(get_sleep((schedule or self.get_polling_schedule()).delay(attempt), end, f'{self.type} {self.id}'))
+            attempt += 1
+            self.update()
+
+        return self
+
+    async def _wait_async(self, update, schedule: PollingSchedule, end: float):
+        await update
+        attempt = 0
+        while not self.is_finished():
+            await asyncio.sleep(get_sleep((schedule or self.get_polling_schedule()).delay(attempt), end, f'{self.type} {self.id}'))
+            attempt += 1
+            await self.update()
+
+        return self
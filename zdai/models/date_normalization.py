@@ -14,7 +14,9 @@
 
 from .basenormalization import BaseNormalization
 from dataclasses import dataclass
+from .slotted import slotted
 
+@slotted
 @dataclass
 class Date:
     day: int
@@ -23,6 +25,8 @@ class Date:
 
 
 class DateNormalization(BaseNormalization):
+    __slots__ = ()
+
     def __init__(self, api, json):
         super().__init__(api = api, json = json)
 
@@ -19,6 +19,8 @@ class DocumentClassificationRequest(BaseRequest):
     """
     The class used for requests created in the Document Classification service
     """
+    __slots__ = ()
+
     def __init__(self, api, json):
         super().__init__(api = api, json = json)
 
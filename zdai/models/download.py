@@ -0,0 +1,30 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from dataclasses import dataclass
+from typing import BinaryIO, Union
+import os
+from .slotted import slotted
+
+
+@slotted
+@dataclass
+class Download:
+    """
+    Dataclass to store the outcome of a download streamed to a file
+    """
+    destination: Union[str, os.PathLike, BinaryIO]
+    size: int
+    sha256: str
@@ -14,8 +14,10 @@
 
 from .basenormalization import BaseNormalization
 from dataclasses import dataclass
+from .slotted import slotted
 
 
+@slotted
 @dataclass
 class Duration:
     unit: str
@@ -23,6 +25,8 @@ class Duration:
 
 
 class DurationNormalization(BaseNormalization):
+    __slots__ = ()
+
     def __init__(self, api, json):
         super().__init__(api = api, json = json)
 
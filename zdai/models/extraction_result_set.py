@@ -0,0 +1,374 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+from .field_extraction_result import BoundingBox, BoundingBoxesByPage, FieldExtractionResult, \
+    FieldExtractionResultDefinedTerm, FieldExtractionResultSpan, DurationNormalizedValues, \
+    CurrencyNormalizedValues, DateNormalizedValues
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - NumPy is an optional dependency
+    numpy = None
+
+# Stored in the integer columns for the values that are missing (null) in the results
+_MISSING = -1
+
+# The columns of each table, and their array typecode
+_RESULT_COLUMNS = {'file': 'i', 'field': 'i', 'span_offsets': 'q'}
+_SPAN_COLUMNS = {'result': 'i', 'file': 'i', 'field': 'i', 'confidence': 'd', 'text_start': 'q', 'text_end': 'q',
+                 'page_start': 'i', 'page_end': 'i', 'top': 'i', 'left': 'i', 'bottom': 'i', 'right': 'i',
+                 'page_offsets': 'q'}
+_PAGE_COLUMNS = {'page': 'i', 'box_offsets': 'q'}
+_BOX_COLUMNS = {'top': 'i', 'left': 'i', 'bottom': 'i', 'right': 'i'}
+
+
+class ExtractionResultSet(object):
+    """
+    A columnar representation of the extraction results of one or many files: the field ids, text offsets, pages,
+    confidences and bounding boxes of the spans are stored in contiguous typed arrays (NumPy arrays when NumPy is
+    installed, array.array otherwise), rather than as millions of small dataclasses.
+
+    The result set is made of four tables, each referencing the rows of the next one by offsets:
+        - results: a row per FieldExtractionResult (file, field, span_offsets), the texts are in `texts`
+        - spans: a row per span (result, file, field, confidence, text_start, text_end, page_start, page_end,
+          top, left, bottom, right, page_offsets)
+        - pages: a row per BoundingBoxesByPage (page, box_offsets)
+        - boxes: a row per BoundingBox (top, left, bottom, right)
+    such that the spans of result r are the rows span_offsets[r] to span_offsets[r + 1] of the spans.
+
+    Missing values are stored as NaN (confidence) or -1 (the other columns). The defined terms and normalized values,
+    which are rare, are kept as dataclasses.
+
+    Example:
+        result_set = ExtractionResultSet.from_json(sdk.extraction.get_result_content(request_id)[0])
+
+        spans = result_set.where(min_confidence = 0.8, pages = (1, 5), field_ids = ['<field_id>'])
+        print(len(spans), 'spans', result_set.nbytes, 'bytes')
+
+        for result in result_set.to_results(spans):
+            print(result.field_id, result.text, [span.confidence for span in result.spans])
+    """
+
+    def __init__(self):
+        self.file_ids: List[str] = []
+        self.field_ids: List[str] = []
+        self.texts: List[str] = []
+        self.results = {name: array(typecode) for name, typecode in _RESULT_COLUMNS.items()}
+        self.spans = {name: array(typecode) for name, typecode in _SPAN_COLUMNS.items()}
+        self.pages = {name: array(typecode) for name, typecode in _PAGE_COLUMNS.items()}
+        self.boxes = {name: array(typecode) for name, typecode in _BOX_COLUMNS.items()}
+        self.defined_terms: Dict[int, FieldExtractionResultDefinedTerm] = {}
+        self.normalized: Dict[int, Tuple[list, list, list]] = {}
+        self._file_codes: Dict[str, int] = {}
+        self._field_codes: Dict[str, int] = {}
+
+        self.results['span_offsets'].append(0)
+        self.spans['page_offsets'].append(0)
+        self.pages['box_offsets'].append(0)
+
+    @classmethod
+    def from_json(cls, contents: Union[dict, Iterable[dict]]) -> 'ExtractionResultSet':
+        """
+        Creates the result set from the json of the extraction/{request_id}/results/text endpoint
+        (see ExtractionAPI.get_result_content), or of many of them.
+        """
+        result_set = cls()
+
+        for content in [contents] if isinstance(contents, dict) else contents:
+            file = result_set._code(result_set._file_codes, result_set.file_ids, content.get('file_id'))
+
+            for result in content['results']:
+                field = result_set._code(result_set._field_codes, result_set.field_ids, result['field_id'])
+
+                if not result.get('extractions'):
+                    result_set._add_result(file, field, None)
+                    continue
+
+                for extraction in result['extractions']:
+                    row = result_set._add_result(file, field, extraction.get('text'))
+
+                    for span in extraction.get('spans') or ():
+                        result_set._add_span(row, file, field, span.get('score'), span['start'], span['end'],
+                                             span['pages']['start'], span['pages']['end'], span['bounds'],
+                                             [(page['page'], page['bounds']) for page in span.get('bboxes') or ()],
+                                             lambda box: (box['top'], box['left'], box['bottom'], box['right']))
+                    result_set._end_result()
+
+                    defined_term = extraction.get('defined_term')
+                    if defined_term is not None:
+                        result_set.defined_terms[row] = FieldExtractionResultDefinedTerm(
+                            term = defined_term.get('term'),
+                            spans = [FieldExtractionResultSpan(
+                                text_start = s['start'], text_end = s['end'], page_start = s['pages']['start'],
+                                page_end = s['pages']['end'], top = s['bounds']['top'],
+                                left = s['bounds']['left'], bottom = s['bounds']['bottom'],
+                                right = s['bounds']['right'],
+                                bboxes = [BoundingBoxesByPage.from_json(page) for page in s.get('bboxes') or ()])
+                                for s in defined_term.get('spans') or ()])
+
+                    if extraction.get('durations') or extraction.get('dates') or extraction.get('currencies'):
+                        result_set.normalized[row] = (
+                            [DurationNormalizedValues(unit = d.get('unit'), value = d.get('value'))
+                             for d in extraction.get('durations') or ()],
+                            [DateNormalizedValues(day = d.get('day'), month = d.get('month'), year = d.get('year'))
+                             for d in extraction.get('dates') or ()],
+                            [CurrencyNormalizedValues(value = c.get('value'), symbol = c.get('symbol'),
+                                                      precision = c.get('precision'))
+                             for c in extraction.get('currencies') or ()])
+
+        return result_set._freeze()
+
+    @classmethod
+    def from_results(cls, results: Iterable[FieldExtractionResult], file_id: str = None) -> 'ExtractionResultSet':
+        """
+        Creates the result set from FieldExtractionResults (e.g. returned by ExtractionAPI.get_result)
+        """
+        result_set = cls()
+        file = result_set._code(result_set._file_codes, result_set.file_ids, file_id)
+
+        for result in results:
+            field = result_set._code(result_set._field_codes, result_set.field_ids, result.field_id)
+            row = result_set._add_result(file, field, result.text)
+
+            for span in result.spans:
+                result_set._add_span(row, file, field, span.confidence, span.text_start, span.text_end,
+                                     span.page_start, span.page_end, span,
+                                     [(page.page, page.bounds) for page in span.bboxes],
+                                     lambda box: (box.top, box.left, box.bottom, box.right))
+            result_set._end_result()
+
+            if result.defined_term is not None:
+                result_set.defined_terms[row] = result.defined_term
+
+            if result.is_normalized():
+                result_set.normalized[row] = (result.durations_normalized, result.dates_normalized,
+                                              result.currencies_normalized)
+
+        return result_set._freeze()
+
+    @staticmethod
+    def _code(codes: Dict[str, int], values: List[str], value: str) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def _add_result(self, file: int, field: int, text: str) -> int:
+        self.results['file'].append(file)
+        self.results['field'].append(field)
+        self.texts.append(text)
+        self.results['span_offsets'].append(len(self.spans['result']))
+
+        return len(self.texts) - 1
+
+    def _end_result(self) -> None:
+        self.results['span_offsets'][-1] = len(self.spans['result'])
+
+    def _add_span(self, row: int, file: int, field: int, confidence: float, text_start: int, text_end: int,
+                  page_start: int, page_end: int, bounds, pages: Sequence[tuple], box_values) -> None:
+        spans = self.spans
+        spans['result'].append(row)
+        spans['file'].append(file)
+        spans['field'].append(field)
+        spans['confidence'].append(float('nan') if confidence is None else confidence)
+        spans['text_start'].append(_int(text_start))
+        spans['text_end'].append(_int(text_end))
+        spans['page_start'].append(_int(page_start))
+        spans['page_end'].append(_int(page_end))
+
+        if isinstance(bounds, dict):
+            bounds = (bounds['top'], bounds['left'], bounds['bottom'], bounds['right'])
+        else:
+            bounds = (bounds.top, bounds.left, bounds.bottom, bounds.right)
+
+        for name, value in zip(('top', 'left', 'bottom', 'right'), bounds):
+            spans[name].append(_int(value))
+
+        boxes = self.boxes
+        for page, page_boxes in pages:
+            self.pages['page'].append(_int(page))
+
+            for box in page_boxes:
+                top, left, bottom, right = box_values(box)
+                boxes['top'].append(_int(top))
+                boxes['left'].append(_int(left))
+                boxes['bottom'].append(_int(bottom))
+                boxes['right'].append(_int(right))
+
+            self.pages['box_offsets'].append(len(boxes['top']))
+
+        spans['page_offsets'].append(len(self.pages['page']))
+
+    def _freeze(self) -> 'ExtractionResultSet':
+        # The arrays are no longer extended, so NumPy can use their memory as is.
+        if numpy is not None:
+            for table in (self.results, self.spans, self.pages, self.boxes):
+                for name, column in table.items():
+                    table[name] = numpy.frombuffer(column, dtype = column.typecode) if len(column) else \
+                        numpy.zeros(0, dtype = column.typecode)
+
+        return self
+
+    @property
+    def num_results(self) -> int:
+        return len(self.texts)
+
+    @property
+    def num_spans(self) -> int:
+        return len(self.spans['result'])
+
+    @property
+    def num_boxes(self) -> int:
+        return len(self.boxes['top'])
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns the number of bytes of the arrays (the texts and the dataclasses kept aside excluded)
+        """
+        return sum(_nbytes(column) for table in (self.results, self.spans, self.pages, self.boxes)
+                   for column in table.values())
+
+    def where(self, min_confidence: float = None, pages: Tuple[int, int] = None, field_ids: Iterable[str] = None,
+              file_ids: Iterable[str] = None):
+        """
+        Returns the indexes of the spans that match all of the filters provided (as a NumPy array, if installed)
+
+        :param min_confidence: The minimum confidence of the spans. Spans without a confidence don't match.
+        :param pages: The first and last pages (inclusive): spans that overlap these pages match
+        :param field_ids: The field ids of the spans
+        :param file_ids: The file ids of the spans
+        """
+        spans = self.spans
+        fields = None if field_ids is None else \
+            [self._field_codes[f] for f in set(field_ids) if f in self._field_codes]
+        files = None if file_ids is None else \
+            [self._file_codes[f] for f in set(file_ids) if f in self._file_codes]
+
+        if numpy is not None:
+            mask = numpy.ones(self.num_spans, dtype = bool)
+
+            if min_confidence is not None:
+                mask &= spans['confidence'] >= min_confidence
+            if pages is not None:
+                mask &= (spans['page_start'] <= pages[1]) & (spans['page_end'] >= pages[0])
+            if fields is not None:
+                mask &= numpy.isin(spans['field'], fields)
+            if files is not None:
+                mask &= numpy.isin(spans['file'], files)
+
+            return numpy.flatnonzero(mask)
+
+        indexes = range(self.num_spans)
+
+        if min_confidence is not None:
+            confidences = spans['confidence']
+            indexes = [i for i in indexes if confidences[i] >= min_confidence]
+        if pages is not None:
+            page_starts, page_ends = spans['page_start'], spans['page_end']
+            indexes = [i for i in indexes if page_starts[i] <= pages[1] and page_ends[i] >= pages[0]]
+        if fields is not None:
+            fields, span_fields = set(fields), spans['field']
+            indexes = [i for i in indexes if span_fields[i] in fields]
+        if files is not None:
+            files, span_files = set(files), spans['file']
+            indexes = [i for i in indexes if span_files[i] in files]
+
+        return array('q', indexes)
+
+    def to_spans(self, indexes: Iterable[int] = None) -> List[FieldExtractionResultSpan]:
+        """
+        Creates the FieldExtractionResultSpans of the spans at the indexes (e.g. returned by where()), or of all of them
+        """
+        return [self._span(i) for i in (range(self.num_spans) if indexes is None else _tolist(indexes))]
+
+    def to_results(self, spans: Iterable[int] = None) -> List[FieldExtractionResult]:
+        """
+        Creates the FieldExtractionResults. If the indexes of spans are provided (e.g. returned by where()), only the
+        results with at least one of these spans are created, with only these spans.
+        """
+        span_offsets = _tolist(self.results['span_offsets'])
+        fields = _tolist(self.results['field'])
+
+        if spans is None:
+            rows = {row: range(span_offsets[row], span_offsets[row + 1]) for row in range(self.num_results)}
+        else:
+            rows = {}
+            span_results = self.spans['result']
+            for i in _tolist(spans):
+                rows.setdefault(int(span_results[i]), []).append(i)
+
+        results = []
+        for row, indexes in rows.items():
+            durations, dates, currencies = self.normalized.get(row, ([], [], []))
+            results.append(FieldExtractionResult(field_id = self.field_ids[fields[row]], text = self.texts[row],
+                                                 spans = [self._span(i) for i in indexes],
+                                                 defined_term = self.defined_terms.get(row),
+                                                 durations_normalized = list(durations),
+                                                 dates_normalized = list(dates),
+                                                 currencies_normalized = list(currencies)))
+
+        return results
+
+    def _span(self, i: int) -> FieldExtractionResultSpan:
+        spans, pages, boxes = self.spans, self.pages, self.boxes
+        confidence = float(spans['confidence'][i])
+        top, left, bottom, right = boxes['top'], boxes['left'], boxes['bottom'], boxes['right']
+
+        bboxes = []
+        for p in range(int(spans['page_offsets'][i]), int(spans['page_offsets'][i + 1])):
+            page = BoundingBoxesByPage.__new__(BoundingBoxesByPage)
+            page.page = _value(pages['page'][p])
+            page.bounds = []
+
+            for b in range(int(pages['box_offsets'][p]), int(pages['box_offsets'][p + 1])):
+                box = BoundingBox.__new__(BoundingBox)
+                box.top, box.left, box.bottom, box.right = \
+                    _value(top[b]), _value(left[b]), _value(bottom[b]), _value(right[b])
+                page.bounds.append(box)
+
+            bboxes.append(page)
+
+        return FieldExtractionResultSpan(
+            confidence = None if confidence != confidence else confidence,
+            text_start = _value(spans['text_start'][i]),
+            text_end = _value(spans['text_end'][i]),
+            page_start = _value(spans['page_start'][i]),
+            page_end = _value(spans['page_end'][i]),
+            top = _value(spans['top'][i]),
+            left = _value(spans['left'][i]),
+            bottom = _value(spans['bottom'][i]),
+            right = _value(spans['right'][i]),
+            bboxes = bboxes)
+
+
+def _int(value) -> int:
+    return _MISSING if value is None else value
+
+
+def _value(value) -> int:
+    value = int(value)
+    return None if value == _MISSING else value
+
+
+def _tolist(values) -> list:
+    return values.tolist() if hasattr(values, 'tolist') else list(values)
+
+
+def _nbytes(column) -> int:
+    return column.nbytes if hasattr(column, 'nbytes') else column.itemsize * len(column)
@@ -13,8 +13,10 @@
 # limitations under the License.
 
 from dataclasses import dataclass
+from .slotted import slotted
 
 
+@slotted
 @dataclass
 class Field:
     """
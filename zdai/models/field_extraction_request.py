@@ -12,23 +12,65 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .baserequest import BaseRequest
+import inspect
+
+from .baserequest import BaseRequest, _resolve
+from .extraction_result_set import ExtractionResultSet
+from ..api.resultdecoder import decode_answers, decode_result, decode_results
 
 
 class FieldExtractionRequest(BaseRequest):
     """
     The class used for requests created in the Field Extraction service
     """
+    __slots__ = ('_result_content',)
 
     def __init__(self, api, json):
         super().__init__(api=api, json=json)
+        self._result_content = None
 
-    def get_results(self):
-        data, _ = self.api().get_result(request_id=self.id)
+    def get_result_content(self):
+        """
+        Returns the json of the request's results and answers. It is obtained from the API once, then cached,
+        so that the results and the answers come from the same download.
+        """
+        if self._result_content is None:
+            return _resolve(self.api().get_result_content(request_id=self.id), self._set_result_content)
+
+        if inspect.iscoroutinefunction(self.api().get_result_content):
+            async def cached():
+                return self._result_content
+
+            return cached()
+
+        return self._result_content
 
-        return data
+    def _set_result_content(self, response):
+        self._result_content = response[0]
+        return self._result_content
+
+    def get_results(self):
+        return _resolve(self.get_result_content(), decode_results)
 
     def get_answers(self):
-        data, _ = self.api().get_answer(request_id=self.id)
+        return _resolve(self.get_result_content(), decode_answers)
+
+    def iter_results(self):
+        """
+        Yields the request's results while they are downloaded (see ExtractionAPI.iter_results), or from the
+        results already obtained. Not available for the asynchronous API classes.
+        """
+        if self._result_content is not None:
+            for result in self._result_content['results']:
+                yield from decode_result(result)
+        else:
+            yield from self.api().iter_results(request_id=self.id)
+
+    def get_results_and_answers(self):
+        return _resolve(self.get_result_content(), lambda content: (decode_results(content), decode_answers(content)))
 
-        return data
+    def get_result_set(self) -> ExtractionResultSet:
+        """
+        Returns the request's results as a columnar ExtractionResultSet
+        """
+        return _resolve(self.get_result_content(), ExtractionResultSet.from_json)
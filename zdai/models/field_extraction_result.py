@@ -14,8 +14,10 @@
 
 from dataclasses import dataclass, field
 from typing import List
+from .slotted import slotted
 
 
+@slotted
 @dataclass
 class BoundingBox:
     """
@@ -32,7 +34,20 @@ class BoundingBox:
         self.bottom = bounds.bottom
         self.right = bounds.right
 
+    @classmethod
+    def from_json(cls, bounds: dict) -> 'BoundingBox':
+        """
+        Creates the BoundingBox from the json of the API, without an intermediate object
+        """
+        box = cls.__new__(cls)
+        box.top = bounds['top']
+        box.left = bounds['left']
+        box.bottom = bounds['bottom']
+        box.right = bounds['right']
+        return box
 
+
+@slotted
 @dataclass
 class BoundingBoxesByPage:
     """
@@ -45,7 +60,18 @@ class BoundingBoxesByPage:
         self.page = page_bounds.page
         self.bounds = [BoundingBox(line) for line in page_bounds.bounds]
 
+    @classmethod
+    def from_json(cls, page_bounds: dict) -> 'BoundingBoxesByPage':
+        """
+        Creates the BoundingBoxesByPage from the json of the API, without an intermediate object
+        """
+        page = cls.__new__(cls)
+        page.page = page_bounds['page']
+        page.bounds = [BoundingBox.from_json(line) for line in page_bounds['bounds']]
+        return page
+
 
+@slotted
 @dataclass
 class FieldExtractionResultSpan:
     """
@@ -63,6 +89,7 @@ class FieldExtractionResultSpan:
     bboxes: List[BoundingBoxesByPage] = field(default_factory=lambda: [])
 
 
+@slotted
 @dataclass
 class FieldExtractionResultDefinedTerm:
     """
@@ -72,6 +99,7 @@ class FieldExtractionResultDefinedTerm:
     spans: List[FieldExtractionResultSpan] = field(default_factory=lambda: [])
 
 
+@slotted
 @dataclass
 class CurrencyNormalizedValues:
     """
@@ -82,6 +110,7 @@ class CurrencyNormalizedValues:
     precision: int = None
 
 
+@slotted
 @dataclass
 class DateNormalizedValues:
     """
@@ -91,6 +120,7 @@ class DateNormalizedValues:
     month: int = None
     year: int = None
 
+@slotted
 @dataclass
 class DurationNormalizedValues:
     """
@@ -99,6 +129,7 @@ class DurationNormalizedValues:
     unit: str = None
     value: int = None
 
+@slotted
 @dataclass
 class FieldExtractionResult:
     """
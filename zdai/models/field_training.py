@@ -14,32 +14,38 @@
 
 from dataclasses import dataclass
 from typing import List
+from .slotted import slotted
 
 
+@slotted
 @dataclass
 class DocumentType:
     classifications: List[str]
     percentage: float
 
 
+@slotted
 @dataclass
 class Language:
     language: str
     percentage: float
 
 
+@slotted
 @dataclass
 class Country:
     code: str
     name: str
 
 
+@slotted
 @dataclass
 class Jurisdiction:
     country: Country
     regions: List[str]
 
 
+@slotted
 @dataclass
 class FieldMetadata:
     field_id: str
@@ -55,12 +61,14 @@ class FieldMetadata:
     normalization_type: str
 
 
+@slotted
 @dataclass
 class FieldValidationLocation:
     character_start: int
     character_end: int
 
 
+@slotted
 @dataclass
 class FieldValidationDetails:
     file_id: str
@@ -68,6 +76,7 @@ class FieldValidationDetails:
     location: FieldValidationLocation
 
 
+@slotted
 @dataclass
 class FieldAccuracy:
     precision: float
@@ -12,13 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .baserequest import BaseRequest
+from .baserequest import BaseRequest, _resolve
+from .polling import PollingSchedule
 
 
 class FieldTrainingRequest(BaseRequest):
     """
     The class used for requests created in the Field Extraction service
     """
+    __slots__ = ()
+
+    polling_schedule = PollingSchedule(initial = 2.0, factor = 1.5, maximum = 60.0)
+
     def __init__(self, api, json):
         super().__init__(api = api, json = json)
 
@@ -32,6 +37,9 @@ class FieldTrainingRequest(BaseRequest):
         The FieldAPI uses a different function to obtain the latest status, since
         .get() is used to obtain all of the fields in the DocAI region.
         """
-        latest, call = self.api().get_training_status(request_id = self.id, field_id = self.field_id)
-        self._json = latest.json()
-        return self._json
+        def apply(response):
+            latest, call = response
+            self._json = latest.json()
+            return self._json
+
+        return _resolve(self.api().get_training_status(request_id = self.id, field_id = self.field_id), apply)
@@ -14,18 +14,22 @@
 
 from datetime import datetime
 from dataclasses import dataclass
+from .slotted import slotted
 
+@slotted
 @dataclass
 class FileExpiration:
     id: str
     expiration: datetime
 
+@slotted
 @dataclass
 class File:
     id: str
     content_type: str
     expiration: datetime
     name: str = None
+    sha256: str = None
 
     def is_pdf(self):
         return 'application/pdf' in self.content_type
@@ -16,6 +16,8 @@ from .baserequest import BaseRequest
 
 
 class LanguageClassificationRequest(BaseRequest):
+    __slots__ = ()
+
     def __init__(self, api, json):
         super().__init__(api = api, json = json)
 
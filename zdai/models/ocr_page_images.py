@@ -0,0 +1,214 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import inspect
+import io
+import os
+import re
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from typing import BinaryIO, Dict, Iterator, List, Union
+
+from .baserequest import _resolve
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow is an optional dependency
+    Image = None
+
+
+class _Spool(tempfile.SpooledTemporaryFile):
+    """
+    SpooledTemporaryFile that zipfile can read: seekable() is only provided from Python 3.11
+    """
+
+    def seekable(self) -> bool:
+        return self._file.seekable()
+
+
+class OCRPageImages(object):
+    """
+    Random-access reader over the .zip package of an OCR request's page images.
+
+    Only the zip's directory is read when it is opened: each page is read from the package when it is
+    first accessed, and the most recently used pages are cached up to `cache_size` bytes.
+
+    Pages are numbered using the number in each image's file name, and fall back to their position
+    in the package (starting at 1) if the file names aren't numbered.
+
+    Example:
+        with ocr_request.get_images() as images:
+            for page in images.pages():
+                png = images[page]
+    """
+
+    def __init__(self, source: Union[str, os.PathLike, BinaryIO], cache_size: int = 64 * 1024 * 1024):
+        """
+        :param source: The path to the .zip package, or a seekable binary file object containing it
+        :param cache_size: The maximum number of bytes of page images kept in memory
+        """
+        self._source = source
+        self._zip = zipfile.ZipFile(source)
+        self._members = self._index(self._zip)
+        self._lock = threading.Lock()
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cached_bytes = 0
+
+    @classmethod
+    def from_request(cls, api, request_id: str, path: Union[str, os.PathLike] = None,
+                     spool_size: int = 16 * 1024 * 1024, cache_size: int = 64 * 1024 * 1024) -> 'OCRPageImages':
+        """
+        Downloads the images of an OCR request and opens them.
+
+        :param api: The OCRAPI instance. With an AsyncOCRAPI, an awaitable is returned.
+        :param request_id: The OCR request id
+        :param path: The path to download the package to. If not provided, the package is kept in memory
+                     up to spool_size bytes, and in a temporary file beyond that.
+        :param spool_size: The size above which a package downloaded without a path is spooled to disk
+        :param cache_size: The maximum number of bytes of page images kept in memory
+        :return:
+        """
+        if path is not None:
+            return _resolve(api.download_images(request_id = request_id, destination = path),
+                            lambda _: cls(path, cache_size = cache_size))
+
+        spool = _Spool(max_size = spool_size)
+
+        def open_spool(_):
+            spool.seek(0)
+            return cls(spool, cache_size = cache_size)
+
+        try:
+            downloaded = api.download_images(request_id = request_id, destination = spool)
+        except BaseException:
+            spool.close()
+            raise
+
+        if inspect.isawaitable(downloaded):
+            async def resolve():
+                try:
+                    return open_spool(await downloaded)
+                except BaseException:
+                    spool.close()
+                    raise
+
+            return resolve()
+
+        try:
+            return open_spool(downloaded)
+        except BaseException:
+            spool.close()
+            raise
+
+    @staticmethod
+    def _index(package: zipfile.ZipFile) -> Dict[int, zipfile.ZipInfo]:
+        members = sorted((m for m in package.infolist() if not m.is_dir()), key = lambda m: m.filename)
+        numbers = []
+
+        for member in members:
+            found = re.findall(r'\d+', os.path.splitext(os.path.basename(member.filename))[0])
+            numbers.append(int(found[-1]) if found else None)
+
+        if None in numbers or len(set(numbers)) != len(numbers):
+            numbers = range(1, len(members) + 1)
+
+        return dict(sorted(zip(numbers, members)))
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, page: int) -> bool:
+        return page in self._members
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._members)
+
+    def __getitem__(self, page: int) -> bytes:
+        return self.get(page)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def pages(self) -> List[int]:
+        """
+        Returns the page numbers in the package, in order
+        """
+        return list(self._members)
+
+    def name(self, page: int) -> str:
+        """
+        Returns the file name of the page's image in the package
+        """
+        return self._member(page).filename
+
+    def get(self, page: int) -> bytes:
+        """
+        Returns the encoded bytes of the page's image (e.g. PNG), reading them from the package if they aren't cached
+        """
+        member = self._member(page)
+
+        with self._lock:
+            data = self._cache.get(page)
+            if data is not None:
+                self._cache.move_to_end(page)
+                return data
+
+            data = self._zip.read(member)
+            self._cache_page(page, data)
+
+        return data
+
+    def image(self, page: int):
+        """
+        Returns the page's image decoded as a PIL.Image. Requires Pillow (pip3 install pillow).
+        """
+        if Image is None:
+            raise ImportError('Decoding the page images requires Pillow. Install it using: pip3 install pillow')
+
+        return Image.open(io.BytesIO(self.get(page)))
+
+    def close(self) -> None:
+        """
+        Closes the package, and the temporary file it was downloaded to, if any
+        """
+        self._zip.close()
+        self._cache.clear()
+        self._cached_bytes = 0
+
+        if isinstance(self._source, tempfile.SpooledTemporaryFile):
+            self._source.close()
+
+    def _member(self, page: int) -> zipfile.ZipInfo:
+        try:
+            return self._members[page]
+        except KeyError:
+            raise KeyError(f'Page {page} is not in the package. Pages: {self.pages()}') from None
+
+    def _cache_page(self, page: int, data: bytes) -> None:
+        if len(data) > self.cache_size:
+            return
+
+        self._cache[page] = data
+        self._cached_bytes += len(data)
+
+        while self._cached_bytes > self.cache_size:
+            _, evicted = self._cache.popitem(last = False)
+            self._cached_bytes -= len(evicted)
@@ -12,13 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .baserequest import BaseRequest
+from .baserequest import BaseRequest, _resolve
+from .ocr_page_images import OCRPageImages
+from .polling import PollingSchedule
 
 
 class OCRRequest(BaseRequest):
+    __slots__ = ()
+
+    polling_schedule = PollingSchedule(initial = 1.0, factor = 1.5, maximum = 30.0)
+
     def __init__(self, api, json):
         super().__init__(api = api, json = json)
 
+    def get_polling_schedule(self) -> PollingSchedule:
+        """
+        Returns the polling schedule, starting slower for documents with many pages once the page count is known
+        """
+        schedule = self.polling_schedule
+        if not self.page_count:
+            return schedule
+
+        initial = min(schedule.maximum, schedule.initial + 0.05 * self.page_count)
+        return PollingSchedule(initial = initial, factor = schedule.factor, maximum = schedule.maximum)
+
     @property
     def page_count(self):
         return self.json().get('page_count')
@@ -36,12 +53,14 @@ class OCRRequest(BaseRequest):
         return self.json().get('scan_score')
 
     def get_text(self):
-        result, _ = self.api().get_text(request_id = self.id)
-        return result.get('text')
+        return _resolve(self.api().get_text(request_id = self.id), lambda response: response[0].get('text'))
 
-    def get_images(self):
-        data = self.api().get_images(request_id = self.id)
-        return data
+    def get_images(self, path = None, cache_size: int = 64 * 1024 * 1024) -> OCRPageImages:
+        """
+        Downloads the page images and returns a reader that gives access to each page without extracting the package.
+        See OCRPageImages.from_request for the parameters. Awaitable with the asynchronous SDK.
+        """
+        return OCRPageImages.from_request(api = self.api(), request_id = self.id, path = path, cache_size = cache_size)
 
     def get_eocr(self):
         data = self.api().get_eocr(request_id = self.id)
@@ -50,3 +69,15 @@ class OCRRequest(BaseRequest):
     def get_layouts(self):
         data = self.api().get_layouts(request_id = self.id)
         return data
+
+    def download_images(self, destination, sha256: str = None):
+        return _resolve(self.api().download_images(request_id = self.id, destination = destination, sha256 = sha256),
+                        lambda response: response[0])
+
+    def download_eocr(self, destination, sha256: str = None):
+        return _resolve(self.api().download_eocr(request_id = self.id, destination = destination, sha256 = sha256),
+                        lambda response: response[0])
+
+    def download_layouts(self, destination, sha256: str = None):
+        return _resolve(self.api().download_layouts(request_id = self.id, destination = destination, sha256 = sha256),
+                        lambda response: response[0])
@@ -0,0 +1,45 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from .document_classification_request import DocumentClassificationRequest
+from .field_extraction_request import FieldExtractionRequest
+from .file import File
+from .mlc_request import MLCRequest
+from .ocr_request import OCRRequest
+from .slotted import slotted
+
+
+@slotted
+@dataclass
+class PipelineResult:
+    """
+    Dataclass to store the outcome of a document that went through a DocumentPipeline
+    """
+    document: object
+    file: File = None
+    ocr: OCRRequest = None
+    classification: DocumentClassificationRequest = None
+    mlc: MLCRequest = None
+    extraction: FieldExtractionRequest = None
+    results: List = None
+    answers: List = None
+    error: Exception = None
+    failed_stage: str = None
+    timings: Dict[str, float] = field(default_factory = dict)
+
+    def is_successful(self) -> bool:
+        return self.error is None
@@ -0,0 +1,93 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import time
+from datetime import datetime
+from typing import Iterator, Optional, Union
+
+
+class PollingSchedule(object):
+    """
+    PollingSchedule describes how often a request's status is polled: the first poll happens after `initial`
+    seconds, and every following delay is `factor` times longer, up to `maximum` seconds.
+
+    Each request type has its own schedule (e.g. OCRRequest.polling_schedule), which can be replaced:
+        FieldExtractionRequest.polling_schedule = PollingSchedule(initial = 1, factor = 2, maximum = 60)
+    """
+
+    def __init__(self, initial: float = 0.5, factor: float = 1.5, maximum: float = 30.0):
+        """
+        :param initial: The number of seconds before the first poll
+        :param factor: The factor each delay is multiplied by
+        :param maximum: The longest delay between two polls
+        """
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(initial={self.initial!r}, factor={self.factor!r}, maximum={self.maximum!r})'
+
+    def delay(self, attempt: int) -> float:
+        """
+        Returns the number of seconds to wait before the poll following the given number of polls
+        """
+        return min(self.maximum, self.initial * (self.factor ** attempt))
+
+    def delays(self) -> Iterator[float]:
+        """
+        Yields the successive delays between polls
+        """
+        attempt = 0
+        while True:
+            yield self.delay(attempt)
+            attempt += 1
+
+
+def get_deadline(timeout: float = None, deadline: Union[float, datetime] = None) -> Optional[float]:
+    """
+    Returns the time.monotonic() by which waiting must end, given a relative timeout and/or an absolute deadline
+    (a time.time() timestamp or a datetime). The earliest of the two wins.
+    """
+    ends = []
+
+    if timeout is not None:
+        ends.append(time.monotonic() + timeout)
+
+    if deadline is not None:
+        timestamp = deadline.timestamp() if isinstance(deadline, datetime) else deadline
+        ends.append(time.monotonic() + (timestamp - time.time()))
+
+    return min(ends) if ends else None
+
+
+def get_sleep(delay: float, end: Optional[float], pending: str) -> float:
+    """
+    Returns the number of seconds to sleep before the next poll, shortened to the time left before the end.
+    Raises a TimeoutError if no time is left.
+
+    :param delay: The delay given by the polling schedule
+    :param end: The time.monotonic() by which waiting must end, if any
+    :param pending: A description of what is still pending, for the TimeoutError
+    :return:
+    """
+    if end is None:
+        return delay
+
+    remaining = end - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError(f'{pending} did not finish in time')
+
+    return min(delay, remaining)
@@ -0,0 +1,33 @@
+# Copyright 2021 Zuva Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import fields
+
+
+def slotted(cls):
+    """
+    Rebuilds the dataclass cls to store its fields in __slots__ rather than in a per-instance __dict__, as
+    dataclass(slots = True) does on Python 3.10 and later. Apply it above @dataclass.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace['__slots__'] = names
+
+    # The defaults are kept by the generated __init__, and would clash with the slots
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+
+    return type(cls)(cls.__name__, cls.__bases__, namespace)